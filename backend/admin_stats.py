@@ -0,0 +1,217 @@
+"""
+Counters behind the admin dashboard statistics.
+
+Writes record what they change as rows in stat_counter_deltas, inside their own
+transaction (accepting a task adds "tasks:available" -1 and "tasks:ongoing" +1).
+Appending rows takes no lock that other requests wait on, so busy endpoints do
+not queue behind a shared counter row. A background rollup periodically folds
+the deltas into stat_counters; reads add the few deltas not folded yet. Stats
+are therefore exact as of the last commit, and reading them costs the same
+however many tasks, users and reports exist.
+
+Counter names:
+  tasks:<status>, users, reports    current totals
+  <metric>@<YYYY-MM-DD>             daily volumes (tasks_created, tasks_completed,
+                                    users_created, reports_created), by UTC day
+
+`rebuild` recomputes every counter from the tables (migration 8 and
+`python jobs.py rebuild-stats`).
+"""
+import asyncio
+import os
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import delete, func, insert, or_, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal
+from models import StatCounter, StatCounterDelta, Task, TaskReport, User
+from task_states import AVAILABLE, CANCELLED, COMPLETED, ONGOING, PENDING_CONFIRMATION
+
+STATS_ROLLUP_SECONDS = float(os.getenv("STATS_ROLLUP_SECONDS", "30"))
+STATS_ROLLUP_BATCH_SIZE = 1000
+
+TASK_STATUSES = [AVAILABLE, ONGOING, PENDING_CONFIRMATION, COMPLETED, CANCELLED]
+DAILY_METRICS = ["tasks_created", "tasks_completed", "users_created", "reports_created"]
+
+
+def _daily(metric: str, day: Optional[date] = None) -> str:
+    return f"{metric}@{(day or datetime.utcnow().date()).isoformat()}"
+
+
+def record(db, deltas: Dict[str, int]) -> None:
+    """Add counter changes to the caller's transaction (AsyncSession or Session)"""
+    db.add_all([StatCounterDelta(name=name, delta=delta) for name, delta in deltas.items() if delta])
+
+
+def task_created(db, count: int = 1) -> None:
+    record(db, {f"tasks:{AVAILABLE}": count, _daily("tasks_created"): count})
+
+
+def task_status_changed(db, old_status: str, new_status: str, completed_at: Optional[datetime] = None) -> None:
+    """
+    A task moved between statuses. For a task leaving 'completed', completed_at
+    is when it was completed, so that day's volume no longer counts it
+    """
+    if old_status == new_status:
+        return
+    deltas = {f"tasks:{old_status}": -1, f"tasks:{new_status}": 1}
+    if new_status == COMPLETED:
+        deltas[_daily("tasks_completed")] = 1
+    elif old_status == COMPLETED and completed_at is not None:
+        deltas[_daily("tasks_completed", completed_at.date())] = -1
+    record(db, deltas)
+
+
+def task_deleted(db, status: str, report_count: int) -> None:
+    """A task is deleted along with its reports"""
+    record(db, {f"tasks:{status}": -1, "reports": -report_count})
+
+
+def user_created(db) -> None:
+    record(db, {"users": 1, _daily("users_created"): 1})
+
+
+def report_created(db) -> None:
+    record(db, {"reports": 1, _daily("reports_created"): 1})
+
+
+def report_deleted(db) -> None:
+    record(db, {"reports": -1})
+
+
+async def snapshot(db: AsyncSession, days: int) -> Dict:
+    """Current totals and the daily volumes of the last `days` UTC days (today included)"""
+    today = datetime.utcnow().date()
+    window = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+    daily_names = [_daily(metric, day) for day in window for metric in DAILY_METRICS]
+    # Totals are the names without a day; there are only a handful of them. One
+    # statement reads counters and pending deltas, so a concurrent fold is seen
+    # either entirely or not at all.
+    statement = union_all(
+        select(StatCounter.name, StatCounter.value)
+        .where(or_(StatCounter.name.in_(daily_names), StatCounter.name.notlike("%@%"))),
+        select(StatCounterDelta.name, StatCounterDelta.delta)
+        .where(or_(StatCounterDelta.name.in_(daily_names), StatCounterDelta.name.notlike("%@%"))),
+    )
+    values: Dict[str, int] = defaultdict(int)
+    for name, value in (await db.execute(statement)).all():
+        values[name] += value
+
+    tasks_by_status = {status: values[f"tasks:{status}"] for status in TASK_STATUSES}
+    # Statuses set by hand through the task update endpoint
+    for name, value in values.items():
+        if name.startswith("tasks:") and value and name[len("tasks:"):] not in tasks_by_status:
+            tasks_by_status[name[len("tasks:"):]] = value
+    return {
+        "total_tasks": sum(tasks_by_status.values()),
+        "tasks_by_status": tasks_by_status,
+        "total_users": values["users"],
+        "total_reports": values["reports"],
+        "daily": [
+            {"day": day, **{metric: values[_daily(metric, day)] for metric in DAILY_METRICS}}
+            for day in window
+        ],
+    }
+
+
+def rebuild(connection) -> None:
+    """Recompute all counters from the tables (Connection or sync Session; the caller commits)"""
+    counters: Dict[str, int] = {}
+    for status, count in connection.execute(select(Task.status, func.count()).group_by(Task.status)).all():
+        counters[f"tasks:{status}"] = count
+    counters["users"] = connection.execute(select(func.count()).select_from(User)).scalar()
+    counters["reports"] = connection.execute(select(func.count()).select_from(TaskReport)).scalar()
+
+    daily_queries = {
+        "tasks_created": select(func.date(Task.created_at), func.count()).group_by(func.date(Task.created_at)),
+        "tasks_completed": (
+            select(func.date(Task.completed_at), func.count())
+            .where(Task.status == COMPLETED, Task.completed_at.isnot(None))
+            .group_by(func.date(Task.completed_at))
+        ),
+        "users_created": select(func.date(User.created_at), func.count()).group_by(func.date(User.created_at)),
+        "reports_created": (
+            select(func.date(TaskReport.created_at), func.count()).group_by(func.date(TaskReport.created_at))
+        ),
+    }
+    for metric, statement in daily_queries.items():
+        for day, count in connection.execute(statement).all():
+            if day is not None:
+                # DATE() comes back as a date on MySQL/PostgreSQL and as text on SQLite
+                counters[f"{metric}@{day.isoformat() if isinstance(day, date) else day}"] = count
+
+    # Deltas written up to now are included in the recomputed values
+    last_delta_id = connection.execute(select(func.max(StatCounterDelta.id))).scalar()
+    if last_delta_id is not None:
+        connection.execute(delete(StatCounterDelta).where(StatCounterDelta.id <= last_delta_id))
+    connection.execute(delete(StatCounter))
+    if counters:
+        connection.execute(insert(StatCounter), [{"name": name, "value": value} for name, value in counters.items()])
+
+
+class StatsRollup:
+    """Background task folding stat_counter_deltas into stat_counters"""
+
+    def __init__(self, session_factory=AsyncSessionLocal, interval: float = STATS_ROLLUP_SECONDS):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._runner: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                while await self.fold_batch() == STATS_ROLLUP_BATCH_SIZE:
+                    pass
+            except Exception as e:
+                print(f"ERROR: Stats rollup failed: {e}")
+
+    async def fold_batch(self) -> int:
+        """Fold one batch of deltas into the counters; returns the number of deltas folded"""
+        async with self.session_factory() as db:
+            # SKIP LOCKED lets several workers fold concurrently without counting a delta twice
+            rows = (await db.execute(
+                select(StatCounterDelta.id, StatCounterDelta.name, StatCounterDelta.delta)
+                .order_by(StatCounterDelta.id)
+                .limit(STATS_ROLLUP_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )).all()
+            if not rows:
+                return 0
+
+            totals: Dict[str, int] = defaultdict(int)
+            for _, name, delta in rows:
+                totals[name] += delta
+            try:
+                for name, delta in totals.items():
+                    result = await db.execute(
+                        update(StatCounter).where(StatCounter.name == name).values(value=StatCounter.value + delta)
+                    )
+                    if result.rowcount == 0:
+                        await db.execute(insert(StatCounter).values(name=name, value=delta))
+                await db.execute(delete(StatCounterDelta).where(StatCounterDelta.id.in_([row.id for row in rows])))
+                await db.commit()
+            except IntegrityError:
+                # Another worker created the same counter first; the batch is folded on the next pass
+                await db.rollback()
+                return 0
+            return len(rows)
+
+
+stats_rollup = StatsRollup()
@@ -1,21 +1,75 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+from pool_metrics import InstrumentedAsyncPool, instrument_pool
+
 # Default to local MySQL via XAMPP; override with DATABASE_URL if needed
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
     "mysql+pymysql://root:@localhost/taskerrand_db"
 )
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600
-)
+# Async drivers used by the API for each sync URL scheme
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap a sync SQLAlchemy URL's driver for its asyncio counterpart"""
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+# The API serves requests through the async engine; override with ASYNC_DATABASE_URL if needed
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+# Connection pool sizing, per engine and per worker process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+# "pessimistic" pings every connection on checkout (one extra round trip each time);
+# "optimistic" skips the ping and relies on pool_recycle plus invalidating the pool
+# when a query hits a dropped connection (that one request fails)
+DB_DISCONNECT_HANDLING = os.getenv("DB_DISCONNECT_HANDLING", "pessimistic").lower()
+
+
+def pool_options(url: str) -> dict:
+    """create_engine pool arguments for a URL, from the DB_POOL_* settings"""
+    options = {
+        "pool_pre_ping": DB_DISCONNECT_HANDLING != "optimistic",
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    # In-memory SQLite uses a single static connection; there is no pool to size
+    if not (url.startswith("sqlite") and ":memory:" in url):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+# Sync engine: schema creation, migrations and maintenance jobs
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+_async_pool_options = pool_options(ASYNC_DATABASE_URL)
+if "pool_size" in _async_pool_options:
+    _async_pool_options["poolclass"] = InstrumentedAsyncPool
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_pool_options)
+instrument_pool(async_engine.sync_engine)
+
+# expire_on_commit=False: instances stay readable after commit without a lazy reload
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
+Base = declarative_base()
@@ -0,0 +1,51 @@
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List
+
+# Tasks are indexed into the task_search_terms table: one row per distinct
+# (term, task) with an integer weight, i.e. an inverted index kept in the
+# database so every worker sees the same postings. Title hits count more.
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+
+# Words too common to be worth a posting list
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "the", "to", "with",
+})
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _normalize(token: str) -> str:
+    # Case-folded and without accents ("Café" -> "cafe", "Straße" -> "strasse"), so
+    # tokens that MySQL's case- and accent-insensitive collations compare as equal are
+    # also equal here, and a query matches however its words are accented
+    decomposed = unicodedata.normalize("NFKD", token.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized word tokens of a text, without stopwords"""
+    if not text:
+        return []
+    tokens = (_normalize(token)[:MAX_TERM_LENGTH] for token in _TOKEN_RE.findall(text))
+    return [token for token in tokens if token and token not in STOPWORDS]
+
+
+def term_weights(title: str, description: str) -> Dict[str, int]:
+    """Index terms of a task and their weights"""
+    weights = Counter()
+    for token in tokenize(title):
+        weights[token] += TITLE_WEIGHT
+    for token in tokenize(description):
+        weights[token] += DESCRIPTION_WEIGHT
+    return dict(weights)
+
+
+def query_terms(query: str) -> List[str]:
+    """Distinct search terms of a user query, in order, capped at MAX_QUERY_TERMS"""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
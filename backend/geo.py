@@ -0,0 +1,77 @@
+import math
+from typing import List, Tuple
+
+from sqlalchemy import or_
+
+# Tasks and their stops are bucketed into fixed lat/lng grid cells (~11 km tall)
+# stored in an indexed `grid_cell` column, so a radius search only reads the
+# rows in the handful of cells overlapping the search circle.
+GRID_CELL_DEGREES = 0.1
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+# Largest IN list a radius search sends; wider boxes match whole latitude rows
+MAX_SEARCH_CELLS = 1000
+
+_LNG_CELLS = int(round(360 / GRID_CELL_DEGREES))
+
+
+def _lat_index(lat: float) -> int:
+    return math.floor(lat / GRID_CELL_DEGREES)
+
+
+def _lng_index(lng: float) -> int:
+    # Wrap so cells on either side of the antimeridian get consistent keys
+    return math.floor(lng / GRID_CELL_DEGREES) % _LNG_CELLS
+
+
+def _cell_key(lat_index: int, lng_index: int) -> str:
+    return f"{lat_index}:{lng_index}"
+
+
+def grid_cell(lat: float, lng: float) -> str:
+    """Grid cell key for a coordinate"""
+    return _cell_key(_lat_index(lat), _lng_index(lng))
+
+
+def _search_box(lat: float, lng: float, radius_km: float) -> Tuple[List[int], List[int]]:
+    """Latitude and longitude cell indexes of the bounding box of a search circle"""
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    min_lat = max(lat - lat_delta, -90.0)
+    max_lat = min(lat + lat_delta, 90.0)
+
+    # Longitude degrees shrink towards the poles; use the widest latitude in the box
+    widest = max(abs(min_lat), abs(max_lat))
+    cos_lat = math.cos(math.radians(min(widest, 89.9)))
+    lng_delta = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+
+    lng_start = math.floor((lng - lng_delta) / GRID_CELL_DEGREES)
+    lng_end = math.floor((lng + lng_delta) / GRID_CELL_DEGREES)
+    # At most one full turn of cells, however wide the box
+    lng_end = min(lng_end, lng_start + _LNG_CELLS - 1)
+    lng_indexes = sorted({i % _LNG_CELLS for i in range(lng_start, lng_end + 1)})
+    return list(range(_lat_index(min_lat), _lat_index(max_lat) + 1)), lng_indexes
+
+
+def cell_filter(column, lat: float, lng: float, radius_km: float):
+    """
+    Condition on a grid_cell column selecting the cells that overlap a search circle.
+
+    Normally an IN list of the cells in the circle's bounding box. Towards the
+    poles a box spans ever more longitude cells (thousands above ~80 degrees), so
+    past MAX_SEARCH_CELLS it matches whole latitude rows by key prefix instead:
+    one index range scan per row, of which a 100 km search has about 20.
+    """
+    lat_indexes, lng_indexes = _search_box(lat, lng, radius_km)
+    if len(lat_indexes) * len(lng_indexes) <= MAX_SEARCH_CELLS:
+        return column.in_([_cell_key(lat_index, lng_index) for lat_index in lat_indexes for lng_index in lng_indexes])
+    return or_(*(column.like(f"{lat_index}:%") for lat_index in lat_indexes))
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two coordinates in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,120 @@
+"""
+Proof image variants.
+
+After a proof is uploaded, a small thumbnail and a compressed web-sized copy
+are generated in a process pool (decoding and resizing are CPU-bound and would
+otherwise compete with the event loop for the GIL). Variants are re-encoded
+from pixel data only, so EXIF data such as the GPS position and camera details
+is not carried over; the orientation tag is applied to the pixels first.
+
+Variants are stored next to the original (through the storage backend) and
+named after it, e.g.
+    proofs/<sha256>.jpg -> proofs/<sha256>_thumb.webp, proofs/<sha256>_web.webp
+so a deduplicated upload reuses variants that already exist.
+
+Pillow is optional: without it no variants are produced and clients keep
+using the original image.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - variants are skipped without Pillow
+    Image = None
+
+from storage import storage, url_to_key
+from uploads import staging_path
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+# name -> (longest side in pixels, WebP quality)
+VARIANTS = {
+    "thumb": (320, 70),
+    "web": (1280, 80),
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def variants_enabled() -> bool:
+    return Image is not None
+
+
+def variant_url(image_url: str, variant: str) -> str:
+    """URL of a variant of an uploaded image (whether or not it exists yet)"""
+    base, _ = os.path.splitext(image_url)
+    return f"{base}_{variant}.webp"
+
+
+def render_variants(source_path: str, targets: Dict[str, str]) -> None:
+    """Write each variant of source_path to its target path (runs in a worker process)"""
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        for variant, target in targets.items():
+            size, quality = VARIANTS[variant]
+            copy = image.copy()
+            copy.thumbnail((size, size), Image.LANCZOS)
+            # Saving without exif=/icc_profile= drops the metadata of the upload
+            copy.save(target, "WEBP", quality=quality, method=4)
+
+
+def _noop() -> None:
+    pass
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Fork where available: spawned workers would re-run the launching script
+        # (for `python main.py`, the migrations and app setup) in every worker
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context(method))
+    return _pool
+
+
+async def start_pool() -> None:
+    """Create the worker processes at startup, before the server has request threads or open connections"""
+    if variants_enabled():
+        await asyncio.get_running_loop().run_in_executor(_get_pool(), _noop)
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def generate_variants(image_url: str) -> Optional[Dict[str, str]]:
+    """
+    Produce the variants of an uploaded image and return their URLs by name,
+    or None when variants are disabled or the file cannot be decoded.
+    """
+    if not variants_enabled():
+        return None
+
+    urls = {variant: variant_url(image_url, variant) for variant in VARIANTS}
+    missing = [variant for variant, url in urls.items() if not await storage.exists(url_to_key(url))]
+    if not missing:
+        return urls
+
+    targets = {variant: staging_path(".webp") for variant in missing}
+    try:
+        async with storage.local_copy(url_to_key(image_url)) as source_path:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_get_pool(), render_variants, source_path, targets)
+        for variant, path in targets.items():
+            await storage.put(path, url_to_key(urls[variant]))
+    except Exception as e:
+        print(f"ERROR: Could not generate variants for {image_url}: {e}")
+        for path in targets.values():
+            if os.path.exists(path):
+                os.remove(path)
+        return None
+    return urls
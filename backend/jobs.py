@@ -0,0 +1,197 @@
+"""
+One-off maintenance jobs.
+
+Usage (from the backend directory):
+    python jobs.py <job-name>
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import func, select, update
+
+import admin_stats
+import images
+import listings
+import reputation
+
+from database import SessionLocal
+from models import Notification, Task, TaskReport, User, write_search_terms
+from pagination import DEFAULT_PAGE_SIZE, keyset_page
+
+BATCH_SIZE = 1000
+
+
+def rebuild_search_index(db):
+    """Re-index every task's title and description into task_search_terms"""
+    count = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Task.id, Task.title, Task.description)
+            .filter(Task.id > last_id)
+            .order_by(Task.id)
+            .limit(BATCH_SIZE)
+            .all()
+        )
+        if not batch:
+            break
+        connection = db.connection()
+        for task_id, title, description in batch:
+            write_search_terms(connection, task_id, title, description)
+        db.commit()
+        count += len(batch)
+        last_id = batch[-1].id
+    return count
+
+
+# Listings whose plans sort by design, with the reason the sort stays small
+BOUNDED_SORTS = {
+    "GET /api/users/me/tasks": "not paginated; sorts exactly the rows it returns",
+    "GET /api/users/{id}/tasks": "sorts two pages, one read in order from each of the poster and seeker indexes",
+}
+
+
+def _listing_queries():
+    """First page of each listing, built by the same functions the endpoints use"""
+    def page(statement, model):
+        return keyset_page(statement, model.created_at, model.id, None, DEFAULT_PAGE_SIZE)
+
+    return {
+        "GET /api/tasks": page(listings.task_listing("available"), Task),
+        "GET /api/admin/tasks": page(listings.task_listing(), Task),
+        "GET /api/admin/tasks?status_filter=completed": page(listings.task_listing("completed"), Task),
+        "GET /api/users/me/tasks": listings.my_tasks(1),
+        "GET /api/users/me/tasks?task_type=posted": listings.my_tasks(1, "posted"),
+        "GET /api/users/me/tasks?task_type=accepted": listings.my_tasks(1, "accepted"),
+        "GET /api/users/{id}/tasks": page(listings.user_tasks(1), Task),
+        "GET /api/users/{id}/tasks?role=posted": page(listings.user_tasks(1, "posted"), Task),
+        "GET /api/admin/users": page(listings.user_directory(), User),
+        "GET /api/admin/users?q=": page(listings.user_directory("a"), User),
+        "GET /api/admin/users?is_admin=": page(listings.user_directory(is_admin=False), User),
+        "GET /api/tasks/{id}/messages": listings.message_page(1, DEFAULT_PAGE_SIZE),
+        "GET /api/tasks/{id}/messages?since_id=": listings.message_page(1, DEFAULT_PAGE_SIZE, since_id=1),
+        "GET /api/tasks/{id}/messages?before_id=": listings.message_page(1, DEFAULT_PAGE_SIZE, before_id=1000000),
+        "messages ETag (latest id)": listings.latest_message_id(1),
+        "GET /api/notifications": page(listings.notifications(1), Notification),
+        "GET /api/notifications?unread_only=true": page(listings.notifications(1, unread_only=True), Notification),
+    }
+
+
+def _explain(connection, statement):
+    """Query plan lines and whether the plan sorts rows instead of reading an index in order"""
+    dialect = connection.dialect.name
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    if dialect == "sqlite":
+        lines = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+        sorts = any("TEMP B-TREE" in line for line in lines)
+    elif dialect == "mysql":
+        rows = connection.exec_driver_sql(f"EXPLAIN {sql}").mappings().all()
+        lines = [f"table={row['table']} key={row['key']} extra={row['Extra']}" for row in rows]
+        sorts = any("filesort" in (row["Extra"] or "") for row in rows)
+    else:
+        lines = [row[0] for row in connection.exec_driver_sql(f"EXPLAIN {sql}")]
+        sorts = any(line.strip().lstrip("-> ").startswith("Sort") for line in lines)
+    return lines, sorts
+
+
+def benchmark_listings(db):
+    """Print the plan and timing of each listing query; fails if any of them sorts unexpectedly"""
+    connection = db.connection()
+    sorting = []
+    for name, statement in _listing_queries().items():
+        lines, sorts = _explain(connection, statement)
+        started = time.perf_counter()
+        # Through the session, so loader options issue their follow-up queries as in the API
+        db.execute(statement).all()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        order = "index order"
+        if sorts:
+            order = f"SORT ({BOUNDED_SORTS[name]})" if name in BOUNDED_SORTS else "SORT"
+        print(f"{name}: {elapsed_ms:.2f} ms, {order}")
+        for line in lines:
+            print(f"    {line}")
+        if sorts and name not in BOUNDED_SORTS:
+            sorting.append(name)
+    if sorting:
+        raise SystemExit(f"Queries sorting instead of using an index: {', '.join(sorting)}")
+    return "all listing queries read rows in index order"
+
+
+def generate_proof_variants(db):
+    """Render thumbnail and web variants for proof images uploaded before variants existed"""
+    if not images.variants_enabled():
+        raise SystemExit("Pillow is not installed; cannot generate image variants")
+    count = 0
+    proof_urls = db.scalars(
+        select(Task.proof_image).where(Task.proof_image.isnot(None), Task.proof_thumbnail.is_(None)).distinct()
+    ).all()
+    for proof_url in proof_urls:
+        urls = asyncio.run(images.generate_variants(proof_url))
+        if not urls:
+            continue
+        db.execute(
+            update(Task)
+            .where(Task.proof_image == proof_url)
+            .values(proof_thumbnail=urls["thumb"], proof_web_image=urls["web"])
+        )
+        db.commit()
+        count += 1
+    images.shutdown_pool()
+    return f"{count} of {len(proof_urls)} images processed"
+
+
+def backfill_reputation(db):
+    """Recompute every user's rating and completed task aggregates from feedback and tasks"""
+    updated = reputation.recompute_all(db)
+    db.commit()
+    return f"{updated} users updated"
+
+
+def reconcile_report_counts(db):
+    """Correct tasks.report_count wherever it differs from the number of task_reports rows"""
+    actual = select(func.count(TaskReport.id)).where(TaskReport.task_id == Task.id).scalar_subquery()
+    corrected = 0
+    last_id = 0
+    max_id = db.scalar(select(func.max(Task.id))) or 0
+    # One id range per transaction, so no statement locks the whole table
+    while last_id < max_id:
+        result = db.execute(
+            update(Task)
+            .where(Task.id > last_id, Task.id <= last_id + BATCH_SIZE, Task.report_count != actual)
+            .values(report_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        corrected += result.rowcount
+        last_id += BATCH_SIZE
+    return f"{corrected} tasks corrected"
+
+
+def rebuild_stats(db):
+    """Recompute the admin dashboard counters from the tables"""
+    admin_stats.rebuild(db)
+    db.commit()
+    return "admin statistics counters rebuilt"
+
+
+JOBS = {
+    "rebuild-search-index": rebuild_search_index,
+    "benchmark-listings": benchmark_listings,
+    "generate-proof-variants": generate_proof_variants,
+    "backfill-reputation": backfill_reputation,
+    "rebuild-stats": rebuild_stats,
+    "reconcile-report-counts": reconcile_report_counts,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in JOBS:
+        print(f"Usage: python jobs.py <{'|'.join(JOBS)}>")
+        sys.exit(1)
+    db = SessionLocal()
+    try:
+        result = JOBS[sys.argv[1]](db)
+        print(f"{sys.argv[1]}: {result}")
+    finally:
+        db.close()
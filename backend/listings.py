@@ -0,0 +1,110 @@
+"""
+Statements behind the list endpoints.
+
+The handlers in main.py build their queries here, and so does
+`python jobs.py benchmark-listings`, so the plans it explains are the ones the
+API actually runs (full entities with their loader options, not just ids).
+Paginated listings are returned unordered; pagination.keyset_page (or
+paginate) adds the order and the limit.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import false, func, or_, select, union_all
+
+from models import Message, Notification, Task, User
+from pagination import DEFAULT_PAGE_SIZE, keyset_page
+from query_options import task_response_options
+
+
+def task_listing(status: Optional[str] = None):
+    """GET /api/tasks and GET /api/admin/tasks"""
+    statement = select(Task).options(*task_response_options())
+    if status:
+        statement = statement.where(Task.status == status)
+    return statement
+
+
+def my_tasks(user_id: int, task_type: Optional[str] = None):
+    """GET /api/users/me/tasks: posted, accepted or (without task_type) both, newest first"""
+    statement = select(Task).options(*task_response_options()).order_by(Task.created_at.desc())
+    if task_type == "posted":
+        return statement.where(Task.poster_id == user_id)
+    if task_type == "accepted":
+        return statement.where(Task.seeker_id == user_id)
+    return statement.where(or_(Task.poster_id == user_id, Task.seeker_id == user_id))
+
+
+def user_tasks(
+    user_id: int, role: Optional[str] = None, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    GET /api/users/{user_id}/tasks. Without a role, the next page is taken from
+    the poster and the seeker index separately and merged, so only those two
+    pages are sorted rather than every task of the user.
+    """
+    def where(statement, column):
+        statement = statement.where(column == user_id)
+        return statement.where(Task.status == status) if status else statement
+
+    statement = select(Task).options(*task_response_options())
+    if role == "posted":
+        return where(statement, Task.poster_id)
+    if role == "accepted":
+        return where(statement, Task.seeker_id)
+    branches = [
+        keyset_page(where(select(Task.id, Task.created_at), column), Task.created_at, Task.id, cursor, limit).subquery()
+        for column in (Task.poster_id, Task.seeker_id)
+    ]
+    return statement.where(Task.id.in_(union_all(*(select(branch.c.id) for branch in branches))))
+
+
+def user_directory(
+    q: Optional[str] = None,
+    is_admin: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+):
+    """GET /api/admin/users"""
+    statement = select(User)
+    if q and q.strip():
+        # Prefix LIKE (wildcards in the input escaped) is a range scan on each column's index
+        prefix = q.strip().replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
+        statement = statement.where(or_(*(
+            column.like(prefix, escape="/")
+            for column in (User.email, User.name, User.first_name, User.last_name)
+        )))
+    if is_admin is not None:
+        statement = statement.where(User.is_admin == is_admin)
+    if created_after:
+        statement = statement.where(User.created_at >= created_after)
+    if created_before:
+        statement = statement.where(User.created_at < created_before)
+    return statement
+
+
+def notifications(user_id: int, unread_only: bool = False):
+    """GET /api/notifications"""
+    statement = select(Notification).where(Notification.user_id == user_id)
+    if unread_only:
+        statement = statement.where(Notification.seen == false())
+    return statement
+
+
+def latest_message_id(task_id: int):
+    """Newest message id of a task, the messages ETag; one probe of the (task_id, id) index"""
+    return select(func.max(Message.id)).where(Message.task_id == task_id)
+
+
+def message_page(task_id: int, limit: int, since_id: Optional[int] = None, before_id: Optional[int] = None):
+    """
+    GET /api/tasks/{task_id}/messages: with since_id, the messages after it oldest
+    first; otherwise the latest page (or the one before before_id) newest first
+    """
+    statement = select(Message).where(Message.task_id == task_id)
+    if since_id is not None:
+        return statement.where(Message.id > since_id).order_by(Message.id.asc()).limit(limit)
+    if before_id is not None:
+        statement = statement.where(Message.id < before_id)
+    return statement.order_by(Message.id.desc()).limit(limit)
@@ -1,33 +1,67 @@
-from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File
-from fastapi.staticfiles import StaticFiles
-import os
-import uuid
+from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Query, Request, Response, BackgroundTasks
+from fastapi.responses import StreamingResponse
+import asyncio
+import csv
+from itertools import islice
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import and_, case, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 import uvicorn
 from typing import List, Optional
 from datetime import datetime
 
-from database import SessionLocal, engine, Base
-from models import User, Task, Message, Feedback, TaskReport, Notification, TaskLocation
+from database import AsyncSessionLocal, async_engine, engine, Base
+from pool_metrics import pool_metrics
+from models import User, Task, Message, Feedback, TaskReport, Notification, TaskLocation, TaskSearchTerm
 from schemas import (
     UserCreate, UserResponse, TaskCreate, TaskUpdate, TaskResponse,
     MessageCreate, MessageResponse, FeedbackCreate, FeedbackResponse,
-    TaskReportCreate, TaskReportResponse, NotificationResponse, UserProfileUpdate
+    TaskReportCreate, TaskReportResponse, NotificationResponse, UserProfileUpdate,
+    UserSummary, UserTaskStats, NearbyTaskResponse,
+    NotificationBulkAction, NotificationUnreadCount, NotificationBulkResult, AdminStats,
+    TaskBatchCreate, TaskBatchItemResult, TaskBatchResult, TaskImportResult
 )
 from auth import verify_firebase_token, get_current_user
+from migrations import run_migrations
+from pagination import (
+    paginate, encode_rank_cursor, decode_rank_cursor,
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+)
+from user_cache import user_cache
+from query_options import task_response_options, load_task
+from geo import cell_filter, haversine_km
+from fulltext import query_terms
+from realtime import event_hub, format_sse, HEARTBEAT_SECONDS
+from outbox import outbox_dispatcher, queue_notification
+import listings
+import task_states
+import reputation
+import admin_stats
+from admin_stats import stats_rollup
+from uploads import UploadSizeLimitMiddleware, save_image
+from storage import etag_matches, serve_upload
+from images import generate_variants, start_pool, shutdown_pool
+from response_cache import response_cache
+from task_import import (
+    INSERT_CHUNK_SIZE, MAX_BATCH_SIZE, MAX_REPORTED_ERRORS, insert_tasks, read_import_rows, validate_item
+)
+from exports import EXPORT_UNTIL_HEADER, MEDIA_TYPES, export_statement, naive_utc, stream_export
 
-# Create database tables
+# Create database tables, then bring existing tables up to the current schema
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 app = FastAPI(title="Taskerrand API", version="1.0.0")
 
-# Ensure uploads directory exists and serve it as static files for proof images
-UPLOAD_DIR = os.path.join(os.path.dirname(__file__), '..', 'uploads')
-PROOF_DIR = os.path.join(UPLOAD_DIR, 'proofs')
-os.makedirs(PROOF_DIR, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=os.path.abspath(UPLOAD_DIR)), name="uploads")
+# Uploaded files (proof images) are served by the storage layer with immutable caching
+@app.api_route("/uploads/{key:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def get_upload(key: str, request: Request):
+    return await serve_upload(request, key)
+
+# Oversized uploads are refused before their body is parsed (inside CORS so the 413 carries its headers)
+app.add_middleware(UploadSizeLimitMiddleware)
 
 # CORS middleware
 app.add_middleware(
@@ -36,32 +70,54 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", EXPORT_UNTIL_HEADER],
 )
 
 security = HTTPBearer()
 
+@app.on_event("startup")
+async def start_background_services():
+    await event_hub.start()
+    await outbox_dispatcher.start()
+    await stats_rollup.start()
+    await start_pool()
+
+@app.on_event("shutdown")
+async def stop_background_services():
+    await outbox_dispatcher.stop()
+    await stats_rollup.stop()
+    await event_hub.stop()
+    shutdown_pool()
+
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # Dependency to get current user
 async def get_current_user_db(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     token = credentials.credentials
     print(f"DEBUG: Received token (first 20 chars): {token[:20]}...")
+    return await resolve_user(token, db)
+
+async def resolve_user(token: str, db: AsyncSession) -> User:
+    """Verify a Firebase token and return the matching user, creating it on first sign-in"""
     user_data = await verify_firebase_token(token)
     if not user_data:
         print("ERROR: Token verification failed")
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
+    # Serve the identity from the in-process cache when possible; the returned
+    # User is detached, so endpoints that modify it must load their own copy
+    user = user_cache.get(user_data["uid"])
+    if user:
+        return user
+
     # Get or create user in database
-    user = db.query(User).filter(User.firebase_uid == user_data["uid"]).first()
+    user = await db.scalar(select(User).where(User.firebase_uid == user_data["uid"]))
     if not user:
         user = User(
             firebase_uid=user_data["uid"],
@@ -71,24 +127,52 @@ async def get_current_user_db(
             is_admin=user_data.get("email") == ("neowarsia@gmail.com")  # Admin check
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
-
-    return user
+        admin_stats.user_created(db)
+        await db.commit()
+        await db.refresh(user)
 
+    user_cache.put(user)
     return user
 
-# Helper function to create notification
-def create_notification(db: Session, user_id: int, title: str, message: str, notif_type: str, task_id: Optional[int] = None):
-    notification = Notification(
-        user_id=user_id,
-        task_id=task_id,
-        title=title,
-        message=message,
-        notif_type=notif_type
-    )
-    db.add(notification)
-    db.commit()
+# Helper function to push a task status change to the poster and seeker
+async def publish_task_update(task: Task, *extra_user_ids: Optional[int]):
+    await event_hub.publish([task.poster_id, task.seeker_id, *extra_user_ids], {
+        "type": "task_updated",
+        "task_id": task.id,
+        "status": task.status,
+        "seeker_id": task.seeker_id
+    })
+
+# Helper function to count a task deletion (and the reports deleted with it) in the admin statistics
+def record_task_deleted(db: AsyncSession, task: Task):
+    admin_stats.task_deleted(db, task.status, task.report_count)
+
+# Helper function to drop cached responses built from a task (after its change is committed)
+async def invalidate_task_cache(task: Task, listing: bool = True):
+    await response_cache.invalidate(f"task:{task.id}", "tasks:available" if listing else None)
+
+# Helper function to snapshot the response cache before reading a response to cache. A transaction
+# already open (e.g. from the user lookup) is ended so the reads see every write invalidated before it
+async def cache_snapshot(db: AsyncSession) -> Optional[int]:
+    since = await response_cache.snapshot()
+    if db.in_transaction():
+        await db.commit()
+    return since
+
+# Background task: generate the proof image variants and attach them to every task using the image
+async def process_proof_variants(proof_url: str):
+    urls = await generate_variants(proof_url)
+    if not urls:
+        return
+    async with AsyncSessionLocal() as db:
+        task_ids = (await db.scalars(select(Task.id).where(Task.proof_image == proof_url))).all()
+        await db.execute(
+            update(Task)
+            .where(Task.proof_image == proof_url)
+            .values(proof_thumbnail=urls["thumb"], proof_web_image=urls["web"])
+        )
+        await db.commit()
+    await response_cache.invalidate(*(f"task:{task_id}" for task_id in task_ids))
 
 # ==================== USER ENDPOINTS ====================
 
@@ -101,10 +185,15 @@ async def get_current_user_info(current_user: User = Depends(get_current_user_db
 async def update_user_profile(
     profile_update: UserProfileUpdate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update user profile information with validation to prevent scam activity"""
 
+    # current_user may be a cached snapshot; apply the update to the persistent row
+    current_user = await db.scalar(select(User).where(User.id == current_user.id))
+    if not current_user:
+        raise HTTPException(status_code=404, detail="User not found")
+
     # Validate and sanitize inputs
     if profile_update.first_name:
         # Ensure first name is valid (no special characters, not too long)
@@ -163,30 +252,58 @@ async def update_user_profile(
         current_user.name = name
 
     try:
-        db.commit()
-        db.refresh(current_user)
+        await db.commit()
+        await db.refresh(current_user)
+        user_cache.invalidate(current_user.firebase_uid)
+        # Profiles and the poster/seeker summaries embedded in tasks
+        await response_cache.invalidate(f"user:{current_user.id}", "tasks:available")
         return current_user
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to update profile: {str(e)}")
 
 
+@app.get("/api/users", response_model=List[UserSummary])
+async def get_users(
+    ids: str = Query(..., description="Comma-separated user ids"),
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Resolve many users in a single query (public summary fields only)"""
+    try:
+        user_ids = {int(part) for part in ids.split(",") if part.strip()}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if len(user_ids) > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} ids per request")
+    if not user_ids:
+        return []
+    return (await db.scalars(select(User).where(User.id.in_(user_ids)))).all()
+
 # Endpoint to get another user's profile (public information)
 @app.get("/api/users/{user_id}/profile", response_model=UserResponse)
 async def get_user_profile(
     user_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get public profile information for a specific user"""
-    user = db.query(User).filter(User.id == user_id).first()
+    cache_key = f"profile:{user_id}"
+    cached = await response_cache.get(cache_key)
+    if cached:
+        return cached
+
+    since = await cache_snapshot(db)
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    content = UserResponse.model_validate(user).model_dump(mode="json")
+    await response_cache.put(cache_key, content, tags=[f"user:{user_id}"], since=since)
+    return content
 
 @app.get("/api/users/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, current_user: User = Depends(get_current_user_db), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == user_id).first()
+async def get_user(user_id: int, current_user: User = Depends(get_current_user_db), db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -197,7 +314,7 @@ async def get_user(user_id: int, current_user: User = Depends(get_current_user_d
 async def create_task(
     task: TaskCreate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Prevent passing 'locations' (list of dicts) directly into ORM constructor
     task_payload = {k: v for k, v in task.dict().items() if k != 'locations'}
@@ -207,8 +324,8 @@ async def create_task(
         status="available"
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    admin_stats.task_created(db)
+    await db.commit()
 
     # If multiple locations were provided, store them in task_locations table
     if getattr(task, 'locations', None):
@@ -230,84 +347,218 @@ async def create_task(
             db_task.location_address = first.get('address') if isinstance(first, dict) else getattr(first, 'address', None)
         except Exception:
             pass
-        db.commit()
-        db.refresh(db_task)
-    return db_task
+        await db.commit()
+    await response_cache.invalidate("tasks:available")
+    return await load_task(db, db_task.id)
+
+@app.post("/api/tasks/batch", response_model=TaskBatchResult, status_code=status.HTTP_201_CREATED)
+async def create_tasks_batch(
+    batch: TaskBatchCreate,
+    response: Response,
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many tasks in one transaction; invalid items are reported per index and
+    skipped. 201 when every item was created, 207 when some failed, 422 when none was.
+    """
+    if len(batch.tasks) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} tasks per batch")
+
+    results = []
+    valid = []
+    for index, item in enumerate(batch.tasks):
+        task, error = validate_item(item)
+        if error:
+            results.append(TaskBatchItemResult(index=index, error=error))
+        else:
+            valid.append((index, task))
+
+    task_ids = await insert_tasks(db, [(task, current_user.id) for _, task in valid])
+    admin_stats.task_created(db, len(task_ids))
+    await db.commit()
+    if task_ids:
+        await response_cache.invalidate("tasks:available")
+
+    results.extend(TaskBatchItemResult(index=index, id=task_id) for (index, _), task_id in zip(valid, task_ids))
+    results.sort(key=lambda result: result.index)
+    failed = len(batch.tasks) - len(task_ids)
+    if failed:
+        response.status_code = status.HTTP_207_MULTI_STATUS if task_ids else status.HTTP_422_UNPROCESSABLE_ENTITY
+    return TaskBatchResult(created=len(task_ids), failed=failed, results=results)
 
 @app.get("/api/tasks", response_model=List[TaskResponse])
 async def get_tasks(
+    response: Response,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Task)
-    if status_filter:
-        query = query.filter(Task.status == status_filter)
-    else:
-        # Regular users see available tasks, admins see all
-        if not current_user.is_admin:
-            query = query.filter(Task.status == "available")
-    return query.order_by(Task.created_at.desc()).all()
+    # Regular users see available tasks, admins see all
+    effective_status = status_filter or (None if current_user.is_admin else "available")
+
+    # The available listing is the same for every user; serve it from the response cache
+    cache_key = f"tasks:available:{cursor or ''}:{limit}" if effective_status == "available" else None
+    if cache_key:
+        cached = await response_cache.get(cache_key)
+        if cached:
+            return cached
+        since = await cache_snapshot(db)
+
+    tasks = await paginate(db, listings.task_listing(effective_status), Task.created_at, Task.id, cursor, limit, response)
+    if not cache_key:
+        return tasks
+
+    content = [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks]
+    headers = {NEXT_CURSOR_HEADER: response.headers[NEXT_CURSOR_HEADER]} if NEXT_CURSOR_HEADER in response.headers else {}
+    await response_cache.put(cache_key, content, tags=["tasks:available"], since=since, headers=headers)
+    return content
 
 
 @app.get("/api/tasks/search", response_model=List[TaskResponse])
 async def search_tasks(
+    response: Response,
     query: Optional[str] = None,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Search tasks by title (case-insensitive substring match).
+    """Full-text search over task titles and descriptions.
+
+    Every query word must match (as a prefix) a term in the task_search_terms
+    index; results are ranked by summed term weight, title hits weighing more.
+    Without a query this is the newest-first listing.
 
     Regular users will only see available tasks. Admins can search across all statuses.
     """
-    q = db.query(Task)
-    # Apply status filter or restrict to available tasks for non-admins
-    if status_filter:
-        q = q.filter(Task.status == status_filter)
-    else:
-        if not current_user.is_admin:
-            q = q.filter(Task.status == "available")
+    status_value = status_filter or (None if current_user.is_admin else "available")
+    terms = query_terms(query) if query else []
+
+    if query and not terms:
+        # Only stopwords/punctuation: nothing to look up in the index
+        return []
+    if not terms:
+        q = select(Task).options(*task_response_options())
+        if status_value:
+            q = q.where(Task.status == status_value)
+        return await paginate(db, q, Task.created_at, Task.id, cursor, limit, response)
+
+    term_filters = [TaskSearchTerm.term.like(f"{term}%") for term in terms]
+    matched_terms = sum(
+        (func.max(case((term_filter, 1), else_=0)) for term_filter in term_filters[1:]),
+        func.max(case((term_filters[0], 1), else_=0))
+    )
+    score = func.sum(TaskSearchTerm.weight)
+
+    ranked = select(TaskSearchTerm.task_id, score.label("score")).where(or_(*term_filters))
+    if status_value:
+        ranked = ranked.join(Task, Task.id == TaskSearchTerm.task_id).where(Task.status == status_value)
+    ranked = ranked.group_by(TaskSearchTerm.task_id).having(matched_terms == len(terms))
+    if cursor:
+        after_score, after_id = decode_rank_cursor(cursor)
+        ranked = ranked.having(
+            or_(score < after_score, and_(score == after_score, TaskSearchTerm.task_id < after_id))
+        )
+    hits = (await db.execute(ranked.order_by(score.desc(), TaskSearchTerm.task_id.desc()).limit(limit + 1))).all()
+    if len(hits) > limit:
+        hits = hits[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(hits[-1].score, hits[-1].task_id)
+    if not hits:
+        return []
+
+    tasks = {
+        task.id: task
+        for task in await db.scalars(
+            select(Task).options(*task_response_options()).where(Task.id.in_([hit.task_id for hit in hits]))
+        )
+    }
+    return [tasks[hit.task_id] for hit in hits if hit.task_id in tasks]
+
+@app.get("/api/tasks/nearby", response_model=List[NearbyTaskResponse])
+async def get_nearby_tasks(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(10.0, gt=0, le=100),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    status_filter: Optional[str] = None,
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Tasks with any stop within radius_km of (lat, lng), closest first.
 
-    if query:
-        # Use case-insensitive match
-        try:
-            q = q.filter(Task.title.ilike(f"%{query}%"))
-        except Exception:
-            # Fallback to naive contains if ilike not supported
-            q = q.filter(Task.title.contains(query))
+    Candidates come from the indexed grid_cell columns of tasks and
+    task_locations, so only rows in cells overlapping the search circle are read.
+    """
+    status_value = status_filter or (None if current_user.is_admin else "available")
 
-    return q.order_by(Task.created_at.desc()).all()
+    primary = select(Task.id, Task.location_lat, Task.location_lng).where(
+        cell_filter(Task.grid_cell, lat, lng, radius_km)
+    )
+    stops = select(TaskLocation.task_id, TaskLocation.lat, TaskLocation.lng).join(
+        Task, Task.id == TaskLocation.task_id
+    ).where(cell_filter(TaskLocation.grid_cell, lat, lng, radius_km))
+    if status_value:
+        primary = primary.where(Task.status == status_value)
+        stops = stops.where(Task.status == status_value)
+
+    # Closest stop per task decides its distance
+    distances = {}
+    points = (await db.execute(primary)).all() + (await db.execute(stops)).all()
+    for task_id, point_lat, point_lng in points:
+        distance = haversine_km(lat, lng, point_lat, point_lng)
+        if distance <= radius_km and distance < distances.get(task_id, float("inf")):
+            distances[task_id] = distance
+
+    nearest = sorted(distances, key=distances.get)[:limit]
+    if not nearest:
+        return []
+    tasks = {
+        task.id: task
+        for task in await db.scalars(select(Task).options(*task_response_options()).where(Task.id.in_(nearest)))
+    }
+    results = []
+    for task_id in nearest:
+        task = tasks.get(task_id)
+        if not task:
+            continue
+        setattr(task, 'distance_km', round(distances[task_id], 3))
+        results.append(task)
+    return results
 
 @app.get("/api/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
+    cache_key = f"task:{task_id}"
+    cached = await response_cache.get(cache_key)
+    if cached:
+        return cached
+
+    since = await cache_snapshot(db)
+    task = await db.scalar(select(Task).options(*task_response_options()).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Attach report_count so frontend can display number of reports on task-detail page
-    try:
-        report_count = db.query(TaskReport).filter(TaskReport.task_id == task_id).count()
-    except Exception:
-        report_count = 0
-    # Attach as attribute for Pydantic from_attributes conversion
-    setattr(task, 'report_count', report_count)
-
-    # Return the ORM Task instance and let FastAPI/Pydantic serialize it (TaskResponse now expects TaskLocationResponse objects)
-    return task
+    content = TaskResponse.model_validate(task).model_dump(mode="json")
+    await response_cache.put(cache_key, content, tags=[
+        f"task:{task_id}", f"user:{task.poster_id}", f"user:{task.seeker_id}" if task.seeker_id else None
+    ], since=since)
+    return content
 
 @app.put("/api/tasks/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -315,11 +566,22 @@ async def update_task(
     if task.poster_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Not authorized to update this task")
 
-    for key, value in task_update.dict(exclude_unset=True).items():
+    updates = task_update.dict(exclude_unset=True)
+    previous_status, seeker_id, completed_at = task.status, task.seeker_id, task.completed_at
+    new_status = updates.pop("status", None) or previous_status
+    if new_status != previous_status:
+        # Status changes go through the state machine; only admins may force one
+        if not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Only admins can set a task's status directly")
+        await task_states.set_status(db, task.id, previous_status, seeker_id, new_status)
+        await reputation.record_status_change(db, seeker_id, previous_status, new_status)
+        admin_stats.task_status_changed(db, previous_status, new_status, completed_at)
+
+    for key, value in updates.items():
         # Locations handled separately
         if key == 'locations':
             # delete existing locations and recreate
-            db.query(TaskLocation).filter(TaskLocation.task_id == task.id).delete(synchronize_session=False)
+            await db.execute(delete(TaskLocation).where(TaskLocation.task_id == task.id))
             for i, loc in enumerate(value):
                 try:
                     lat = float(loc.get('lat') if isinstance(loc, dict) else getattr(loc, 'lat'))
@@ -341,17 +603,20 @@ async def update_task(
         else:
             setattr(task, key, value)
 
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    task = await load_task(db, task.id)
+    await invalidate_task_cache(task)
+    if seeker_id and new_status != previous_status:
+        await response_cache.invalidate(f"user:{seeker_id}")
     return task
 
 @app.delete("/api/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -359,42 +624,37 @@ async def delete_task(
     if task.poster_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Not authorized to delete this task")
 
+    record_task_deleted(db, task)
+
     # Delete any notifications referencing this task first to avoid FK constraint issues
     try:
-        db.query(Notification).filter(Notification.task_id == task_id).delete(synchronize_session=False)
+        await db.execute(delete(Notification).where(Notification.task_id == task_id))
     except Exception:
         # If deletion of notifications fails for any reason, log and continue
         pass
 
-    db.delete(task)
-    db.commit()
+    seeker_id = task.seeker_id
+    await reputation.remove_task(db, task)
+    await db.delete(task)
+    await db.commit()
+    # Feedback on the task is deleted with it
+    await invalidate_task_cache(task)
+    if seeker_id:
+        await response_cache.invalidate(f"feedback:{seeker_id}", f"user:{seeker_id}")
     return None
 
 @app.post("/api/tasks/{task_id}/accept", response_model=TaskResponse)
 async def accept_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    if task.status != "available":
-        raise HTTPException(status_code=400, detail="Task is not available")
-
-    if task.poster_id == current_user.id:
-        raise HTTPException(status_code=400, detail="Cannot accept your own task")
-
-    task.status = "ongoing"
-    task.seeker_id = current_user.id
-    task.accepted_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(task)
+    await task_states.accept(db, task_id, current_user.id)
+    admin_stats.task_status_changed(db, task_states.AVAILABLE, task_states.ONGOING)
+    task = await load_task(db, task_id)
 
     # Notify poster
-    create_notification(
+    queue_notification(
         db,
         task.poster_id,
         "Task Accepted",
@@ -403,36 +663,25 @@ async def accept_task(
         task.id
     )
 
+    await db.commit()
+
+    await invalidate_task_cache(task)
+    await publish_task_update(task)
+
     return task
 
 @app.post("/api/tasks/{task_id}/complete", response_model=TaskResponse)
 async def complete_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    if task.status != "ongoing":
-        raise HTTPException(status_code=400, detail="Task is not ongoing")
-
-    # Only seeker can mark as complete
-    if task.seeker_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the seeker can mark task as complete")
-
-    # Require proof image before marking as done
-    if not getattr(task, 'proof_image', None):
-        raise HTTPException(status_code=400, detail="Please attach a proof image before marking as done")
-
-    task.status = "pending_confirmation"
-
-    db.commit()
-    db.refresh(task)
+    await task_states.complete(db, task_id, current_user.id)
+    admin_stats.task_status_changed(db, task_states.ONGOING, task_states.PENDING_CONFIRMATION)
+    task = await load_task(db, task_id)
 
     # Notify poster
-    create_notification(
+    queue_notification(
         db,
         task.poster_id,
         "Task Completed",
@@ -441,17 +690,25 @@ async def complete_task(
         task.id
     )
 
+    await db.commit()
+
+    await invalidate_task_cache(task, listing=False)
+    await publish_task_update(task)
+
     return task
 
 
 @app.post("/api/tasks/{task_id}/proof", response_model=TaskResponse)
 async def upload_proof(
     task_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
+    # Reject early so no file is written for a request that cannot succeed;
+    # the state itself is re-checked atomically when the proof is attached
+    task = await db.scalar(select(Task).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -465,23 +722,15 @@ async def upload_proof(
     if not (file.content_type and file.content_type.startswith('image/')):
         raise HTTPException(status_code=400, detail="Uploaded file must be an image")
 
-    # Save file
-    filename = f"task_{task_id}_{uuid.uuid4().hex}_{file.filename}"
-    # Ensure upload dir exists
-    upload_dir = os.path.join(os.path.dirname(__file__), '..', 'uploads', 'proofs')
-    os.makedirs(upload_dir, exist_ok=True)
-    file_path = os.path.join(upload_dir, filename)
-    with open(file_path, 'wb') as f:
-        content = await file.read()
-        f.write(content)
+    # Stream the file to disk; stored under its content hash so duplicates are kept once
+    proof_url = await save_image(file, "proofs")
 
     # Store relative URL path that frontend can use (served under /uploads)
-    task.proof_image = f"/uploads/proofs/{filename}"
-    db.commit()
-    db.refresh(task)
+    await task_states.attach_proof(db, task_id, current_user.id, proof_url)
+    task = await load_task(db, task_id)
 
     # Notify poster about proof uploaded
-    create_notification(
+    queue_notification(
         db,
         task.poster_id,
         "Proof Uploaded",
@@ -490,34 +739,30 @@ async def upload_proof(
         task.id
     )
 
+    await db.commit()
+
+    # Thumbnails are rendered in the image process pool after the response is sent
+    background_tasks.add_task(process_proof_variants, proof_url)
+
+    await invalidate_task_cache(task, listing=False)
+    await publish_task_update(task)
+
     return task
 
 @app.post("/api/tasks/{task_id}/confirm", response_model=TaskResponse)
 async def confirm_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    if task.status != "pending_confirmation":
-        raise HTTPException(status_code=400, detail="Task is not pending confirmation")
-
-    # Only poster can confirm
-    if task.poster_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the poster can confirm task completion")
-
-    task.status = "completed"
-    task.completed_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(task)
+    await task_states.confirm(db, task_id, current_user.id)
+    task = await load_task(db, task_id)
+    await reputation.record_status_change(db, task.seeker_id, task_states.PENDING_CONFIRMATION, task.status)
+    admin_stats.task_status_changed(db, task_states.PENDING_CONFIRMATION, task.status)
 
     # Notify seeker
     if task.seeker_id:
-        create_notification(
+        queue_notification(
             db,
             task.seeker_id,
             "Task Confirmed",
@@ -526,56 +771,37 @@ async def confirm_task(
             task.id
         )
 
+    await db.commit()
+
+    await invalidate_task_cache(task, listing=False)
+    await response_cache.invalidate(f"user:{task.seeker_id}" if task.seeker_id else None)
+    await publish_task_update(task)
+
     return task
 
 @app.post("/api/tasks/{task_id}/cancel", response_model=TaskResponse)
 async def cancel_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # Only poster can cancel available tasks, both can cancel ongoing
-    if task.status == "available":
-        if task.poster_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Only the poster can cancel available tasks")
-        # Poster cancelling an available task: mark as cancelled
-        task.status = "cancelled"
-        task.seeker_id = None
-        task.accepted_at = None
-    elif task.status == "ongoing":
-        if task.poster_id != current_user.id and task.seeker_id != current_user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to cancel this task")
-        # If the seeker cancels an ongoing task, make it available again for others.
-        # If the poster cancels an ongoing task, mark it as cancelled.
-        if current_user.id == task.seeker_id and task.poster_id != task.seeker_id:
-            task.status = "available"
-        else:
-            task.status = "cancelled"
-        task.seeker_id = None
-        task.accepted_at = None
-    else:
-        raise HTTPException(status_code=400, detail="Cannot cancel task in current status")
-
-    db.commit()
-    db.refresh(task)
+    previous_status, previous_seeker_id = await task_states.cancel(db, task_id, current_user.id)
+    task = await load_task(db, task_id)
+    admin_stats.task_status_changed(db, previous_status, task.status)
 
     # Notify other party if applicable
     if task.status == "cancelled":
-        if current_user.id == task.poster_id and task.seeker_id:
-            create_notification(
+        if current_user.id == task.poster_id and previous_seeker_id:
+            queue_notification(
                 db,
-                task.seeker_id,
+                previous_seeker_id,
                 "Task Cancelled",
                 f"The task '{task.title}' has been cancelled by the poster.",
                 "task_update",
                 task.id
             )
-        elif current_user.id == task.seeker_id and task.poster_id:
-             create_notification(
+        elif current_user.id == previous_seeker_id and task.poster_id:
+            queue_notification(
                 db,
                 task.poster_id,
                 "Task Cancelled",
@@ -584,23 +810,53 @@ async def cancel_task(
                 task.id
             )
 
+    await db.commit()
+    await invalidate_task_cache(task)
+    await publish_task_update(task, previous_seeker_id)
+
     return task
 
 @app.get("/api/users/me/tasks", response_model=List[TaskResponse])
 async def get_my_tasks(
     task_type: Optional[str] = None,  # "posted" or "accepted"
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    if task_type == "posted":
-        return db.query(Task).filter(Task.poster_id == current_user.id).order_by(Task.created_at.desc()).all()
-    elif task_type == "accepted":
-        return db.query(Task).filter(Task.seeker_id == current_user.id).order_by(Task.created_at.desc()).all()
-    else:
-        # Return all tasks user is involved in
-        return db.query(Task).filter(
-            (Task.poster_id == current_user.id) | (Task.seeker_id == current_user.id)
-        ).order_by(Task.created_at.desc()).all()
+    return (await db.scalars(listings.my_tasks(current_user.id, task_type))).all()
+
+# Declared after /api/users/me/tasks, which "{user_id}" would otherwise capture
+@app.get("/api/users/{user_id}/tasks", response_model=List[TaskResponse])
+async def get_user_tasks(
+    user_id: int,
+    response: Response,
+    role: Optional[str] = Query(None, pattern="^(posted|accepted)$"),
+    status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Tasks a user posted (role=posted), is the seeker of (role=accepted) or either, newest first"""
+    query = listings.user_tasks(user_id, role, status_filter, cursor, limit)
+    return await paginate(db, query, Task.created_at, Task.id, cursor, limit, response)
+
+@app.get("/api/users/{user_id}/task-stats", response_model=UserTaskStats)
+async def get_user_task_stats(
+    user_id: int,
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Counts over all of a user's tasks, in one aggregate query"""
+    counts = (await db.execute(
+        select(
+            func.count(case((Task.poster_id == user_id, 1))),
+            func.count(case((Task.seeker_id == user_id, 1))),
+            func.count(case((and_(Task.seeker_id == user_id, Task.status == "completed"), 1))),
+            func.count(case((Task.status.in_(("ongoing", "pending_confirmation")), 1))),
+        ).where(or_(Task.poster_id == user_id, Task.seeker_id == user_id))
+    )).one()
+    posted, accepted, completed, active = counts
+    return UserTaskStats(posted=posted, accepted=accepted, completed=completed, active=active)
 
 # ==================== MESSAGE ENDPOINTS ====================
 
@@ -608,10 +864,10 @@ async def get_my_tasks(
 async def create_message(
     message: MessageCreate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Verify user is part of the task
-    task = db.query(Task).filter(Task.id == message.task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == message.task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -623,13 +879,11 @@ async def create_message(
         sender_id=current_user.id
     )
     db.add(db_message)
-    db.commit()
-    db.refresh(db_message)
 
     # Notify recipient
     recipient_id = task.poster_id if current_user.id == task.seeker_id else task.seeker_id
     if recipient_id:
-        create_notification(
+        queue_notification(
             db,
             recipient_id,
             "New Message",
@@ -638,23 +892,52 @@ async def create_message(
             task.id
         )
 
+    await db.commit()
+    await db.refresh(db_message)
+
+    await event_hub.publish([task.poster_id, task.seeker_id], {
+        "type": "message",
+        "task_id": task.id,
+        "message": MessageResponse.model_validate(db_message).model_dump(mode="json")
+    })
+
     return db_message
 
 @app.get("/api/tasks/{task_id}/messages", response_model=List[MessageResponse])
 async def get_task_messages(
     task_id: int,
+    request: Request,
+    response: Response,
+    since_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Verify user is part of the task
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     if task.poster_id != current_user.id and task.seeker_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view messages for this task")
 
-    return db.query(Message).filter(Message.task_id == task_id).order_by(Message.created_at.asc()).all()
+    if since_id is not None and before_id is not None:
+        raise HTTPException(status_code=400, detail="Use either since_id or before_id, not both")
+
+    # Messages are never edited, so the newest id identifies the conversation state.
+    # The lookup is a single probe of the (task_id, id) index.
+    latest_id = await db.scalar(listings.latest_message_id(task_id))
+    etag = f'W/"messages-{task_id}-{latest_id or 0}-{since_id}-{before_id}-{limit}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    messages = (await db.scalars(listings.message_page(task_id, limit, since_id, before_id))).all()
+    # Messages newer than the client's last one come oldest first already; the
+    # latest page (or the page before before_id) is returned oldest first too
+    return messages if since_id is not None else list(reversed(messages))
 
 # ==================== FEEDBACK ENDPOINTS ====================
 
@@ -662,10 +945,10 @@ async def get_task_messages(
 async def create_feedback(
     feedback: FeedbackCreate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Verify task is completed and user is the poster
-    task = db.query(Task).filter(Task.id == feedback.task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == feedback.task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -679,10 +962,10 @@ async def create_feedback(
         raise HTTPException(status_code=400, detail="Invalid seeker for this task")
 
     # Check if feedback already exists
-    existing = db.query(Feedback).filter(
+    existing = await db.scalar(select(Feedback).where(
         Feedback.task_id == feedback.task_id,
         Feedback.poster_id == current_user.id
-    ).first()
+    ))
 
     if existing:
         raise HTTPException(status_code=400, detail="Feedback already provided for this task")
@@ -692,72 +975,218 @@ async def create_feedback(
         poster_id=current_user.id
     )
     db.add(db_feedback)
-    db.commit()
-    db.refresh(db_feedback)
+    await reputation.record_rating(db, feedback.seeker_id, feedback.rating)
+    await db.commit()
+    await db.refresh(db_feedback)
+    await response_cache.invalidate(
+        f"task:{db_feedback.task_id}", f"feedback:{db_feedback.seeker_id}", f"user:{db_feedback.seeker_id}"
+    )
     return db_feedback
 
 @app.get("/api/users/{user_id}/feedback", response_model=List[FeedbackResponse])
 async def get_user_feedback(
     user_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    return db.query(Feedback).filter(Feedback.seeker_id == user_id).order_by(Feedback.created_at.desc()).all()
+    cache_key = f"feedback:{user_id}"
+    cached = await response_cache.get(cache_key)
+    if cached:
+        return cached
+
+    since = await cache_snapshot(db)
+    feedback = (await db.scalars(
+        select(Feedback).where(Feedback.seeker_id == user_id).order_by(Feedback.created_at.desc())
+    )).all()
+    content = [FeedbackResponse.model_validate(item).model_dump(mode="json") for item in feedback]
+    await response_cache.put(cache_key, content, tags=[f"feedback:{user_id}"], since=since)
+    return content
 
 # ==================== ADMIN ENDPOINTS ====================
 
 @app.get("/api/admin/users", response_model=List[UserResponse])
 async def get_all_users(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=100, description="Prefix of email, name, first or last name"),
+    is_admin: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    query = listings.user_directory(q, is_admin, created_after, created_before)
+    return await paginate(db, query, User.created_at, User.id, cursor, limit, response)
+
+@app.get("/api/admin/stats", response_model=AdminStats)
+async def get_admin_stats(
+    days: int = Query(30, ge=1, le=365),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
+    """Task, user and report totals plus daily volumes, read from precomputed counters"""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
-    return db.query(User).all()
+    return await admin_stats.snapshot(db, days)
+
+@app.get("/api/admin/metrics/user-cache")
+async def get_user_cache_metrics(current_user: User = Depends(get_current_user_db)):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user_cache.stats()
+
+@app.get("/api/admin/metrics/response-cache")
+async def get_response_cache_metrics(current_user: User = Depends(get_current_user_db)):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return response_cache.stats()
+
+@app.get("/api/admin/metrics/db")
+async def get_db_metrics(current_user: User = Depends(get_current_user_db)):
+    """Connection pool usage of this worker process (checked out, overflow, checkout latency)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return pool_metrics.snapshot(async_engine.sync_engine.pool)
 
 @app.get("/api/admin/tasks", response_model=List[TaskResponse])
 async def get_all_tasks(
+    response: Response,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    query = db.query(Task)
-    if status_filter:
-        query = query.filter(Task.status == status_filter)
-    return query.order_by(Task.created_at.desc()).all()
+    return await paginate(db, listings.task_listing(status_filter), Task.created_at, Task.id, cursor, limit, response)
+
+@app.get("/api/admin/export/{name}")
+async def export_table(
+    name: str,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user_db)
+):
+    """Stream tasks, users or reports changed in [since, until) as NDJSON or CSV"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    until = naive_utc(until) or datetime.utcnow()
+    statement = export_statement(name, since, until)
+    filename = f"{name}-{until.strftime('%Y%m%dT%H%M%S')}.{fmt}"
+    return StreamingResponse(
+        stream_export(statement, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            EXPORT_UNTIL_HEADER: until.isoformat(),
+        }
+    )
+
+@app.post("/api/admin/import/tasks", response_model=TaskImportResult)
+async def import_tasks(
+    file: UploadFile = File(...),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import tasks from an NDJSON or CSV file in one transaction. Rows may set
+    poster_id (default: the importing admin); invalid rows are skipped and reported.
+    """
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    rows = read_import_rows(file.file, fmt)
+    errors = []
+    created = failed = index = 0
+    while True:
+        try:
+            chunk = await run_in_threadpool(lambda: list(islice(rows, INSERT_CHUNK_SIZE)))
+        except (UnicodeDecodeError, csv.Error) as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=f"Could not read import file: {e}")
+        if not chunk:
+            break
+
+        valid = []
+        item_errors = []
+        for row in chunk:
+            poster_id = row.pop("poster_id", None) if "_error" not in row else None
+            task, error = (None, row["_error"]) if "_error" in row else validate_item(row)
+            if task is not None:
+                try:
+                    poster_id = int(poster_id) if poster_id is not None else current_user.id
+                except (TypeError, ValueError):
+                    task, error = None, "poster_id: not an integer"
+            if task is None:
+                item_errors.append(TaskBatchItemResult(index=index, error=error))
+            else:
+                valid.append((index, task, poster_id))
+            index += 1
+
+        # One lookup per chunk instead of failing the whole import on a foreign key error
+        poster_ids = {poster_id for _, _, poster_id in valid}
+        known = set((await db.scalars(select(User.id).where(User.id.in_(poster_ids)))).all()) if poster_ids else set()
+        for row_index, _, poster_id in valid:
+            if poster_id not in known:
+                item_errors.append(TaskBatchItemResult(index=row_index, error=f"poster_id: user {poster_id} not found"))
+        valid = [(task, poster_id) for _, task, poster_id in valid if poster_id in known]
+
+        created += len(await insert_tasks(db, valid))
+        failed += len(item_errors)
+        errors.extend(sorted(item_errors, key=lambda result: result.index)[:MAX_REPORTED_ERRORS - len(errors)])
+
+    admin_stats.task_created(db, created)
+    await db.commit()
+    if created:
+        await response_cache.invalidate("tasks:available")
+    return TaskImportResult(created=created, failed=failed, errors=errors)
 
 @app.delete("/api/admin/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def admin_delete_task(
     task_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    record_task_deleted(db, task)
+
     # Delete any notifications referencing this task first to avoid FK constraint issues
     try:
-        db.query(Notification).filter(Notification.task_id == task_id).delete(synchronize_session=False)
+        await db.execute(delete(Notification).where(Notification.task_id == task_id))
     except Exception:
         # If deletion of notifications fails for any reason, log and continue
         pass
 
     # Delete any reports related to this task to avoid FK constraint issues
     try:
-        db.query(TaskReport).filter(TaskReport.task_id == task_id).delete(synchronize_session=False)
+        await db.execute(delete(TaskReport).where(TaskReport.task_id == task_id))
     except Exception:
         # If deletion of reports fails for any reason, continue to attempt deleting the task
         pass
 
-    db.delete(task)
-    db.commit()
+    seeker_id = task.seeker_id
+    await reputation.remove_task(db, task)
+    await db.delete(task)
+    await db.commit()
+    # Feedback on the task is deleted with it
+    await invalidate_task_cache(task)
+    if seeker_id:
+        await response_cache.invalidate(f"feedback:{seeker_id}", f"user:{seeker_id}")
     return None
 
 # ==================== TASK REPORT ENDPOINTS ====================
@@ -766,10 +1195,10 @@ async def admin_delete_task(
 async def create_report(
     report: TaskReportCreate,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Verify task exists
-    task = db.query(Task).filter(Task.id == report.task_id).first()
+    task = await db.scalar(select(Task).where(Task.id == report.task_id))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
@@ -785,34 +1214,43 @@ async def create_report(
         description=report.description
     )
     db.add(db_report)
-    db.commit()
-    db.refresh(db_report)
+    await db.execute(
+        update(Task)
+        .where(Task.id == report.task_id)
+        .values(report_count=Task.report_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    admin_stats.report_created(db)
+    await db.commit()
+    await db.refresh(db_report)
+    # report_count is part of the cached task and listing
+    await invalidate_task_cache(task)
     return db_report
 
 
 @app.get("/api/reports", response_model=List[TaskReportResponse])
 async def get_reports(
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Only admins can view reports
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    return db.query(TaskReport).order_by(TaskReport.created_at.desc()).all()
+    return (await db.scalars(select(TaskReport).order_by(TaskReport.created_at.desc()))).all()
 
 
 @app.get("/api/reports/{report_id}", response_model=TaskReportResponse)
 async def get_report(
     report_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Only admins can view reports
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    report = db.query(TaskReport).filter(TaskReport.id == report_id).first()
+    report = await db.scalar(select(TaskReport).where(TaskReport.id == report_id))
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
@@ -823,18 +1261,26 @@ async def get_report(
 async def delete_report(
     report_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Only admins can delete reports
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    report = db.query(TaskReport).filter(TaskReport.id == report_id).first()
+    report = await db.scalar(select(TaskReport).where(TaskReport.id == report_id))
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    db.delete(report)
-    db.commit()
+    await db.delete(report)
+    await db.execute(
+        update(Task)
+        .where(Task.id == report.task_id, Task.report_count > 0)
+        .values(report_count=Task.report_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+    admin_stats.report_deleted(db)
+    await db.commit()
+    await response_cache.invalidate(f"task:{report.task_id}", "tasks:available")
     return None
 
 
@@ -842,18 +1288,77 @@ async def delete_report(
 
 @app.get("/api/notifications", response_model=List[NotificationResponse])
 async def get_notifications(
+    response: Response,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    return db.query(Notification).filter(Notification.user_id == current_user.id).order_by(Notification.created_at.desc()).all()
+    return await paginate(
+        db, listings.notifications(current_user.id, unread_only),
+        Notification.created_at, Notification.id, cursor, limit, response
+    )
+
+@app.get("/api/notifications/unread_count", response_model=NotificationUnreadCount)
+async def get_unread_notification_count(
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    # Counted from the (user_id, seen, created_at) index without reading rows
+    unread_count = await db.scalar(
+        select(func.count()).select_from(Notification).where(
+            Notification.user_id == current_user.id, Notification.seen == False
+        )
+    )
+    return {"unread_count": unread_count}
+
+def _bulk_notification_filter(user_id: int, action: NotificationBulkAction):
+    criteria = [Notification.user_id == user_id]
+    if action.ids is not None:
+        if len(action.ids) > MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} ids per request")
+        criteria.append(Notification.id.in_(action.ids))
+    return criteria
+
+@app.put("/api/notifications/read", response_model=NotificationBulkResult)
+async def mark_notifications_read(
+    action: NotificationBulkAction,
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Mark the given notifications (or all of them) as read in a single UPDATE"""
+    result = await db.execute(
+        update(Notification)
+        .where(*_bulk_notification_filter(current_user.id, action), Notification.seen == False)
+        .values(seen=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return {"affected": result.rowcount}
+
+@app.post("/api/notifications/bulk-delete", response_model=NotificationBulkResult)
+async def delete_notifications(
+    action: NotificationBulkAction,
+    current_user: User = Depends(get_current_user_db),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete the given notifications (or all of them) in a single DELETE"""
+    result = await db.execute(
+        delete(Notification)
+        .where(*_bulk_notification_filter(current_user.id, action))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return {"affected": result.rowcount}
 
 @app.put("/api/notifications/{notification_id}/read", status_code=status.HTTP_204_NO_CONTENT)
 async def mark_notification_read(
     notification_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = await db.scalar(select(Notification).where(Notification.id == notification_id))
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
 
@@ -861,26 +1366,63 @@ async def mark_notification_read(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     notification.seen = True
-    db.commit()
+    await db.commit()
     return None
 
 @app.delete("/api/notifications/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_notification(
     notification_id: int,
     current_user: User = Depends(get_current_user_db),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = await db.scalar(select(Notification).where(Notification.id == notification_id))
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
 
     if notification.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    db.delete(notification)
-    db.commit()
+    await db.delete(notification)
+    await db.commit()
     return None
 
+# ==================== REALTIME ENDPOINTS ====================
+
+@app.get("/api/events")
+async def stream_events(request: Request, token: str = Query(...)):
+    """
+    Server-Sent Events stream of the current user's task updates, messages and
+    notifications. EventSource cannot send headers, so the Firebase token is
+    passed as a query parameter.
+    """
+    # Resolve the user with a short-lived session so no pooled connection is
+    # held for the lifetime of the stream
+    async with AsyncSessionLocal() as db:
+        user = await resolve_user(token, db)
+    user_id = user.id
+    queue = event_hub.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                    yield format_sse(event)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    # Comment frame keeps proxies from closing an idle stream
+                    yield ": heartbeat\n\n"
+        finally:
+            event_hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     uvicorn.run(app, host="localhost", port=8000)
 
@@ -0,0 +1,215 @@
+"""
+Versioned schema migrations.
+
+`Base.metadata.create_all` only creates missing tables; it never adds columns or
+indexes to tables that already exist. Each migration below brings an existing
+database up to the current models and is recorded in `schema_migrations`, so it
+runs exactly once per database. Migrations check what already exists before
+changing anything, which makes them no-ops on databases freshly created from
+the models (or from mysql_schema.sql).
+
+Usage (from the backend directory):
+    python migrations.py
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, update
+
+import admin_stats
+import reputation
+from database import engine
+from geo import grid_cell
+from models import (
+    Message, Notification, NotificationOutbox, StatCounter, StatCounterDelta, Task, TaskLocation, TaskReport,
+    TaskSearchTerm, User, write_search_terms
+)
+
+BATCH_SIZE = 1000
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _add_column(connection, column):
+    """Add a model column to its (existing) table if missing"""
+    table = column.table
+    existing = {c["name"] for c in inspect(connection).get_columns(table.name)}
+    if column.name in existing:
+        return
+    column_type = column.type.compile(dialect=connection.dialect)
+    if column.server_default is not None:
+        # Existing rows take the default, so the column can be NOT NULL right away
+        column_type += f" NOT NULL DEFAULT {column.server_default.arg}"
+    connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+
+
+def _create_index(connection, index):
+    """Create a model index if a same-named index does not exist yet"""
+    existing = {i["name"] for i in inspect(connection).get_indexes(index.table.name)}
+    if index.name not in existing:
+        index.create(connection)
+
+
+def _model_index(model, name):
+    return next(index for index in model.__table__.indexes if index.name == name)
+
+
+def _add_grid_cells(connection):
+    for model, lat, lng in (
+        (Task, "location_lat", "location_lng"),
+        (TaskLocation, "lat", "lng"),
+    ):
+        table = model.__table__
+        _add_column(connection, table.c.grid_cell)
+        _create_index(connection, _model_index(model, f"ix_{table.name}_grid_cell"))
+        while True:
+            rows = connection.execute(
+                select(table.c.id, table.c[lat], table.c[lng])
+                .where(table.c.grid_cell.is_(None))
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            for row_id, row_lat, row_lng in rows:
+                connection.execute(
+                    table.update().where(table.c.id == row_id).values(grid_cell=grid_cell(row_lat, row_lng))
+                )
+
+
+def _build_search_index(connection):
+    TaskSearchTerm.__table__.create(connection, checkfirst=True)
+    tasks = Task.__table__
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(tasks.c.id, tasks.c.title, tasks.c.description)
+            .where(tasks.c.id > last_id)
+            .order_by(tasks.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for task_id, title, description in rows:
+            write_search_terms(connection, task_id, title, description)
+        last_id = rows[-1].id
+
+
+def _normalize_search_terms(connection):
+    if connection.dialect.name in ("mysql", "mariadb"):
+        connection.exec_driver_sql(
+            "ALTER TABLE task_search_terms MODIFY term VARCHAR(64) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+        )
+    # Re-index every task with case-folded, accent-free terms
+    _build_search_index(connection)
+
+
+def _add_listing_indexes(connection):
+    for model, name in (
+        (Task, "ix_tasks_status_created_id"),
+        (Task, "ix_tasks_created_id"),
+        (Task, "ix_tasks_poster_created"),
+        (Task, "ix_tasks_seeker_created"),
+        (Message, "ix_messages_task_created"),
+        (Notification, "ix_notifications_user_created_id"),
+        (Notification, "ix_notifications_user_seen_created"),
+    ):
+        _create_index(connection, _model_index(model, name))
+
+
+def _add_message_sync_index(connection):
+    _create_index(connection, _model_index(Message, "ix_messages_task_id"))
+
+
+def _create_notification_outbox(connection):
+    NotificationOutbox.__table__.create(connection, checkfirst=True)
+
+
+def _add_proof_variant_columns(connection):
+    tasks = Task.__table__
+    _add_column(connection, tasks.c.proof_thumbnail)
+    _add_column(connection, tasks.c.proof_web_image)
+
+
+def _add_reputation_columns(connection):
+    users = User.__table__
+    _add_column(connection, users.c.rating_count)
+    _add_column(connection, users.c.rating_sum)
+    _add_column(connection, users.c.completed_task_count)
+    reputation.recompute_all(connection)
+
+
+def _create_stat_counters(connection):
+    StatCounter.__table__.create(connection, checkfirst=True)
+    StatCounterDelta.__table__.create(connection, checkfirst=True)
+    if connection.execute(select(StatCounter.name).limit(1)).first() is None:
+        admin_stats.rebuild(connection)
+
+
+def _add_report_count(connection):
+    tasks = Task.__table__
+    _add_column(connection, tasks.c.report_count)
+    reports = TaskReport.__table__
+    connection.execute(
+        update(tasks)
+        .where(tasks.c.id.in_(select(reports.c.task_id)))
+        .values(report_count=select(func.count()).where(reports.c.task_id == tasks.c.id).scalar_subquery())
+    )
+
+
+def _add_user_directory_indexes(connection):
+    for name in (
+        "ix_users_created_id",
+        "ix_users_admin_created_id",
+        "ix_users_name",
+        "ix_users_first_name",
+        "ix_users_last_name",
+    ):
+        _create_index(connection, _model_index(User, name))
+
+
+def _add_export_indexes(connection):
+    _create_index(connection, _model_index(Task, "ix_tasks_updated_id"))
+    _create_index(connection, _model_index(TaskReport, "ix_task_reports_created_id"))
+
+
+MIGRATIONS = [
+    (1, "Add grid_cell columns for nearby task search", _add_grid_cells),
+    (2, "Create and backfill the task_search_terms index", _build_search_index),
+    (3, "Add composite indexes for listing filters", _add_listing_indexes),
+    (4, "Add (task_id, id) index for incremental message sync", _add_message_sync_index),
+    (5, "Create the notification_outbox table", _create_notification_outbox),
+    (6, "Add proof image variant columns", _add_proof_variant_columns),
+    (7, "Add and seed the user reputation aggregate columns", _add_reputation_columns),
+    (8, "Create and seed the admin statistics counters", _create_stat_counters),
+    (9, "Add and backfill tasks.report_count", _add_report_count),
+    (10, "Add indexes for the admin user directory", _add_user_directory_indexes),
+    (11, "Add (updated_at, id) and (created_at, id) indexes for incremental exports", _add_export_indexes),
+    (12, "Use a binary collation and normalized terms for task_search_terms", _normalize_search_terms),
+]
+
+
+def run_migrations(bind=engine):
+    """Apply every migration not yet recorded in schema_migrations"""
+    schema_migrations.create(bind, checkfirst=True)
+    with bind.connect() as connection:
+        applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+    for version, description, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        with bind.begin() as connection:
+            migrate(connection)
+            connection.execute(
+                schema_migrations.insert().values(
+                    version=version, description=description, applied_at=datetime.utcnow()
+                )
+            )
+        print(f"DEBUG: Applied migration {version}: {description}")
+
+
+if __name__ == "__main__":
+    run_migrations()
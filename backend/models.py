@@ -1,10 +1,22 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, Index
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
+from geo import grid_cell
+from fulltext import term_weights
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin directory: newest-first pages, optionally only admins, and prefix search
+        # (email is covered by its unique index)
+        Index("ix_users_created_id", "created_at", "id"),
+        Index("ix_users_admin_created_id", "is_admin", "created_at", "id"),
+        Index("ix_users_name", "name"),
+        Index("ix_users_first_name", "first_name"),
+        Index("ix_users_last_name", "last_name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     firebase_uid = Column(String, unique=True, index=True, nullable=False)
@@ -18,6 +30,14 @@ class User(Base):
     phone = Column(String, nullable=True)
     is_admin = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Reputation aggregates, maintained incrementally (see reputation.py)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.rating_count if self.rating_count else None
     
     # Relationships
     posted_tasks = relationship("Task", foreign_keys="Task.poster_id", back_populates="poster")
@@ -29,6 +49,15 @@ class User(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Listings filter by status/poster/seeker and page newest-first by (created_at, id)
+        Index("ix_tasks_status_created_id", "status", "created_at", "id"),
+        Index("ix_tasks_created_id", "created_at", "id"),
+        Index("ix_tasks_poster_created", "poster_id", "created_at"),
+        Index("ix_tasks_seeker_created", "seeker_id", "created_at"),
+        # Incremental exports read tasks in (updated_at, id) order
+        Index("ix_tasks_updated_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -38,6 +67,8 @@ class Task(Base):
     location_lat = Column(Float, nullable=False)
     location_lng = Column(Float, nullable=False)
     location_address = Column(String, nullable=True)
+    # Grid cell of the primary location (see geo.py); maintained by the listeners below
+    grid_cell = Column(String(32), index=True, nullable=True)
     schedule = Column(DateTime, nullable=True)
     status = Column(String, default="available")  # available, ongoing, pending_confirmation, completed, cancelled
     poster_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -45,6 +76,11 @@ class Task(Base):
     accepted_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     proof_image = Column(String, nullable=True)
+    # Resized, metadata-free copies of proof_image (see images.py); set once generated
+    proof_thumbnail = Column(String(255), nullable=True)
+    proof_web_image = Column(String(255), nullable=True)
+    # Number of task_reports rows; kept in step by the report endpoints (jobs.py reconcile-report-counts)
+    report_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -60,6 +96,10 @@ class Task(Base):
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_task_created", "task_id", "created_at"),
+        Index("ix_messages_task_id", "task_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
@@ -90,6 +130,9 @@ class Feedback(Base):
 
 class TaskReport(Base):
     __tablename__ = "task_reports"
+    __table_args__ = (
+        Index("ix_task_reports_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
@@ -104,6 +147,10 @@ class TaskReport(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_notifications_user_seen_created", "user_id", "seen", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -119,6 +166,36 @@ class Notification(Base):
     task = relationship("Task", foreign_keys=[task_id], back_populates="notifications")
 
 
+class NotificationOutbox(Base):
+    """Notifications written in the caller's transaction, delivered later by the outbox dispatcher"""
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    task_id = Column(Integer, nullable=True)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    notif_type = Column(String(40), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class StatCounter(Base):
+    """Folded value of an admin dashboard counter (see admin_stats.py)"""
+    __tablename__ = "stat_counters"
+
+    name = Column(String(64), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class StatCounterDelta(Base):
+    """Counter change written in the transaction that caused it, not yet folded into stat_counters"""
+    __tablename__ = "stat_counter_deltas"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+    delta = Column(Integer, nullable=False)
+
+
 class TaskLocation(Base):
     __tablename__ = "task_locations"
 
@@ -127,11 +204,68 @@ class TaskLocation(Base):
     lat = Column(Float, nullable=False)
     lng = Column(Float, nullable=False)
     address = Column(String, nullable=True)
+    grid_cell = Column(String(32), index=True, nullable=True)
     idx = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     task = relationship("Task", back_populates="locations")
 
+class TaskSearchTerm(Base):
+    """Inverted index posting: a term occurring in a task's title/description (see fulltext.py)"""
+    __tablename__ = "task_search_terms"
+
+    # Binary collation on MySQL: the key compares terms exactly as Python does, so two
+    # distinct tokens of one task never collide under a case/accent-insensitive collation
+    term = Column(String(64).with_variant(String(64, collation="utf8mb4_bin"), "mysql", "mariadb"), primary_key=True)
+    task_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True, index=True)
+    weight = Column(Integer, nullable=False)
+
 # Relationship from Task -> TaskLocation (ordered by idx)
 Task.locations = relationship("TaskLocation", back_populates="task", cascade="all, delete-orphan", order_by="TaskLocation.idx")
+
+
+# Keep grid_cell in sync with coordinates on every ORM insert/update
+@event.listens_for(Task, "before_insert")
+@event.listens_for(Task, "before_update")
+def _set_task_grid_cell(mapper, connection, target):
+    if target.location_lat is not None and target.location_lng is not None:
+        target.grid_cell = grid_cell(target.location_lat, target.location_lng)
+
+
+@event.listens_for(TaskLocation, "before_insert")
+@event.listens_for(TaskLocation, "before_update")
+def _set_location_grid_cell(mapper, connection, target):
+    if target.lat is not None and target.lng is not None:
+        target.grid_cell = grid_cell(target.lat, target.lng)
+
+
+def write_search_terms(connection, task_id, title, description):
+    """Replace the search index postings of one task"""
+    table = TaskSearchTerm.__table__
+    connection.execute(table.delete().where(table.c.task_id == task_id))
+    rows = [
+        {"term": term, "task_id": task_id, "weight": weight}
+        for term, weight in term_weights(title, description).items()
+    ]
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+# Keep the search index in the same transaction as task writes
+@event.listens_for(Task, "after_insert")
+def _index_new_task(mapper, connection, target):
+    write_search_terms(connection, target.id, target.title, target.description)
+
+
+@event.listens_for(Task, "after_update")
+def _reindex_task(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.title.history.has_changes() or state.attrs.description.history.has_changes():
+        write_search_terms(connection, target.id, target.title, target.description)
+
+
+@event.listens_for(Task, "before_delete")
+def _unindex_task(mapper, connection, target):
+    table = TaskSearchTerm.__table__
+    connection.execute(table.delete().where(table.c.task_id == target.id))
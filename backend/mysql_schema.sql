@@ -17,9 +17,17 @@ CREATE TABLE IF NOT EXISTS `users` (
   `phone` VARCHAR(64) NULL,
   `is_admin` TINYINT(1) NOT NULL DEFAULT 0,
   `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `rating_count` INT NOT NULL DEFAULT 0,
+  `rating_sum` INT NOT NULL DEFAULT 0,
+  `completed_task_count` INT NOT NULL DEFAULT 0,
   PRIMARY KEY (`id`),
   UNIQUE KEY `uid_unique` (`firebase_uid`),
-  UNIQUE KEY `email_unique` (`email`)
+  UNIQUE KEY `email_unique` (`email`),
+  KEY `ix_users_created_id` (`created_at`, `id`),
+  KEY `ix_users_admin_created_id` (`is_admin`, `created_at`, `id`),
+  KEY `ix_users_name` (`name`),
+  KEY `ix_users_first_name` (`first_name`),
+  KEY `ix_users_last_name` (`last_name`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 CREATE TABLE IF NOT EXISTS `tasks` (
@@ -31,17 +39,28 @@ CREATE TABLE IF NOT EXISTS `tasks` (
   `location_lat` DOUBLE NOT NULL,
   `location_lng` DOUBLE NOT NULL,
   `location_address` VARCHAR(255) NULL,
+  `grid_cell` VARCHAR(32) NULL,
   `schedule` DATETIME NULL,
   `status` VARCHAR(40) NOT NULL DEFAULT 'available',
   `poster_id` INT NOT NULL,
   `seeker_id` INT NULL,
   `accepted_at` DATETIME NULL,
   `completed_at` DATETIME NULL,
+  `proof_image` VARCHAR(255) NULL,
+  `proof_thumbnail` VARCHAR(255) NULL,
+  `proof_web_image` VARCHAR(255) NULL,
+  `report_count` INT NOT NULL DEFAULT 0,
   `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   PRIMARY KEY (`id`),
   KEY `poster_idx` (`poster_id`),
   KEY `seeker_idx` (`seeker_id`),
+  KEY `ix_tasks_grid_cell` (`grid_cell`),
+  KEY `ix_tasks_status_created_id` (`status`, `created_at`, `id`),
+  KEY `ix_tasks_created_id` (`created_at`, `id`),
+  KEY `ix_tasks_poster_created` (`poster_id`, `created_at`),
+  KEY `ix_tasks_seeker_created` (`seeker_id`, `created_at`),
+  KEY `ix_tasks_updated_id` (`updated_at`, `id`),
   CONSTRAINT `fk_tasks_poster` FOREIGN KEY (`poster_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_tasks_seeker` FOREIGN KEY (`seeker_id`) REFERENCES `users` (`id`) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -55,6 +74,8 @@ CREATE TABLE IF NOT EXISTS `messages` (
   PRIMARY KEY (`id`),
   KEY `task_idx` (`task_id`),
   KEY `sender_idx` (`sender_id`),
+  KEY `ix_messages_task_created` (`task_id`, `created_at`),
+  KEY `ix_messages_task_id` (`task_id`, `id`),
   CONSTRAINT `fk_messages_task` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_messages_sender` FOREIGN KEY (`sender_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -76,17 +97,81 @@ CREATE TABLE IF NOT EXISTS `feedback` (
   CONSTRAINT `fk_feedback_seeker` FOREIGN KEY (`seeker_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+CREATE TABLE IF NOT EXISTS `task_reports` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `task_id` INT NOT NULL,
+  `reporter_id` INT NOT NULL,
+  `report_type` VARCHAR(40) NOT NULL,
+  `description` TEXT NULL,
+  `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  KEY `task_idx` (`task_id`),
+  KEY `reporter_idx` (`reporter_id`),
+  KEY `ix_task_reports_created_id` (`created_at`, `id`),
+  CONSTRAINT `fk_task_reports_task` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE,
+  CONSTRAINT `fk_task_reports_reporter` FOREIGN KEY (`reporter_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS `notifications` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `user_id` INT NOT NULL,
+  `task_id` INT NULL,
+  `title` VARCHAR(255) NOT NULL,
+  `message` TEXT NOT NULL,
+  `notif_type` VARCHAR(40) NOT NULL,
+  `seen` TINYINT(1) NOT NULL DEFAULT 0,
+  `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  KEY `ix_notifications_user_created_id` (`user_id`, `created_at`, `id`),
+  KEY `ix_notifications_user_seen_created` (`user_id`, `seen`, `created_at`),
+  CONSTRAINT `fk_notifications_user` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+  CONSTRAINT `fk_notifications_task` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS `notification_outbox` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `user_id` INT NOT NULL,
+  `task_id` INT NULL,
+  `title` VARCHAR(255) NOT NULL,
+  `message` TEXT NOT NULL,
+  `notif_type` VARCHAR(40) NOT NULL,
+  `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS `stat_counters` (
+  `name` VARCHAR(64) NOT NULL,
+  `value` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS `stat_counter_deltas` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `name` VARCHAR(64) NOT NULL,
+  `delta` INT NOT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 CREATE TABLE IF NOT EXISTS `task_locations` (
   `id` INT NOT NULL AUTO_INCREMENT,
   `task_id` INT NOT NULL,
   `lat` DOUBLE NOT NULL,
   `lng` DOUBLE NOT NULL,
   `address` VARCHAR(255) NULL,
+  `grid_cell` VARCHAR(32) NULL,
   `idx` INT NOT NULL DEFAULT 0,
   `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`id`),
   KEY `task_idx` (`task_id`),
+  KEY `ix_task_locations_grid_cell` (`grid_cell`),
   CONSTRAINT `fk_task_locations_task` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
-
+CREATE TABLE IF NOT EXISTS `task_search_terms` (
+  `term` VARCHAR(64) COLLATE utf8mb4_bin NOT NULL,
+  `task_id` INT NOT NULL,
+  `weight` INT NOT NULL,
+  PRIMARY KEY (`term`, `task_id`),
+  KEY `ix_task_search_terms_task_id` (`task_id`),
+  CONSTRAINT `fk_task_search_terms_task` FOREIGN KEY (`task_id`) REFERENCES `tasks` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
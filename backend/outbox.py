@@ -0,0 +1,157 @@
+"""
+Transactional outbox for notifications.
+
+Endpoints call `queue_notification` before their own commit, so the outbox row
+is written in the same transaction as the change it reports (one commit per
+request, and no notification for a change that rolled back). The dispatcher
+runs in the background: it moves outbox rows into `notifications` in batches,
+one transaction per batch, then pushes each new notification to the
+recipient's event streams. It is woken right after a commit that queued
+something and otherwise polls, so rows left behind by a restart or by another
+worker are still delivered.
+"""
+import asyncio
+import os
+from typing import Optional
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database import AsyncSessionLocal
+from models import Notification, NotificationOutbox, Task
+from realtime import event_hub
+from schemas import NotificationResponse
+
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "1"))
+
+# Session.info flag set when a session has queued outbox rows
+_PENDING = "notification_outbox_pending"
+
+
+def queue_notification(db: AsyncSession, user_id: int, title: str, message: str, notif_type: str, task_id: Optional[int] = None):
+    """Add a notification to the caller's transaction; it is delivered after the caller commits"""
+    db.add(NotificationOutbox(
+        user_id=user_id,
+        task_id=task_id,
+        title=title,
+        message=message,
+        notif_type=notif_type
+    ))
+    db.info[_PENDING] = True
+
+
+class OutboxDispatcher:
+    """Background task draining notification_outbox into notifications"""
+
+    def __init__(self, session_factory=AsyncSessionLocal, batch_size: int = OUTBOX_BATCH_SIZE, poll_seconds: float = OUTBOX_POLL_SECONDS):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._wake: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._wake = asyncio.Event()
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        # Deliver what is already queued; anything left is picked up on the next start
+        try:
+            await self.drain()
+        except Exception as e:
+            print(f"ERROR: Notification outbox drain on shutdown failed: {e}")
+
+    def wake(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.drain()
+            except Exception as e:
+                print(f"ERROR: Notification outbox dispatch failed: {e}")
+
+    async def drain(self) -> int:
+        """Dispatch batches until the outbox is empty; returns the number of rows handled"""
+        total = 0
+        while True:
+            handled = await self.dispatch_batch()
+            total += handled
+            if handled < self.batch_size:
+                return total
+
+    async def dispatch_batch(self) -> int:
+        async with self.session_factory() as db:
+            # SKIP LOCKED lets several workers drain the outbox without double delivery
+            # (ignored on SQLite, which serializes writers anyway)
+            rows = (await db.scalars(
+                select(NotificationOutbox)
+                .order_by(NotificationOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )).all()
+            if not rows:
+                return 0
+
+            # Drop notifications about tasks deleted since they were queued
+            task_ids = {row.task_id for row in rows if row.task_id is not None}
+            live_task_ids = set()
+            if task_ids:
+                live_task_ids = set((await db.scalars(select(Task.id).where(Task.id.in_(task_ids)))).all())
+
+            notifications = [
+                Notification(
+                    user_id=row.user_id,
+                    task_id=row.task_id,
+                    title=row.title,
+                    message=row.message,
+                    notif_type=row.notif_type,
+                    seen=False,
+                    created_at=row.created_at
+                )
+                for row in rows
+                if row.task_id is None or row.task_id in live_task_ids
+            ]
+            db.add_all(notifications)
+            await db.execute(
+                delete(NotificationOutbox)
+                .where(NotificationOutbox.id.in_([row.id for row in rows]))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+        for notification in notifications:
+            await event_hub.publish([notification.user_id], {
+                "type": "notification",
+                "notification": NotificationResponse.model_validate(notification).model_dump(mode="json")
+            })
+        return len(rows)
+
+
+outbox_dispatcher = OutboxDispatcher()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session):
+    if session.info.pop(_PENDING, False):
+        outbox_dispatcher.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING, None)
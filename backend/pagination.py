@@ -0,0 +1,100 @@
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_
+
+# Page size used when the client does not pass `limit`, and the hard cap on it
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode(*values) -> str:
+    raw = "|".join(str(value) for value in values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str, parts: int) -> List[str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    values = base64.urlsafe_b64decode(padded).decode().split("|")
+    if len(values) != parts:
+        raise ValueError("wrong number of cursor parts")
+    return values
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) position as an opaque URL-safe cursor"""
+    return _encode(created_at.isoformat(), row_id)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor; raises 400 on malformed input"""
+    try:
+        created_at, row_id = _decode(cursor, 2)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_rank_cursor(score: int, row_id: int) -> str:
+    """Encode a (relevance score, id) position for ranked result lists"""
+    return _encode(score, row_id)
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a cursor produced by encode_rank_cursor; raises 400 on malformed input"""
+    try:
+        score, row_id = _decode(cursor, 2)
+        return int(score), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(statement, created_column, id_column, cursor: Optional[str], limit: int):
+    """
+    Order a select() newest first by (created_at, id) and limit it to one page
+    plus one row, starting after the cursor (the last row of the previous page).
+    """
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                created_column < after_created,
+                and_(created_column == after_created, id_column < after_id),
+            )
+        )
+    return statement.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+async def paginate(
+    db,
+    statement,
+    created_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    response: Optional[Response] = None,
+) -> List[Any]:
+    """
+    Apply newest-first keyset pagination to a select() of ORM entities and run it.
+
+    Rows are ordered by (created_at desc, id desc) and the cursor marks the last
+    row of the previous page, so each page is a bounded index range scan instead
+    of an OFFSET over (or a full load of) the table. One extra row is fetched to
+    detect whether another page exists; if so its cursor is set on the response.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    statement = keyset_page(statement, created_column, id_column, cursor, limit)
+    rows = (await db.scalars(statement)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if response is not None:
+            last = rows[-1]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                getattr(last, created_column.key), getattr(last, id_column.key)
+            )
+    return rows
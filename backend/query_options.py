@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from models import Task
+
+
+def task_response_options():
+    """
+    Loader options for queries whose results are serialized as TaskResponse.
+
+    TaskResponse reads poster, seeker, feedback and locations from each Task;
+    left lazy, every one of them costs a SELECT per task during serialization.
+    selectinload fetches each relationship for the whole result in one
+    `IN (...)` query, so a list request issues a constant number of statements
+    no matter how many tasks it returns. Keep this in sync with TaskResponse.
+    """
+    return (
+        selectinload(Task.poster),
+        selectinload(Task.seeker),
+        selectinload(Task.feedback),
+        selectinload(Task.locations),
+    )
+
+
+async def load_task(db, task_id: int):
+    """
+    (Re)load one task with everything TaskResponse serializes.
+
+    Async sessions cannot lazy-load during response serialization, so write
+    endpoints return this instead of the instance they modified.
+    """
+    return await db.scalar(
+        select(Task)
+        .options(*task_response_options())
+        .where(Task.id == task_id)
+        .execution_options(populate_existing=True)
+    )
@@ -0,0 +1,126 @@
+"""
+Per-user push channel (Server-Sent Events) fed by an in-process pub/sub hub.
+
+Endpoints publish events after they commit (task status changes, new messages,
+new notifications); every open event stream of the affected users receives them.
+With several worker processes, set REALTIME_BROKER_URL to a Redis URL so events
+published on one worker reach streams held by the others.
+"""
+import asyncio
+import json
+import os
+from typing import Dict, Iterable, Optional, Set
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - only needed for multi-worker deployments
+    aioredis = None
+
+REALTIME_BROKER_URL = os.getenv("REALTIME_BROKER_URL", "")
+REALTIME_CHANNEL = "taskerrand:events"
+# Events buffered per open stream before the oldest are dropped (slow or stalled client)
+SUBSCRIBER_QUEUE_SIZE = 100
+HEARTBEAT_SECONDS = 15
+
+
+class InProcessBroker:
+    """Delivers events to subscribers in this process only (single worker)"""
+
+    def __init__(self):
+        self._deliver = None
+
+    async def start(self, deliver) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    async def publish(self, user_id: int, event: Dict) -> None:
+        if self._deliver:
+            self._deliver(user_id, event)
+
+
+class RedisBroker:
+    """Fans events out through Redis pub/sub so every worker's subscribers receive them"""
+
+    def __init__(self, url: str):
+        if aioredis is None:
+            raise RuntimeError("REALTIME_BROKER_URL is set but the 'redis' package is not installed")
+        self._redis = aioredis.from_url(url)
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, deliver) -> None:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(REALTIME_CHANNEL)
+
+        async def listen():
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    payload = json.loads(message["data"])
+                    deliver(payload["user_id"], payload["event"])
+                except Exception as e:
+                    print(f"ERROR: Dropping malformed realtime event: {e}")
+
+        self._listener = asyncio.create_task(listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+        await self._redis.close()
+
+    async def publish(self, user_id: int, event: Dict) -> None:
+        await self._redis.publish(REALTIME_CHANNEL, json.dumps({"user_id": user_id, "event": event}, default=str))
+
+
+class EventHub:
+    """Tracks the open event streams per user and routes published events to them"""
+
+    def __init__(self, broker=None):
+        self.broker = broker or InProcessBroker()
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+
+    async def start(self) -> None:
+        await self.broker.start(self._deliver)
+
+    async def stop(self) -> None:
+        await self.broker.stop()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def _deliver(self, user_id: int, event: Dict) -> None:
+        for queue in self._subscribers.get(user_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def publish(self, user_ids: Iterable[Optional[int]], event: Dict) -> None:
+        """Send an event to every open stream of the given users (None ids are ignored)"""
+        for user_id in {user_id for user_id in user_ids if user_id}:
+            try:
+                await self.broker.publish(user_id, event)
+            except Exception as e:
+                # Push is best effort; clients resync from the REST API
+                print(f"ERROR: Failed to publish realtime event: {e}")
+
+
+def format_sse(event: Dict) -> str:
+    """Encode an event as one Server-Sent Events frame"""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+event_hub = EventHub(RedisBroker(REALTIME_BROKER_URL) if REALTIME_BROKER_URL else InProcessBroker())
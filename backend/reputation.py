@@ -0,0 +1,70 @@
+"""
+Per-user reputation aggregates.
+
+users.rating_count, users.rating_sum and users.completed_task_count summarize a
+seeker's feedback and finished tasks, so a profile shows the average rating
+without reading every feedback row. They are changed with in-place increments
+(rating_count = rating_count + 1) in the same transaction as the write that
+affects them: leaving feedback, confirming a task, changing a task's status by
+hand, and deleting a task. Concurrent updates therefore never overwrite each
+other, and a rolled-back write leaves the aggregates untouched.
+
+Migration 7 computes them for existing data; `python jobs.py backfill-reputation`
+recomputes them from the underlying rows for data changed outside the API.
+
+The functions run in the caller's transaction and do not commit.
+"""
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Feedback, Task, User
+from task_states import COMPLETED
+
+
+async def _increment(db: AsyncSession, user_id: int, **deltas: int) -> None:
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values({getattr(User, name): getattr(User, name) + delta for name, delta in deltas.items()})
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def record_rating(db: AsyncSession, seeker_id: int, rating: int) -> None:
+    """Count a new feedback rating for the seeker"""
+    await _increment(db, seeker_id, rating_count=1, rating_sum=rating)
+
+
+async def record_status_change(db: AsyncSession, seeker_id, old_status: str, new_status: str) -> None:
+    """Adjust the seeker's completed task count when a task enters or leaves 'completed'"""
+    if not seeker_id or (old_status == COMPLETED) == (new_status == COMPLETED):
+        return
+    await _increment(db, seeker_id, completed_task_count=1 if new_status == COMPLETED else -1)
+
+
+async def remove_task(db: AsyncSession, task: Task) -> None:
+    """Take a task that is about to be deleted (with its feedback) out of its seeker's aggregates"""
+    if task.seeker_id and task.status == COMPLETED:
+        await _increment(db, task.seeker_id, completed_task_count=-1)
+    feedback = (await db.execute(
+        select(Feedback.seeker_id, Feedback.rating).where(Feedback.task_id == task.id)
+    )).first()
+    if feedback:
+        await _increment(db, feedback.seeker_id, rating_count=-1, rating_sum=-feedback.rating)
+
+
+def recompute_all(connection) -> int:
+    """Recompute every user's aggregates from feedback and tasks (Connection or sync Session; the caller commits); returns users updated"""
+    def per_user(column, *conditions):
+        return select(column).where(*conditions).scalar_subquery()
+
+    result = connection.execute(
+        update(User)
+        .values(
+            rating_count=per_user(func.count(Feedback.id), Feedback.seeker_id == User.id),
+            rating_sum=per_user(func.coalesce(func.sum(Feedback.rating), 0), Feedback.seeker_id == User.id),
+            completed_task_count=per_user(func.count(Task.id), Task.seeker_id == User.id, Task.status == COMPLETED),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
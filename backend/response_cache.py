@@ -0,0 +1,243 @@
+"""
+Cache of serialized responses for public read endpoints.
+
+Entries hold the final JSON body (and any headers such as X-Next-Cursor), so a
+hit skips both the database and Pydantic serialization. Each entry carries
+tags naming the data it was built from ("task:42", "user:7", "tasks:available"),
+and write endpoints invalidate exactly those tags after they commit. The TTL
+bounds staleness for writes that bypass the API.
+
+A read that races a write could otherwise compute its response before the
+commit and store it after the invalidation. Every invalidation therefore stamps
+its tags with the next value of a counter; readers take snapshot() before
+querying, and put() discards the entry if any of its tags was stamped later.
+
+Backends:
+  memory  per-process LRU with TTL (default). With several workers, a write
+          only invalidates the worker that handled it; others serve the old
+          entry until it expires.
+  redis   shared by all workers when RESPONSE_CACHE_URL is set (requires the
+          'redis' package; any client with the same async API, such as a fake,
+          can be passed to RedisBackend).
+"""
+import json
+import os
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from fastapi import Response
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - only needed for a shared cache
+    aioredis = None
+
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "")
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "5000"))
+# How long Redis remembers a tag's last invalidation; a read slower than this
+# may still store a stale entry (until the TTL)
+INVALIDATION_MEMORY_SECONDS = 300
+
+# (body, headers)
+Entry = Tuple[bytes, Dict[str, str]]
+
+
+class MemoryBackend:
+    """LRU of entries in this process, with a tag -> keys index for invalidation"""
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Entry, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+        self._clock = 0
+        # tag -> clock value of its last invalidation, least recent first. Bounded;
+        # _floor is the newest stamp forgotten, and snapshots older than it are refused
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._floor = 0
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[Entry]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        if item[0] <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return item[1]
+
+    async def clock(self) -> int:
+        return self._clock
+
+    async def set(self, key: str, entry: Entry, tags: Tuple[str, ...], ttl: int, since: int) -> None:
+        # No await between this check and the store, so no invalidation can slip in
+        if since < self._floor or any(self._invalidated.get(tag, 0) > since for tag in tags):
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + ttl, entry, tags)
+        for tag in tags:
+            self._tags[tag].add(key)
+        while len(self._entries) > self.max_size:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        self._clock += 1
+        for tag in tags:
+            self._invalidated[tag] = self._clock
+            self._invalidated.move_to_end(tag)
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+        while len(self._invalidated) > self.max_size:
+            _, self._floor = self._invalidated.popitem(last=False)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """
+    Entries in Redis (SETEX), with one set per tag listing the keys that carry it.
+    The invalidation clock is a shared counter and each tag's stamp a key of its own.
+    """
+
+    PREFIX = "taskerrand:cache:"
+    CLOCK_KEY = PREFIX + "clock"
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[Entry]:
+        raw = await self.client.get(self.PREFIX + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return data["body"].encode(), data["headers"]
+
+    async def clock(self) -> int:
+        return int(await self.client.get(self.CLOCK_KEY) or 0)
+
+    async def set(self, key: str, entry: Entry, tags: Tuple[str, ...], ttl: int, since: int) -> None:
+        body, headers = entry
+        await self.client.set(self.PREFIX + key, json.dumps({"body": body.decode(), "headers": headers}), ex=ttl)
+        for tag in tags:
+            tag_key = f"{self.PREFIX}tag:{tag}"
+            await self.client.sadd(tag_key, key)
+            await self.client.expire(tag_key, ttl)
+        # Checked after storing: an invalidation stamps its tags before deleting their
+        # keys, so it either deletes this entry or is seen here and the entry dropped
+        stamps = await self.client.mget([f"{self.PREFIX}stamp:{tag}" for tag in tags]) if tags else []
+        if any(stamp is not None and int(stamp) > since for stamp in stamps):
+            await self.client.delete(self.PREFIX + key)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        if not tags:
+            return
+        stamp = await self.client.incr(self.CLOCK_KEY)
+        for tag in tags:
+            await self.client.set(f"{self.PREFIX}stamp:{tag}", stamp, ex=INVALIDATION_MEMORY_SECONDS)
+            tag_key = f"{self.PREFIX}tag:{tag}"
+            keys = await self.client.smembers(tag_key)
+            names = [self.PREFIX + (k.decode() if isinstance(k, bytes) else k) for k in keys]
+            await self.client.delete(tag_key, *names)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class ResponseCache:
+    def __init__(self, backend=None, ttl: int = RESPONSE_CACHE_TTL_SECONDS):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        # Hits and misses per namespace (the part of the key before the first ':')
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    async def get(self, key: str) -> Optional[Response]:
+        """Cached response for key, or None on a miss"""
+        namespace = key.split(":", 1)[0]
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            print(f"ERROR: Response cache read failed: {e}")
+            entry = None
+        if entry is None:
+            self.misses[namespace] += 1
+            return None
+        self.hits[namespace] += 1
+        body, headers = entry
+        return Response(content=body, media_type="application/json", headers={**headers, "X-Cache": "HIT"})
+
+    async def snapshot(self) -> Optional[int]:
+        """Invalidation clock to pass to put(); take it before reading what the response is built from"""
+        try:
+            return await self.backend.clock()
+        except Exception as e:
+            print(f"ERROR: Response cache read failed: {e}")
+            return None
+
+    async def put(
+        self, key: str, content, tags: Iterable[Optional[str]], since: Optional[int],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Store JSON-compatible content (e.g. model_dump(mode="json") output) under key,
+        unless one of its tags (None tags are ignored) was invalidated after the
+        `since` snapshot
+        """
+        if since is None:
+            return
+        body = json.dumps(content, separators=(",", ":")).encode()
+        try:
+            await self.backend.set(key, (body, headers or {}), tuple(tag for tag in tags if tag), self.ttl, since)
+        except Exception as e:
+            print(f"ERROR: Response cache write failed: {e}")
+
+    async def invalidate(self, *tags: Optional[str]) -> None:
+        """Drop every entry built from any of the tags (None tags are ignored)"""
+        try:
+            await self.backend.invalidate([tag for tag in tags if tag])
+        except Exception as e:
+            print(f"ERROR: Response cache invalidation failed: {e}")
+
+    def stats(self) -> Dict:
+        namespaces = {}
+        for namespace in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits[namespace], self.misses[namespace]
+            namespaces[namespace] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            }
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "backend": "redis" if isinstance(self.backend, RedisBackend) else "memory",
+            "size": self.backend.size(),
+            "ttl_seconds": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "endpoints": namespaces,
+        }
+
+
+def _create_backend():
+    if not RESPONSE_CACHE_URL:
+        return MemoryBackend()
+    if aioredis is None:
+        raise RuntimeError("RESPONSE_CACHE_URL is set but the 'redis' package is not installed")
+    return RedisBackend(aioredis.from_url(RESPONSE_CACHE_URL))
+
+
+response_cache = ResponseCache(_create_backend())
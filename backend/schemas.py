@@ -1,7 +1,8 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from typing import List
-from datetime import datetime
+from typing import Any, Dict
+from datetime import date, datetime
 
 # User Schemas
 class UserBase(BaseModel):
@@ -57,6 +58,24 @@ class UserResponse(UserBase):
     contact_number: Optional[str] = None
     is_admin: bool
     created_at: datetime
+    # Reputation as a seeker
+    rating_count: int = 0
+    rating_sum: int = 0
+    average_rating: Optional[float] = None
+    completed_task_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class UserSummary(BaseModel):
+    """Compact public user info embedded in task responses"""
+    id: int
+    email: str
+    name: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    photo_url: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -121,6 +140,31 @@ class TaskCreate(TaskBase):
     locations: Optional[List[TaskLocationIn]] = None
 
 
+class TaskBatchCreate(BaseModel):
+    # TaskCreate payloads; each is validated separately so one bad item does not reject the rest
+    tasks: List[Any]
+
+
+class TaskBatchItemResult(BaseModel):
+    # Position of the item in the request (or the row in an import file, counting from 0)
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class TaskBatchResult(BaseModel):
+    created: int
+    failed: int
+    results: List[TaskBatchItemResult]
+
+
+class TaskImportResult(BaseModel):
+    created: int
+    failed: int
+    # The first failures only (see task_import.MAX_REPORTED_ERRORS)
+    errors: List[TaskBatchItemResult]
+
+
 class TaskUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -139,10 +183,14 @@ class TaskResponse(TaskBase):
     id: int
     status: str
     poster_id: int
+    poster: Optional[UserSummary] = None
     seeker_id: Optional[int] = None
     seeker: Optional[UserResponse] = None
     proof_image: Optional[str] = None
-    report_count: Optional[int] = 0
+    # Small and web-sized variants of proof_image; null until they have been generated
+    proof_thumbnail: Optional[str] = None
+    proof_web_image: Optional[str] = None
+    report_count: int = 0
     accepted_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     created_at: datetime
@@ -154,6 +202,20 @@ class TaskResponse(TaskBase):
         from_attributes = True
 
 
+class UserTaskStats(BaseModel):
+    # Tasks the user posted / is the seeker of, tasks completed as seeker, and
+    # ongoing or pending-confirmation tasks on either side
+    posted: int
+    accepted: int
+    completed: int
+    active: int
+
+
+class NearbyTaskResponse(TaskResponse):
+    # Distance from the search point to the task's closest stop
+    distance_km: float
+
+
 # Message Schemas
 class MessageBase(BaseModel):
     content: str
@@ -209,3 +271,34 @@ class NotificationResponse(NotificationBase):
 
     class Config:
         from_attributes = True
+
+
+class NotificationBulkAction(BaseModel):
+    # Notifications to act on; omit to act on all of the current user's notifications
+    ids: Optional[List[int]] = None
+
+
+class NotificationUnreadCount(BaseModel):
+    unread_count: int
+
+
+class NotificationBulkResult(BaseModel):
+    affected: int
+
+
+# Admin Schemas
+class DailyVolume(BaseModel):
+    day: date
+    tasks_created: int
+    tasks_completed: int
+    users_created: int
+    reports_created: int
+
+
+class AdminStats(BaseModel):
+    total_tasks: int
+    tasks_by_status: Dict[str, int]
+    total_users: int
+    total_reports: int
+    # Oldest day first, today last
+    daily: List[DailyVolume]
@@ -0,0 +1,185 @@
+"""
+Storage backends for uploaded files, and the /uploads route that serves them.
+
+Uploads are addressed by a key relative to the uploads root (for example
+"proofs/<sha256>.jpg") and exposed at /uploads/<key>. Stored files never
+change: new content gets a new name. So responses carry a strong ETag and a
+year-long immutable Cache-Control, and browsers and CDNs never revalidate them.
+
+Backends (UPLOAD_STORAGE):
+  local  files under uploads/ on this node, served with Range support and
+         zero-copy delivery where the ASGI server supports it (default)
+  s3     an S3-compatible bucket (AWS, or MinIO / another local stand-in via
+         S3_ENDPOINT_URL). API nodes keep no files; /uploads/<key> redirects to
+         a presigned object URL. Requires boto3.
+"""
+import mimetypes
+import os
+import re
+import shutil
+import stat as stat_module
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import boto3
+except ImportError:  # pragma: no cover - only needed for UPLOAD_STORAGE=s3
+    boto3 = None
+
+UPLOAD_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'uploads'))
+UPLOAD_STORAGE = os.getenv("UPLOAD_STORAGE", "local")
+S3_BUCKET = os.getenv("S3_BUCKET", "")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL") or None
+S3_PRESIGN_SECONDS = int(os.getenv("S3_PRESIGN_SECONDS", "3600"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Content-addressed names start with the SHA-256 of the uploaded file
+_DIGEST_NAME = re.compile(r"^[0-9a-f]{64}")
+
+
+def _content_type(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+def _etag(key: str, stat: os.stat_result) -> str:
+    name = os.path.basename(key)
+    if _DIGEST_NAME.match(name):
+        # The name embeds the content hash (variants add a suffix to their source's)
+        return f'"{name}"'
+    # Older uploads (uuid names) are also never rewritten; size and mtime identify them
+    return f'"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match header value ("*" or a comma-separated list of tags)
+    matches etag, using the weak comparison the header calls for (W/ is ignored)
+    """
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    if if_none_match.strip() == "*":
+        return True
+    return any(opaque(tag) == opaque(etag) for tag in if_none_match.split(","))
+
+
+class LocalStorage:
+    """Files on local disk under UPLOAD_DIR"""
+
+    def __init__(self, root: str = UPLOAD_DIR):
+        self.root = root
+
+    def path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        # Stay inside the root and keep hidden entries (the staging area) private
+        if os.path.commonpath([path, self.root]) != self.root or any(
+            part.startswith(".") for part in os.path.relpath(path, self.root).split(os.sep)
+        ):
+            raise HTTPException(status_code=404, detail="Not found")
+        return path
+
+    async def exists(self, key: str) -> bool:
+        return await run_in_threadpool(os.path.exists, self.path(key))
+
+    async def put(self, source_path: str, key: str) -> None:
+        """Move a finished local file into storage under key"""
+        target = self.path(key)
+        await run_in_threadpool(os.makedirs, os.path.dirname(target), exist_ok=True)
+        await run_in_threadpool(shutil.move, source_path, target)
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[str]:
+        """Path of a readable local copy of a stored file"""
+        yield self.path(key)
+
+    async def response(self, request: Request, key: str) -> Response:
+        path = self.path(key)
+        try:
+            stat = await run_in_threadpool(os.stat, path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise HTTPException(status_code=404, detail="Not found")
+        if not stat_module.S_ISREG(stat.st_mode):
+            raise HTTPException(status_code=404, detail="Not found")
+
+        headers = {"ETag": _etag(key, stat), "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        # FileResponse answers Range requests and uses the server's zero-copy path when available
+        return FileResponse(path, stat_result=stat, headers=headers, media_type=_content_type(key))
+
+
+class S3Storage:
+    """Objects in an S3-compatible bucket"""
+
+    def __init__(self, bucket: str = S3_BUCKET, endpoint_url: str = S3_ENDPOINT_URL):
+        if boto3 is None:
+            raise RuntimeError("UPLOAD_STORAGE=s3 requires the 'boto3' package")
+        if not bucket:
+            raise RuntimeError("UPLOAD_STORAGE=s3 requires S3_BUCKET")
+        self.bucket = bucket
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await run_in_threadpool(self.client.head_object, Bucket=self.bucket, Key=key)
+            return True
+        except self.client.exceptions.ClientError:
+            return False
+
+    async def put(self, source_path: str, key: str) -> None:
+        """Upload a finished local file under key, then remove the local file"""
+        await run_in_threadpool(
+            self.client.upload_file, source_path, self.bucket, key,
+            ExtraArgs={"ContentType": _content_type(key), "CacheControl": IMMUTABLE_CACHE_CONTROL}
+        )
+        await run_in_threadpool(os.remove, source_path)
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[str]:
+        fd, path = tempfile.mkstemp(suffix=os.path.splitext(key)[1])
+        os.close(fd)
+        try:
+            await run_in_threadpool(self.client.download_file, self.bucket, key, path)
+            yield path
+        finally:
+            await run_in_threadpool(os.remove, path)
+
+    async def response(self, request: Request, key: str) -> Response:
+        # The bucket serves the bytes (with its own ETag and Range handling); the
+        # redirect itself is cached for less time than the presigned URL lives
+        url = await run_in_threadpool(
+            self.client.generate_presigned_url,
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=S3_PRESIGN_SECONDS,
+        )
+        return RedirectResponse(url, status_code=307, headers={
+            "Cache-Control": f"private, max-age={S3_PRESIGN_SECONDS // 2}"
+        })
+
+
+def create_storage():
+    if UPLOAD_STORAGE == "s3":
+        return S3Storage()
+    if UPLOAD_STORAGE != "local":
+        raise RuntimeError(f"Unknown UPLOAD_STORAGE '{UPLOAD_STORAGE}' (expected 'local' or 's3')")
+    return LocalStorage()
+
+
+storage = create_storage()
+
+
+def url_to_key(url: str) -> str:
+    """Storage key of an /uploads/... URL"""
+    return url[len("/uploads/"):] if url.startswith("/uploads/") else url.lstrip("/")
+
+
+async def serve_upload(request: Request, key: str) -> Response:
+    return await storage.response(request, key)
@@ -0,0 +1,144 @@
+"""
+Creating many tasks at once: POST /api/tasks/batch and the admin import.
+
+Items are validated one by one, so a bad item is reported without failing the
+rest. The valid items are then written with multi-row INSERTs (tasks, their
+locations and their search index postings) in the caller's transaction,
+instead of the two commits and several round trips per task of create_task.
+
+These are Core inserts, which skip the ORM events in models.py; grid cells and
+search terms are therefore computed here. Task ids come back through
+RETURNING where the database supports it with executemany (SQLite, PostgreSQL,
+MariaDB). On MySQL each chunk is one multi-row INSERT, for which InnoDB
+assigns consecutive ids starting at the reported last insert id.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fulltext import term_weights
+from geo import grid_cell
+from models import Task, TaskLocation, TaskSearchTerm
+from schemas import TaskCreate
+from task_states import AVAILABLE
+
+# Largest number of items accepted by POST /api/tasks/batch
+MAX_BATCH_SIZE = 500
+# Rows per INSERT statement (keeps statements well under MySQL's max_allowed_packet)
+INSERT_CHUNK_SIZE = 500
+# Failed rows listed in an import result; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'item'}: {item['msg']}" for item in error.errors()
+        )
+    return str(error)
+
+
+def validate_item(item) -> Tuple[Optional[TaskCreate], Optional[str]]:
+    """(task, None) for a valid TaskCreate payload, otherwise (None, error message)"""
+    try:
+        return TaskCreate.model_validate(item), None
+    except (ValidationError, ValueError, TypeError) as e:
+        return None, _error_message(e)
+
+
+def _task_row(task: TaskCreate, poster_id: int, now: datetime) -> Dict:
+    row = task.model_dump(exclude={"locations"})
+    if task.locations:
+        # The first stop is the task's primary location, as in create_task
+        first = task.locations[0]
+        row.update(location_lat=first.lat, location_lng=first.lng, location_address=first.address)
+    row.update(
+        poster_id=poster_id,
+        status=AVAILABLE,
+        grid_cell=grid_cell(row["location_lat"], row["location_lng"]),
+        report_count=0,
+        created_at=now,
+        updated_at=now,
+    )
+    return row
+
+
+async def _insert_returning_ids(db: AsyncSession, rows: List[Dict]) -> List[int]:
+    tasks = Task.__table__
+    if db.bind.dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = await db.execute(insert(tasks).returning(tasks.c.id, sort_by_parameter_order=True), rows)
+        return list(result.scalars())
+    # A multi-row INSERT allocates its ids in one block (also under interleaved
+    # autoinc locking), starting at lastrowid and spaced by the server's increment
+    result = await db.execute(insert(tasks).values(rows))
+    step = 1
+    if db.bind.dialect.name in ("mysql", "mariadb"):
+        step = int(await db.scalar(text("SELECT @@auto_increment_increment")))
+    return list(range(result.lastrowid, result.lastrowid + len(rows) * step, step))
+
+
+async def insert_tasks(db: AsyncSession, items: List[Tuple[TaskCreate, int]]) -> List[int]:
+    """
+    Insert validated (task, poster_id) pairs with multi-row INSERTs and return
+    the new task ids in item order. Runs in the caller's transaction; does not commit.
+    """
+    now = datetime.utcnow()
+    task_ids: List[int] = []
+    for start in range(0, len(items), INSERT_CHUNK_SIZE):
+        chunk = items[start:start + INSERT_CHUNK_SIZE]
+        ids = await _insert_returning_ids(db, [_task_row(task, poster_id, now) for task, poster_id in chunk])
+
+        locations = []
+        postings = []
+        for (task, _), task_id in zip(chunk, ids):
+            for i, location in enumerate(task.locations or []):
+                locations.append({
+                    "task_id": task_id, "lat": location.lat, "lng": location.lng, "address": location.address,
+                    "grid_cell": grid_cell(location.lat, location.lng), "idx": i, "created_at": now,
+                })
+            postings.extend(
+                {"term": term, "task_id": task_id, "weight": weight}
+                for term, weight in term_weights(task.title, task.description).items()
+            )
+        if locations:
+            await db.execute(insert(TaskLocation.__table__), locations)
+        if postings:
+            await db.execute(insert(TaskSearchTerm.__table__), postings)
+        task_ids.extend(ids)
+    return task_ids
+
+
+def read_import_rows(fileobj, fmt: str) -> Iterator[Dict]:
+    """
+    Rows of an NDJSON or CSV import file (binary file object). CSV columns are
+    TaskCreate fields plus optional poster_id; empty cells are omitted, and a
+    `locations` cell holds a JSON list. Malformed rows are yielded as
+    {"_error": message} so they are reported with their row index.
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8", newline="")
+    if fmt == "csv":
+        for row in csv.DictReader(text):
+            item = {key: value for key, value in row.items() if key and value not in (None, "")}
+            if "locations" in item:
+                try:
+                    item["locations"] = json.loads(item["locations"])
+                except ValueError:
+                    yield {"_error": "locations: not a JSON list"}
+                    continue
+            yield item
+        return
+    for line in text:
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            yield {"_error": f"invalid JSON: {e}"}
+            continue
+        yield item if isinstance(item, dict) else {"_error": "expected a JSON object"}
@@ -0,0 +1,189 @@
+"""
+Task state machine.
+
+    available --accept--> ongoing --complete--> pending_confirmation --confirm--> completed
+    available --cancel (poster)--> cancelled
+    ongoing --cancel (poster)--> cancelled
+    ongoing --cancel (seeker)--> available
+    any --set_status (admin)--> any
+
+Every transition is one conditional UPDATE (compare-and-set): the WHERE clause
+carries the expected current state and the rowcount says whether this request
+won. Concurrent requests therefore cannot both pass a check made in Python,
+and no row lock is held between a read and the write. Only when the update
+matches nothing is the task read, to report why the transition was refused.
+
+The functions run in the caller's transaction and do not commit.
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Task
+
+AVAILABLE = "available"
+ONGOING = "ongoing"
+PENDING_CONFIRMATION = "pending_confirmation"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+STATUSES = (AVAILABLE, ONGOING, PENDING_CONFIRMATION, COMPLETED, CANCELLED)
+
+
+async def _compare_and_set(db: AsyncSession, task_id: int, conditions, values) -> bool:
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, *conditions)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def _get_task(db: AsyncSession, task_id: int) -> Task:
+    task = await db.scalar(select(Task).where(Task.id == task_id).execution_options(populate_existing=True))
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+def _same_seeker(seeker_id: Optional[int]):
+    return Task.seeker_id.is_(None) if seeker_id is None else Task.seeker_id == seeker_id
+
+
+def _conflict():
+    # The task matched every check when read but changed before the update
+    return HTTPException(status_code=409, detail="Task was modified by another request, please retry")
+
+
+async def accept(db: AsyncSession, task_id: int, seeker_id: int) -> None:
+    """available -> ongoing, assigning the seeker; exactly one concurrent accept wins"""
+    if await _compare_and_set(
+        db, task_id,
+        [Task.status == AVAILABLE, Task.poster_id != seeker_id],
+        {"status": ONGOING, "seeker_id": seeker_id, "accepted_at": datetime.utcnow()},
+    ):
+        return
+
+    task = await _get_task(db, task_id)
+    if task.status != AVAILABLE:
+        raise HTTPException(status_code=400, detail="Task is not available")
+    if task.poster_id == seeker_id:
+        raise HTTPException(status_code=400, detail="Cannot accept your own task")
+    raise _conflict()
+
+
+async def attach_proof(db: AsyncSession, task_id: int, seeker_id: int, proof_image: str) -> None:
+    """Record the proof image while the task is ongoing and assigned to this seeker"""
+    # Variants of a previous proof no longer apply; they are regenerated for the new one
+    if await _compare_and_set(
+        db, task_id,
+        [Task.status == ONGOING, Task.seeker_id == seeker_id],
+        {"proof_image": proof_image, "proof_thumbnail": None, "proof_web_image": None},
+    ):
+        return
+
+    task = await _get_task(db, task_id)
+    if task.status != ONGOING:
+        raise HTTPException(status_code=400, detail="Can only upload proof for an ongoing task")
+    if task.seeker_id != seeker_id:
+        raise HTTPException(status_code=403, detail="Only the seeker can upload proof for this task")
+    raise _conflict()
+
+
+async def complete(db: AsyncSession, task_id: int, seeker_id: int) -> None:
+    """ongoing -> pending_confirmation; only the seeker, and only once proof is attached"""
+    if await _compare_and_set(
+        db, task_id,
+        [Task.status == ONGOING, Task.seeker_id == seeker_id, Task.proof_image.isnot(None), Task.proof_image != ""],
+        {"status": PENDING_CONFIRMATION},
+    ):
+        return
+
+    task = await _get_task(db, task_id)
+    if task.status != ONGOING:
+        raise HTTPException(status_code=400, detail="Task is not ongoing")
+    if task.seeker_id != seeker_id:
+        raise HTTPException(status_code=403, detail="Only the seeker can mark task as complete")
+    if not task.proof_image:
+        raise HTTPException(status_code=400, detail="Please attach a proof image before marking as done")
+    raise _conflict()
+
+
+async def confirm(db: AsyncSession, task_id: int, poster_id: int) -> None:
+    """pending_confirmation -> completed; only the poster"""
+    if await _compare_and_set(
+        db, task_id,
+        [Task.status == PENDING_CONFIRMATION, Task.poster_id == poster_id],
+        {"status": COMPLETED, "completed_at": datetime.utcnow()},
+    ):
+        return
+
+    task = await _get_task(db, task_id)
+    if task.status != PENDING_CONFIRMATION:
+        raise HTTPException(status_code=400, detail="Task is not pending confirmation")
+    if task.poster_id != poster_id:
+        raise HTTPException(status_code=403, detail="Only the poster can confirm task completion")
+    raise _conflict()
+
+
+async def cancel(db: AsyncSession, task_id: int, actor_id: int) -> Tuple[str, Optional[int]]:
+    """
+    Cancel (or, when the seeker backs out, release) a task. The outcome depends
+    on who cancels and the current state, so the task is read first and the
+    update only applies if status and seeker are still what was read.
+    Returns the status and the seeker assigned before the cancellation.
+    """
+    task = await _get_task(db, task_id)
+
+    # Only poster can cancel available tasks, both can cancel ongoing
+    if task.status == AVAILABLE:
+        if task.poster_id != actor_id:
+            raise HTTPException(status_code=403, detail="Only the poster can cancel available tasks")
+        new_status = CANCELLED
+    elif task.status == ONGOING:
+        if task.poster_id != actor_id and task.seeker_id != actor_id:
+            raise HTTPException(status_code=403, detail="Not authorized to cancel this task")
+        # If the seeker cancels an ongoing task, make it available again for others.
+        # If the poster cancels an ongoing task, mark it as cancelled.
+        if actor_id == task.seeker_id and task.poster_id != task.seeker_id:
+            new_status = AVAILABLE
+        else:
+            new_status = CANCELLED
+    else:
+        raise HTTPException(status_code=400, detail="Cannot cancel task in current status")
+
+    if not await _compare_and_set(
+        db, task_id,
+        [Task.status == task.status, _same_seeker(task.seeker_id)],
+        {"status": new_status, "seeker_id": None, "accepted_at": None},
+    ):
+        raise _conflict()
+    return task.status, task.seeker_id
+
+
+async def set_status(
+    db: AsyncSession, task_id: int, expected_status: str, expected_seeker_id: Optional[int], new_status: str
+) -> None:
+    """
+    Admin override: move a task straight to any status. Applies only while status
+    and seeker are still the expected ones (what the caller read), so reputation
+    and statistics deltas computed from them are right; otherwise 409.
+    completed_at is set on entering 'completed' (as confirm does) and cleared on
+    leaving it.
+    """
+    if new_status not in STATUSES:
+        raise HTTPException(status_code=400, detail=f"Unknown status '{new_status}'")
+    values = {"status": new_status}
+    if new_status == COMPLETED:
+        values["completed_at"] = datetime.utcnow()
+    elif expected_status == COMPLETED:
+        values["completed_at"] = None
+    if not await _compare_and_set(
+        db, task_id,
+        [Task.status == expected_status, _same_seeker(expected_seeker_id)],
+        values,
+    ):
+        raise _conflict()
@@ -0,0 +1,70 @@
+"""
+Shared test setup: a throwaway SQLite database and unsigned development tokens.
+
+The environment is set before main is imported, since database.py reads it at
+import time. Set TEST_DATABASE_URL to run the suite against another database.
+"""
+import base64
+import json
+import os
+import sys
+import tempfile
+
+_TEST_DIR = tempfile.mkdtemp(prefix="taskerrand-tests-")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{os.path.join(_TEST_DIR, 'test.db')}")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["FIREBASE_VERIFY_SIGNATURE"] = "0"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import images
+import main
+import storage
+import uploads
+
+ADMIN_EMAIL = "neowarsia@gmail.com"
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def auth_headers(uid: str, email: str = None) -> dict:
+    """Authorization header with an unsigned token, accepted while FIREBASE_VERIFY_SIGNATURE=0"""
+    payload = {
+        "iss": "https://securetoken.google.com/taskerrandbeta",
+        "user_id": uid,
+        "email": email or f"{uid}@example.com",
+        "name": uid,
+    }
+    return {"Authorization": f"Bearer {_b64({'alg': 'none'})}.{_b64(payload)}.unsigned"}
+
+
+def task_payload(title: str = "Buy groceries", **fields) -> dict:
+    payload = {
+        "title": title,
+        "description": "Pick up milk and bread from the corner store",
+        "payment": 100.0,
+        "location_lat": 14.5995,
+        "location_lng": 120.9842,
+    }
+    payload.update(fields)
+    return payload
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def local_uploads(monkeypatch, tmp_path):
+    """Store uploads under the test's temporary directory instead of the repository's uploads/"""
+    upload_storage = storage.LocalStorage(str(tmp_path / "uploads"))
+    for module in (storage, uploads, images):
+        monkeypatch.setattr(module, "storage", upload_storage)
+    monkeypatch.setattr(uploads, "STAGING_DIR", str(tmp_path / "uploads" / ".staging"))
+    return upload_storage
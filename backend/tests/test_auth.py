@@ -0,0 +1,136 @@
+"""RS256 verification of Firebase ID tokens against a local key pair and a stubbed JWKS fetch."""
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+import auth
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _jwk(kid, private_key):
+    numbers = private_key.public_key().public_numbers()
+    return {
+        "kty": "RSA", "kid": kid, "alg": "RS256",
+        "n": _b64(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")),
+        "e": _b64(numbers.e.to_bytes(3, "big")),
+    }
+
+
+KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+ROTATED_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _token(kid="key-1", private_key=KEY, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": auth.FIREBASE_ISSUER, "aud": auth.FIREBASE_PROJECT_ID, "sub": "uid-1",
+        "email": "signed@example.com", "iat": now, "exp": now + 3600,
+    }
+    payload.update(claims)
+    signing_input = f"{_b64(json.dumps({'alg': 'RS256', 'kid': kid}).encode())}.{_b64(json.dumps(payload).encode())}"
+    signature = private_key.sign(signing_input.encode(), padding.PKCS1v15(), hashes.SHA256())
+    return f"{signing_input}.{_b64(signature)}"
+
+
+class FakeResponse:
+    def __init__(self, jwks):
+        self.headers = {"cache-control": "public, max-age=3600"}
+        self._jwks = jwks
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._jwks
+
+
+class FakeClient:
+    """Serves `jwks` from every GET and counts the fetches"""
+
+    def __init__(self):
+        self.jwks = {"keys": [_jwk("key-1", KEY)]}
+        self.fetches = 0
+
+    async def get(self, url):
+        self.fetches += 1
+        return FakeResponse(self.jwks)
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(auth, "VERIFY_SIGNATURE", True)
+    monkeypatch.setattr(auth, "_get_http_client", lambda: client)
+    monkeypatch.setattr(auth, "public_keys", auth.PublicKeyStore("https://jwks.test/keys"))
+    monkeypatch.setattr(auth, "token_cache", auth.TokenCache())
+    return client
+
+
+def _verify(token):
+    return asyncio.run(auth.verify_firebase_token(token))
+
+
+def test_valid_token_is_accepted(jwks):
+    user = _verify(_token())
+    assert user["uid"] == "uid-1" and user["email"] == "signed@example.com"
+    assert jwks.fetches == 1
+
+
+def test_tampered_signature_is_rejected(jwks):
+    header, payload, signature = _token().split(".")
+    forged = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    forged["sub"] = "someone-else"
+    assert _verify(f"{header}.{_b64(json.dumps(forged).encode())}.{signature}") is None
+    assert _verify(_token(private_key=ROTATED_KEY)) is None
+
+
+@pytest.mark.parametrize("claims", [
+    {"aud": "another-project"},
+    {"iss": "https://securetoken.google.com/another-project"},
+    {"exp": int(time.time()) - 10},
+    {"iat": int(time.time()) + 3600},
+])
+def test_wrong_audience_issuer_or_lifetime_is_rejected(jwks, claims):
+    assert _verify(_token(**claims)) is None
+
+
+def test_unknown_kid_refreshes_once_then_is_rate_limited(jwks):
+    assert _verify(_token()) is not None
+    assert jwks.fetches == 1
+
+    # Keys rotated ahead of the cached max-age: the first token with the new kid refetches
+    jwks.jwks = {"keys": [_jwk("key-1", KEY), _jwk("key-2", ROTATED_KEY)]}
+    auth.public_keys._fetched_at -= auth.UNKNOWN_KID_REFRESH_SECONDS
+    assert _verify(_token(kid="key-2", private_key=ROTATED_KEY)) is not None
+    assert jwks.fetches == 2
+
+    # Junk kids within the rate limit window do not cause further fetches
+    for i in range(5):
+        assert _verify(_token(kid=f"junk-{i}", sub=f"uid-{i}")) is None
+    assert jwks.fetches == 2
+
+    # Once the window has passed, one more fetch is allowed
+    auth.public_keys._fetched_at -= auth.UNKNOWN_KID_REFRESH_SECONDS
+    assert _verify(_token(kid="junk-again")) is None
+    assert _verify(_token(kid="junk-once-more")) is None
+    assert jwks.fetches == 3
+
+
+def test_cached_token_skips_verification(jwks, monkeypatch):
+    token = _token()
+    first = _verify(token)
+
+    async def fail(token):
+        raise AssertionError("token was verified again")
+
+    monkeypatch.setattr(auth, "_verify_signed_token", fail)
+    assert _verify(token) == first
+    assert jwks.fetches == 1
@@ -0,0 +1,37 @@
+"""Batch creation reports partial and total failure in the status code, not only per item."""
+import uuid
+
+from conftest import auth_headers, task_payload
+
+
+def _poster():
+    return auth_headers(f"batch-{uuid.uuid4().hex[:8]}")
+
+
+def test_all_items_created_is_201(client):
+    response = client.post(
+        "/api/tasks/batch", json={"tasks": [task_payload("First"), task_payload("Second")]}, headers=_poster()
+    )
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 0)
+
+
+def test_some_items_failing_is_207(client):
+    response = client.post(
+        "/api/tasks/batch", json={"tasks": [task_payload("Valid"), {"title": "bad"}]}, headers=_poster()
+    )
+    assert response.status_code == 207, response.text
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 1)
+    created, failed = body["results"]
+    assert created["index"] == 0 and created["id"] is not None
+    assert failed["index"] == 1 and failed["error"]
+
+
+def test_no_items_created_is_422(client):
+    response = client.post("/api/tasks/batch", json={"tasks": [{"title": "bad"}]}, headers=_poster())
+    assert response.status_code == 422, response.text
+    body = response.json()
+    assert (body["created"], body["failed"]) == (0, 1)
+    assert body["results"][0]["error"]
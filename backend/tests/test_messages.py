@@ -0,0 +1,40 @@
+"""Message listings answer conditional requests with 304 when nothing was added."""
+import uuid
+
+import pytest
+
+from conftest import auth_headers, task_payload
+
+
+@pytest.fixture
+def conversation(client):
+    word = uuid.uuid4().hex[:8]
+    poster, seeker = auth_headers(f"poster-{word}"), auth_headers(f"seeker-{word}")
+    task_id = client.post("/api/tasks", json=task_payload(), headers=poster).json()["id"]
+    assert client.post(f"/api/tasks/{task_id}/accept", headers=seeker).status_code == 200
+    client.post("/api/messages", json={"task_id": task_id, "content": "On my way"}, headers=seeker)
+    response = client.get(f"/api/tasks/{task_id}/messages", headers=poster)
+    return task_id, poster, seeker, response.headers["ETag"]
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    '"other", {etag}',
+    "{etag},W/\"other\"",
+    "*",
+    "{strong}",
+])
+def test_matching_if_none_match_returns_304(client, conversation, if_none_match):
+    task_id, poster, _, etag = conversation
+    header = if_none_match.format(etag=etag, strong=etag[2:])
+    response = client.get(f"/api/tasks/{task_id}/messages", headers={**poster, "If-None-Match": header})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_new_message_changes_the_etag(client, conversation):
+    task_id, poster, seeker, etag = conversation
+    client.post("/api/messages", json={"task_id": task_id, "content": "Arrived"}, headers=seeker)
+    response = client.get(f"/api/tasks/{task_id}/messages", headers={**poster, "If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 200
+    assert [message["content"] for message in response.json()] == ["On my way", "Arrived"]
@@ -0,0 +1,41 @@
+"""Migrations bring existing data up to date, not just the schema."""
+import os
+
+from sqlalchemy import create_engine, delete, insert, select, update
+
+from database import Base
+from migrations import run_migrations, schema_migrations
+from models import Feedback, Task, User
+
+
+def test_reputation_migration_seeds_existing_users(tmp_path):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_path, 'legacy.db')}")
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    with engine.begin() as connection:
+        poster, seeker = (
+            connection.execute(insert(User).values(firebase_uid=uid, email=f"{uid}@example.com")).inserted_primary_key[0]
+            for uid in ("poster", "seeker")
+        )
+        task_ids = [
+            connection.execute(insert(Task).values(
+                title=f"Errand {status}", description="Legacy errand", payment=50.0, location_lat=14.6,
+                location_lng=121.0, status=status, poster_id=poster, seeker_id=seeker,
+            )).inserted_primary_key[0]
+            for status in ("completed", "completed", "ongoing")
+        ]
+        for task_id, rating in zip(task_ids, (5, 3)):
+            connection.execute(insert(Feedback).values(task_id=task_id, poster_id=poster, seeker_id=seeker, rating=rating))
+        # As before the columns existed: aggregates at their zero default, migration 7 not applied
+        connection.execute(update(User).values(rating_count=0, rating_sum=0, completed_task_count=0))
+        connection.execute(delete(schema_migrations).where(schema_migrations.c.version == 7))
+
+    run_migrations(engine)
+
+    with engine.connect() as connection:
+        row = connection.execute(
+            select(User.rating_count, User.rating_sum, User.completed_task_count).where(User.id == seeker)
+        ).one()
+    assert tuple(row) == (2, 8, 2)
+    engine.dispose()
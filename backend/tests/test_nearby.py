@@ -0,0 +1,28 @@
+"""Nearby search, including near the poles where the grid's longitude cells get narrow."""
+import uuid
+
+import pytest
+
+from conftest import auth_headers, task_payload
+from geo import MAX_SEARCH_CELLS, _search_box
+
+
+@pytest.mark.parametrize("lat, lng", [(14.5995, 120.9842), (80.0, 15.0), (89.99, -179.95)])
+def test_nearby_finds_tasks_within_radius(client, lat, lng):
+    poster = auth_headers(f"poster-{uuid.uuid4().hex[:8]}")
+    seeker = auth_headers(f"seeker-{uuid.uuid4().hex[:8]}")
+    near = client.post("/api/tasks", json=task_payload(location_lat=lat, location_lng=lng), headers=poster).json()
+    far_lat = lat - 5 if lat > 0 else lat + 5
+    far = client.post("/api/tasks", json=task_payload(location_lat=far_lat, location_lng=lng), headers=poster).json()
+
+    response = client.get(f"/api/tasks/nearby?lat={lat}&lng={lng}&radius_km=100", headers=seeker)
+    assert response.status_code == 200, response.text
+    ids = [task["id"] for task in response.json()]
+    assert near["id"] in ids
+    assert far["id"] not in ids
+
+
+def test_polar_search_box_spans_at_most_one_turn():
+    lat_indexes, lng_indexes = _search_box(89.99, 0.0, 100)
+    assert len(lng_indexes) == 3600
+    assert len(lat_indexes) * len(lng_indexes) > MAX_SEARCH_CELLS
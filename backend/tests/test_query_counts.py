@@ -0,0 +1,68 @@
+"""Task listings must issue a fixed number of statements however many tasks they return (no N+1)."""
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from conftest import ADMIN_EMAIL, auth_headers, task_payload
+from database import async_engine
+
+# The outbox dispatcher and stats rollup share the engine and may run during a request
+BACKGROUND_TABLES = ("notification_outbox", "notifications", "stat_counter")
+
+
+def _statements_for(client, url, headers):
+    # Warm up first so a user-cache miss or lazy first load is not counted
+    assert client.get(url, headers=headers).status_code == 200
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not any(table in statement for table in BACKGROUND_TABLES):
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, response.text
+    return len(response.json()), len(statements)
+
+
+def _add_tasks(client, poster, seeker, word, count):
+    for i in range(count):
+        response = client.post(
+            "/api/tasks",
+            json=task_payload(
+                f"{word} errand {i}",
+                locations=[{"lat": 14.6, "lng": 121.0}, {"lat": 14.7, "lng": 121.1, "address": "Second stop"}],
+            ),
+            headers=poster,
+        )
+        assert response.status_code == 201, response.text
+        # Accepted tasks have a seeker, so the seeker relationship is loaded too
+        if i % 2 == 0:
+            assert client.post(f"/api/tasks/{response.json()['id']}/accept", headers=seeker).status_code == 200
+
+
+@pytest.mark.parametrize("listing", ["admin", "search", "mine"])
+def test_listing_statement_count_does_not_grow_with_tasks(client, listing):
+    word = f"w{uuid.uuid4().hex[:8]}"
+    poster = auth_headers(f"poster-{word}")
+    seeker = auth_headers(f"seeker-{word}")
+    admin = auth_headers("admin", ADMIN_EMAIL)
+    url, headers = {
+        "admin": ("/api/admin/tasks", admin),
+        "search": (f"/api/tasks/search?query={word}&status_filter=ongoing", seeker),
+        "mine": ("/api/users/me/tasks?task_type=posted", poster),
+    }[listing]
+    for user in (poster, seeker, admin):
+        client.get("/api/users/me", headers=user)
+
+    _add_tasks(client, poster, seeker, word, 2)
+    few_rows, few_statements = _statements_for(client, url, headers)
+    _add_tasks(client, poster, seeker, word, 12)
+    many_rows, many_statements = _statements_for(client, url, headers)
+
+    assert many_rows > few_rows
+    assert many_statements == few_statements
@@ -0,0 +1,92 @@
+"""A read that races a write must not leave its stale response in the cache."""
+import asyncio
+
+import pytest
+
+from response_cache import MemoryBackend, RedisBackend, ResponseCache
+
+
+class FakeRedis:
+    """The few async Redis commands RedisBackend uses, kept in dicts"""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    async def get(self, name):
+        return self.values.get(name)
+
+    async def mget(self, names):
+        return [self.values.get(name) for name in names]
+
+    async def set(self, name, value, ex=None):
+        self.values[name] = str(value).encode() if not isinstance(value, str) else value
+
+    async def incr(self, name):
+        self.values[name] = str(int(self.values.get(name, 0)) + 1).encode()
+        return int(self.values[name])
+
+    async def sadd(self, name, member):
+        self.sets.setdefault(name, set()).add(member)
+
+    async def smembers(self, name):
+        return set(self.sets.get(name, ()))
+
+    async def expire(self, name, seconds):
+        pass
+
+    async def delete(self, *names):
+        for name in names:
+            self.values.pop(name, None)
+            self.sets.pop(name, None)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    backend = MemoryBackend() if request.param == "memory" else RedisBackend(FakeRedis())
+    return ResponseCache(backend)
+
+
+def test_read_finishing_after_an_invalidation_is_not_stored(cache):
+    async def scenario():
+        since = await cache.snapshot()
+        # A write commits and invalidates while the read is still computing
+        await cache.invalidate("task:1")
+        await cache.put("task:1", {"status": "available"}, tags=["task:1", "user:2"], since=since)
+        return await cache.get("task:1")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_invalidating_other_tags_does_not_block_a_read(cache):
+    async def scenario():
+        since = await cache.snapshot()
+        await cache.invalidate("task:2")
+        await cache.put("task:1", {"status": "available"}, tags=["task:1", None], since=since)
+        return await cache.get("task:1")
+
+    assert asyncio.run(scenario()).body == b'{"status":"available"}'
+
+
+def test_read_started_after_an_invalidation_is_stored(cache):
+    async def scenario():
+        await cache.invalidate("task:1")
+        since = await cache.snapshot()
+        await cache.put("task:1", {"status": "ongoing"}, tags=["task:1"], since=since)
+        return await cache.get("task:1")
+
+    assert asyncio.run(scenario()) is not None
+
+
+def test_snapshots_older_than_forgotten_invalidations_are_refused():
+    cache = ResponseCache(MemoryBackend(max_size=2))
+
+    async def scenario():
+        since = await cache.snapshot()
+        for task_id in range(1, 5):
+            await cache.invalidate(f"task:{task_id}")
+        # task:1's stamp was evicted, so the snapshot can no longer be checked against it
+        await cache.put("task:1", {"status": "available"}, tags=["task:1"], since=since)
+        return await cache.get("task:1")
+
+    assert asyncio.run(scenario()) is None
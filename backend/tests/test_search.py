@@ -0,0 +1,26 @@
+"""Search terms are case-folded and accent-free, so collation-equal words never collide."""
+import uuid
+
+from conftest import auth_headers, task_payload
+from fulltext import term_weights, tokenize
+
+
+def test_tokens_are_case_folded_without_accents():
+    assert tokenize("Café CAFE Straße naïve") == ["cafe", "cafe", "strasse", "naive"]
+    assert term_weights("Café", "cafe straße strasse") == {"cafe": 4, "strasse": 2}
+
+
+def test_search_matches_accented_and_unaccented_words(client):
+    word = f"z{uuid.uuid4().hex[:8]}"
+    poster = auth_headers(f"poster-{word}")
+    seeker = auth_headers(f"seeker-{word}")
+    response = client.post(
+        "/api/tasks",
+        json=task_payload(f"Café {word} run", description=f"cafe {word.upper()} near the Straße and strasse"),
+        headers=poster,
+    )
+    assert response.status_code == 201, response.text
+
+    for query in (f"cafe {word}", f"CAFÉ {word}", f"strasse {word}", f"straße {word}"):
+        results = client.get(f"/api/tasks/search?query={query}", headers=seeker).json()
+        assert [task["id"] for task in results] == [response.json()["id"]], query
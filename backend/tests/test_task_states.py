@@ -0,0 +1,139 @@
+"""Concurrent transitions on one task: exactly one request wins, and counters stay exact."""
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import func, select
+
+import admin_stats
+from conftest import ADMIN_EMAIL, auth_headers, task_payload
+from database import SessionLocal
+from models import Task
+
+# Simultaneous requests per race; set TEST_CONCURRENCY to raise or lower it
+CONCURRENCY = int(os.getenv("TEST_CONCURRENCY", "200"))
+
+
+def _users(client, prefix, count):
+    users = [auth_headers(f"{prefix}-{i}-{uuid.uuid4().hex[:6]}") for i in range(count)]
+    for headers in users:
+        assert client.get("/api/users/me", headers=headers).status_code == 200
+    return users
+
+
+def _race(calls):
+    """
+    Run the calls at the same time: every thread waits at a barrier until all are
+    ready, and the TestClient interleaves the requests on the app's event loop
+    """
+    barrier = threading.Barrier(len(calls))
+
+    def start(call):
+        barrier.wait()
+        return call()
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return [future.result() for future in [pool.submit(start, call) for call in calls]]
+
+
+def _new_task(client, poster):
+    response = client.post("/api/tasks", json=task_payload(), headers=poster)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_concurrent_accepts_have_exactly_one_winner(client):
+    poster, = _users(client, "poster", 1)
+    seekers = _users(client, "seeker", CONCURRENCY)
+    task_id = _new_task(client, poster)
+
+    responses = _race([
+        lambda headers=headers: client.post(f"/api/tasks/{task_id}/accept", headers=headers) for headers in seekers
+    ])
+
+    codes = sorted(response.status_code for response in responses)
+    assert codes.count(200) == 1
+    assert all(code in (400, 409) for code in codes if code != 200)
+    winner = next(r for r in responses if r.status_code == 200).json()
+    task = client.get(f"/api/tasks/{task_id}", headers=poster).json()
+    assert task["status"] == "ongoing"
+    assert task["seeker_id"] == winner["seeker_id"]
+
+
+@pytest.mark.parametrize("canceller", ["poster", "seeker"])
+def test_concurrent_cancels_have_exactly_one_winner(client, canceller):
+    poster, seeker = _users(client, "party", 2)
+    task_id = _new_task(client, poster)
+    assert client.post(f"/api/tasks/{task_id}/accept", headers=seeker).status_code == 200
+
+    # Cancelling (poster) or backing out (seeker) applies once; the repeats find the task changed
+    headers = poster if canceller == "poster" else seeker
+    responses = _race([lambda: client.post(f"/api/tasks/{task_id}/cancel", headers=headers)] * CONCURRENCY)
+
+    codes = [response.status_code for response in responses]
+    assert codes.count(200) == 1
+    assert all(code in (400, 403, 409) for code in codes if code != 200)
+    task = client.get(f"/api/tasks/{task_id}", headers=poster).json()
+    assert task["status"] == ("cancelled" if canceller == "poster" else "available")
+
+
+def test_status_override_racing_accepts_keeps_counters_exact(client):
+    admin = auth_headers("admin", ADMIN_EMAIL)
+    assert client.get("/api/users/me", headers=admin).status_code == 200
+    poster, = _users(client, "poster", 1)
+    seekers = _users(client, "seeker", 3)
+    # One override and three accepts per task, CONCURRENCY requests in all
+    task_ids = [_new_task(client, poster) for _ in range(max(1, CONCURRENCY // 4))]
+
+    calls = []
+    for task_id in task_ids:
+        calls.append(lambda task_id=task_id: client.put(
+            f"/api/tasks/{task_id}", json={"status": "cancelled"}, headers=admin
+        ))
+        calls.extend(
+            lambda task_id=task_id, headers=headers: client.post(f"/api/tasks/{task_id}/accept", headers=headers)
+            for headers in seekers
+        )
+    responses = _race(calls)
+    assert all(response.status_code in (200, 400, 409) for response in responses)
+
+    with SessionLocal() as db:
+        actual = dict(db.execute(select(Task.status, func.count()).group_by(Task.status)).all())
+    stats = client.get("/api/admin/stats", headers=admin).json()
+    assert {status: count for status, count in stats["tasks_by_status"].items() if count} == actual
+
+
+def test_only_admins_set_status_directly(client):
+    poster, = _users(client, "poster", 1)
+    task_id = _new_task(client, poster)
+
+    response = client.put(f"/api/tasks/{task_id}", json={"status": "completed"}, headers=poster)
+    assert response.status_code == 403
+    admin = auth_headers("admin", ADMIN_EMAIL)
+    response = client.put(f"/api/tasks/{task_id}", json={"status": "bogus"}, headers=admin)
+    assert response.status_code == 400
+    # Sending the current status along with other fields is not a status change
+    response = client.put(f"/api/tasks/{task_id}", json={"status": "available", "title": "Renamed"}, headers=poster)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+
+
+def test_status_override_counters_survive_a_rebuild(client):
+    admin = auth_headers("admin", ADMIN_EMAIL)
+    poster, = _users(client, "poster", 1)
+    completed, reopened = _new_task(client, poster), _new_task(client, poster)
+
+    for task_id, status in ((completed, "completed"), (reopened, "completed"), (reopened, "cancelled")):
+        response = client.put(f"/api/tasks/{task_id}", json={"status": status}, headers=admin)
+        assert response.status_code == 200, response.text
+    assert client.get(f"/api/tasks/{completed}", headers=admin).json()["completed_at"] is not None
+    assert client.get(f"/api/tasks/{reopened}", headers=admin).json()["completed_at"] is None
+
+    # Recomputing the counters from the rows must not change what the live deltas say
+    live = client.get("/api/admin/stats", headers=admin).json()
+    with SessionLocal() as db:
+        admin_stats.rebuild(db)
+        db.commit()
+    assert client.get("/api/admin/stats", headers=admin).json() == live
@@ -0,0 +1,86 @@
+"""Oversized proof uploads are refused before the multipart body is parsed."""
+import asyncio
+import uuid
+
+import pytest
+
+import main
+import uploads
+from conftest import auth_headers, task_payload
+
+BOUNDARY = "taskerrand-test-boundary"
+
+
+@pytest.fixture
+def small_limit(monkeypatch):
+    monkeypatch.setattr(uploads, "UPLOAD_MAX_BYTES", 1024)
+    monkeypatch.setattr(uploads, "MULTIPART_OVERHEAD_BYTES", 1024)
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Folders passed to save_image; stays empty when the body is refused before parsing"""
+    folders = []
+
+    async def recording_save_image(file, folder):
+        folders.append(folder)
+        return await uploads.save_image(file, folder)
+
+    monkeypatch.setattr(main, "save_image", recording_save_image)
+    return folders
+
+
+def _ongoing_task(client):
+    word = uuid.uuid4().hex[:8]
+    poster, seeker = auth_headers(f"poster-{word}"), auth_headers(f"seeker-{word}")
+    task_id = client.post("/api/tasks", json=task_payload(), headers=poster).json()["id"]
+    assert client.post(f"/api/tasks/{task_id}/accept", headers=seeker).status_code == 200
+    return task_id, seeker
+
+
+def _multipart(size: int) -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="proof.jpg"\r\n'
+        "Content-Type: image/jpeg\r\n\r\n"
+    ).encode() + b"x" * size + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def test_upload_over_content_length_limit_is_rejected(client, small_limit, saved):
+    task_id, seeker = _ongoing_task(client)
+    response = client.post(
+        f"/api/tasks/{task_id}/proof",
+        files={"file": ("proof.jpg", b"x" * 64 * 1024, "image/jpeg")},
+        headers=seeker,
+    )
+    assert response.status_code == 413
+    assert saved == []
+
+
+def test_streamed_upload_is_rejected_past_the_limit(client, small_limit, saved):
+    task_id, seeker = _ongoing_task(client)
+    body = _multipart(64 * 1024)
+    chunks = (body[i:i + 4096] for i in range(0, len(body), 4096))
+    # A generator body is sent chunked, without Content-Length
+    response = client.post(
+        f"/api/tasks/{task_id}/proof",
+        content=chunks,
+        headers={**seeker, "Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+    )
+    assert response.status_code == 413
+    assert saved == []
+
+
+def test_upload_within_limit_is_stored(client, small_limit, saved, local_uploads):
+    task_id, seeker = _ongoing_task(client)
+    response = client.post(
+        f"/api/tasks/{task_id}/proof",
+        files={"file": ("proof.jpg", b"x" * 512, "image/jpeg")},
+        headers=seeker,
+    )
+    assert response.status_code == 200, response.text
+    proof_url = response.json()["proof_image"]
+    assert proof_url.startswith("/uploads/proofs/")
+    assert saved == ["proofs"]
+    # Stored in the test's temporary uploads directory (see conftest)
+    assert asyncio.run(local_uploads.exists(proof_url[len("/uploads/"):]))
@@ -0,0 +1,44 @@
+"""A user's task listing and counts are computed by the server over all of their tasks."""
+import uuid
+
+from conftest import auth_headers, task_payload
+
+
+def _user(client, name):
+    headers = auth_headers(name)
+    return headers, client.get("/api/users/me", headers=headers).json()["id"]
+
+
+def _pages(client, url, headers):
+    items, cursor = [], None
+    while True:
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""), headers=headers)
+        assert response.status_code == 200, response.text
+        items.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+
+
+def test_user_tasks_are_filtered_and_counted_on_the_server(client):
+    word = uuid.uuid4().hex[:8]
+    (target, target_id), (other, other_id) = _user(client, f"target-{word}"), _user(client, f"other-{word}")
+
+    posted = [client.post("/api/tasks", json=task_payload(f"Posted {i}"), headers=target).json()["id"] for i in range(3)]
+    accepted = [client.post("/api/tasks", json=task_payload(f"Accepted {i}"), headers=other).json()["id"] for i in range(2)]
+    for task_id in accepted:
+        assert client.post(f"/api/tasks/{task_id}/accept", headers=target).status_code == 200
+    # Newer tasks by someone else must not push the user's tasks off the first page
+    for i in range(5):
+        client.post("/api/tasks", json=task_payload(f"Unrelated {i}"), headers=other)
+
+    everything = _pages(client, f"/api/users/{target_id}/tasks?limit=2", other)
+    assert sorted(task["id"] for task in everything) == sorted(posted + accepted)
+    assert [task["id"] for task in _pages(client, f"/api/users/{target_id}/tasks?role=posted&limit=2", other)] == posted[::-1]
+    ongoing = _pages(client, f"/api/users/{target_id}/tasks?status_filter=ongoing", other)
+    assert sorted(task["id"] for task in ongoing) == sorted(accepted)
+    assert client.get(f"/api/users/{target_id}/tasks?role=bogus", headers=other).status_code == 422
+
+    stats = client.get(f"/api/users/{target_id}/task-stats", headers=other).json()
+    assert stats == {"posted": 3, "accepted": 2, "completed": 0, "active": 2}
+    assert client.get(f"/api/users/{other_id}/task-stats", headers=target).json()["posted"] == 7
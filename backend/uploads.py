@@ -0,0 +1,144 @@
+"""
+Streaming storage for uploaded images.
+
+Uploads are copied to a local staging file in fixed-size chunks with the
+blocking file I/O run in the thread pool, so neither a large photo nor a slow
+disk holds up the event loop, and memory use stays at one chunk per upload.
+The content is hashed while it streams and stored under its SHA-256 digest, so
+the same image uploaded twice is kept once. Finished files are handed to the
+configured storage backend (see storage.py).
+"""
+import hashlib
+import os
+import uuid
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+
+from storage import UPLOAD_DIR, storage
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 256 * 1024
+# Room for the multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+# Partial uploads; inside the uploads root so finished files can be moved into place atomically
+STAGING_DIR = os.path.join(UPLOAD_DIR, ".staging")
+
+# Extensions kept on stored files, by content type; anything else is stored without one
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+}
+
+
+def _too_large():
+    limit_mb = UPLOAD_MAX_BYTES / (1024 * 1024)
+    return HTTPException(status_code=413, detail=f"File is too large (maximum {limit_mb:g} MB)")
+
+
+def _body_limit() -> int:
+    return UPLOAD_MAX_BYTES + MULTIPART_OVERHEAD_BYTES
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects multipart bodies over the upload limit before the form is parsed, so an
+    oversized upload is never spooled: up front when Content-Length is too large,
+    otherwise as soon as the streamed body passes the limit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = _body_limit()
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > limit:
+            error = _too_large()
+            response = JSONResponse({"detail": error.detail}, status_code=error.status_code)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the form parser; FastAPI turns it into the 413 response
+                    raise _too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def staging_path(suffix: str = "") -> str:
+    """A fresh path in the staging area for a file that will be put into storage"""
+    os.makedirs(STAGING_DIR, exist_ok=True)
+    return os.path.join(STAGING_DIR, f"{uuid.uuid4().hex}{suffix}.part")
+
+
+async def save_image(file: UploadFile, folder: str) -> str:
+    """
+    Stream an uploaded image into storage as <folder>/<sha256><ext> and return its
+    URL path (served under /uploads). Raises 413 as soon as the upload exceeds
+    UPLOAD_MAX_BYTES.
+    """
+    # The multipart parser already knows the size of spooled uploads; fail before copying
+    if file.size is not None and file.size > UPLOAD_MAX_BYTES:
+        raise _too_large()
+
+    temp_path = await run_in_threadpool(staging_path)
+    digest = hashlib.sha256()
+    size = 0
+    out = await run_in_threadpool(open, temp_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > UPLOAD_MAX_BYTES:
+                raise _too_large()
+            digest.update(chunk)
+            await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        await run_in_threadpool(out.close)
+        await run_in_threadpool(_remove, temp_path)
+        raise
+    await run_in_threadpool(out.close)
+
+    if size == 0:
+        await run_in_threadpool(_remove, temp_path)
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+    key = f"{folder}/{digest.hexdigest()}{IMAGE_EXTENSIONS.get(file.content_type, '')}"
+    if await storage.exists(key):
+        # Same image already stored; keep the existing copy
+        await run_in_threadpool(_remove, temp_path)
+    else:
+        await storage.put(temp_path, key)
+
+    return f"/uploads/{key}"
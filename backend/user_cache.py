@@ -0,0 +1,65 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from models import User
+
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+
+
+class UserCache:
+    """
+    firebase_uid -> User snapshot cache used by get_current_user_db.
+
+    Only column values are stored, and each hit returns a fresh detached User
+    built from them, so cached identities never leak across sessions. Entries
+    expire after the TTL and are dropped explicitly when a user is updated.
+    """
+
+    def __init__(self, ttl: float = USER_CACHE_TTL_SECONDS, max_size: int = USER_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # firebase_uid -> (expires_at, column values), least recently used first
+        self._entries = OrderedDict()
+
+    def get(self, firebase_uid: str) -> Optional[User]:
+        entry = self._entries.get(firebase_uid)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[firebase_uid]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(firebase_uid)
+        self.hits += 1
+        return User(**entry[1])
+
+    def put(self, user: User) -> None:
+        snapshot = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        self._entries[user.firebase_uid] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(user.firebase_uid)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, firebase_uid: str) -> None:
+        self._entries.pop(firebase_uid, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+user_cache = UserCache()
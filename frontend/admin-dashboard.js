@@ -8,6 +8,14 @@ const app = initializeApp(firebaseConfig);
 const auth = getAuth(app);
 
 let userData = null;
+// Admin user directory: current filters, rows shown so far and the cursor of the next page
+let userFilters = {};
+let loadedUsers = [];
+let usersNextCursor = null;
+// Admin task list: status filter, tasks shown so far and the cursor of the next page
+let taskStatusFilter = null;
+let loadedTasks = [];
+let tasksNextCursor = null;
 
 // Check authentication
 onAuthStateChanged(auth, async (user) => {
@@ -51,15 +59,18 @@ onAuthStateChanged(auth, async (user) => {
 
 async function loadAdminStats() {
     try {
-        const tasks = await api.getAllTasks();
-        const users = await api.getAllUsers();
-        
+        // Counts come precomputed from the server instead of downloading every task and user
+        const adminStats = await api.getAdminStats(7);
+        const today = adminStats.daily[adminStats.daily.length - 1];
+
         const stats = {
-            total_tasks: tasks.length,
-            available: tasks.filter(t => t.status === "available").length,
-            ongoing: tasks.filter(t => t.status === "ongoing").length,
-            completed: tasks.filter(t => t.status === "completed").length,
-            total_users: users.length
+            total_tasks: adminStats.total_tasks,
+            available: adminStats.tasks_by_status.available || 0,
+            ongoing: adminStats.tasks_by_status.ongoing || 0,
+            completed: adminStats.tasks_by_status.completed || 0,
+            total_users: adminStats.total_users,
+            total_reports: adminStats.total_reports,
+            created_today: today ? today.tasks_created : 0
         };
         
         const statsContainer = document.getElementById("admin-stats");
@@ -84,17 +95,30 @@ async function loadAdminStats() {
                 <h3>${stats.completed}</h3>
                 <p>Completed Tasks</p>
             </div>
+            <div class="stat-card">
+                <h3>${stats.created_today}</h3>
+                <p>Tasks Posted Today</p>
+            </div>
+            <div class="stat-card">
+                <h3>${stats.total_reports}</h3>
+                <p>Reports</p>
+            </div>
         `;
     } catch (error) {
         console.error("Error loading admin stats:", error);
     }
 }
 
-async function loadAllTasks(statusFilter = null) {
+async function loadAllTasks(append = false) {
     const container = document.getElementById("tasks-container");
+    const loadMoreBtn = document.getElementById("tasks-load-more");
     
     try {
-        const tasks = await api.getAllTasks(statusFilter);
+        const page = await api.getAllTasks(taskStatusFilter, append ? tasksNextCursor : null);
+        loadedTasks = append ? loadedTasks.concat(page.items) : page.items;
+        tasksNextCursor = page.nextCursor;
+        if (loadMoreBtn) loadMoreBtn.style.display = tasksNextCursor ? "inline-block" : "none";
+        const tasks = loadedTasks;
         
         if (tasks.length === 0) {
             container.innerHTML = "<p class='loading'>No tasks found.</p>";
@@ -103,7 +127,7 @@ async function loadAllTasks(statusFilter = null) {
         
         const rendered = await Promise.all(tasks.map(async (task) => {
             let posterName = 'Unknown';
-            try { const u = await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; } catch(e) {}
+            try { const u = task.poster || await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; } catch(e) {}
             return `
             <div class="task-card">
                 <h3>Title: ${task.title}</h3>
@@ -111,7 +135,7 @@ async function loadAllTasks(statusFilter = null) {
                 <p>Description: ${task.description.substring(0, 100)}${task.description.length > 100 ? '...' : ''}</p>
                 <div class="task-meta">
                     <span style="display: block" class="task-status status-${task.status}">Status: ${task.status.replace('_', ' ')}</span>
-                 
+                    ${task.report_count > 0 ? `<span style="display: block; color:#b91c1c; font-weight:600;">Reported ${task.report_count} time/s</span>` : ''}
                     <span><strong>₱${task.payment.toFixed(2)}</strong></span>
                 </div>
                 <div id="admin-tasks-buttons" style="margin-top: 1rem;">
@@ -129,11 +153,16 @@ async function loadAllTasks(statusFilter = null) {
     }
 }
 
-async function loadAllUsers() {
+async function loadAllUsers(append = false) {
     const container = document.getElementById("users-container");
+    const loadMoreBtn = document.getElementById("users-load-more");
     
     try {
-        const users = await api.getAllUsers();
+        const page = await api.getAllUsers({ ...userFilters, cursor: append ? usersNextCursor : null });
+        loadedUsers = append ? loadedUsers.concat(page.items) : page.items;
+        usersNextCursor = page.nextCursor;
+        if (loadMoreBtn) loadMoreBtn.style.display = usersNextCursor ? "inline-block" : "none";
+        const users = loadedUsers;
         
         if (users.length === 0) {
             container.innerHTML = "<p class='loading'>No users found.</p>";
@@ -172,7 +201,27 @@ async function loadAllUsers() {
 
 window.filterTasks = function() {
     const filter = document.getElementById("task-filter").value;
-    loadAllTasks(filter || null);
+    taskStatusFilter = filter || null;
+    loadAllTasks();
+};
+
+window.loadMoreTasks = function() {
+    if (tasksNextCursor) loadAllTasks(true);
+};
+
+window.searchUsers = function(event) {
+    if (event) event.preventDefault();
+    const q = document.getElementById("user-search-input").value.trim();
+    const adminFilter = document.getElementById("user-admin-filter").value;
+    userFilters = {
+        q: q || null,
+        isAdmin: adminFilter === "" ? null : adminFilter
+    };
+    loadAllUsers();
+};
+
+window.loadMoreUsers = function() {
+    if (usersNextCursor) loadAllUsers(true);
 };
 
 window.deleteTask = async function(taskId) {
@@ -191,21 +240,30 @@ window.deleteTask = async function(taskId) {
 };
 
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -226,13 +284,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
@@ -21,12 +21,18 @@ onAuthStateChanged(auth, async (user) => {
     loadNotifications();
 });
 
-async function performAdminSearch(){
+// Results fetched so far, the cursor of the next server page and the client-side page shown
+let allTasks = [];
+let searchNextCursor = null;
+let currentPage = 1;
+
+async function performAdminSearch(append = false){
     const q = getQueryParam('q') || '';
     const statusFilter = getQueryParam('status_filter') || '';
     const container = document.getElementById('admin-search-results-container');
     const heading = document.getElementById('results-heading');
     const paginationEl = document.getElementById('admin-search-pagination');
+    const loadMoreBtn = document.getElementById('admin-search-load-more');
 
     // populate input and status select
     const inputEl = document.getElementById('search-input');
@@ -37,11 +43,14 @@ async function performAdminSearch(){
     heading.textContent = q ? `Admin Search Results for "${q}"` : 'Admin Search Results';
 
     try{
-        const results = await api.searchTasks(q, statusFilter || null);
+        const page = await api.searchTasks(q, statusFilter || null, append ? searchNextCursor : null);
+        allTasks = append ? allTasks.concat(page.items) : page.items;
+        searchNextCursor = page.nextCursor;
+        if (loadMoreBtn) loadMoreBtn.style.display = searchNextCursor ? 'inline-block' : 'none';
+        const results = allTasks;
         if (!results || results.length === 0){ container.innerHTML = `<p class='loading'>No tasks match your search.</p>`; if (paginationEl) paginationEl.innerHTML = ''; return; }
 
-        let allTasks = results;
-        let currentPage = 1;
+        if (!append) currentPage = 1;
         const perPage = 20;
 
         async function renderPage(page){
@@ -49,7 +58,7 @@ async function performAdminSearch(){
             const pageTasks = allTasks.slice(start, start+perPage);
             const rendered = await Promise.all(pageTasks.map(async (task)=>{
                 let posterName = 'Unknown';
-                try{ const u = await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; }catch(e){}
+                try{ const u = task.poster || await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; }catch(e){}
                 return `
                 <div class="task-card">
                     <h3>Title: ${task.title}</h3>
@@ -94,6 +103,10 @@ async function performAdminSearch(){
     }catch(err){ console.error('Admin search error', err); container.innerHTML = `<div class="error">Error searching tasks: ${err.message}</div>`; }
 }
 
+window.loadMoreResults = function(){
+    if (searchNextCursor) performAdminSearch(true);
+};
+
 // hook up local form on this page
 const searchForm = document.getElementById('search-form');
 if (searchForm){
@@ -111,21 +124,30 @@ if (searchForm){
 }
 
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -146,13 +168,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
@@ -17,6 +17,36 @@ async function getAuthToken() {
 
 // API request helper
 async function apiRequest(endpoint, options = {}) {
+    const response = await sendRequest(endpoint, options);
+
+    if (response.status === 204) {
+        return null;
+    }
+
+    return await response.json();
+}
+
+// Like apiRequest, for paginated endpoints: resolves to { items, nextCursor }
+// (nextCursor is null on the last page)
+async function apiPageRequest(endpoint) {
+    const response = await sendRequest(endpoint);
+    return {
+        items: await response.json(),
+        nextCursor: response.headers.get("X-Next-Cursor")
+    };
+}
+
+// "?a=1&b=2" from the non-empty values of params ("" when there are none)
+function queryString(params) {
+    const search = new URLSearchParams();
+    for (const [key, value] of Object.entries(params)) {
+        if (value !== null && value !== undefined && value !== "") search.set(key, value);
+    }
+    const query = search.toString();
+    return query ? `?${query}` : "";
+}
+
+async function sendRequest(endpoint, options = {}) {
     const token = await getAuthToken();
     console.log("DEBUG: Token obtained (first 20 chars):", token.substring(0, 20) + "...");
     const url = `${API_URL}${endpoint}`;
@@ -45,11 +75,7 @@ async function apiRequest(endpoint, options = {}) {
         throw new Error(error.detail || `HTTP error! status: ${response.status}`);
     }
 
-    if (response.status === 204) {
-        return null;
-    }
-
-    return await response.json();
+    return response;
 }
 
 // API methods
@@ -57,16 +83,17 @@ export const api = {
     // User endpoints
     getCurrentUser: () => apiRequest("/api/users/me"),
     getUser: (userId) => apiRequest(`/api/users/${userId}`),
+    getUsers: (userIds) => apiRequest(`/api/users?ids=${userIds.join(",")}`),
     updateUserProfile: (profileData) => apiRequest("/api/users/me/profile", {
         method: "PUT",
         body: JSON.stringify(profileData)
     }),
 
     // Task endpoints
-    getTasks: (statusFilter = null) => {
-        const params = statusFilter ? `?status_filter=${statusFilter}` : "";
-        return apiRequest(`/api/tasks${params}`);
-    },
+    // Paginated listings resolve to { items, nextCursor }; pass nextCursor back to get the next page
+    getTasks: (statusFilter = null, cursor = null) => apiPageRequest(
+        `/api/tasks${queryString({ status_filter: statusFilter, cursor })}`
+    ),
     getTask: (taskId) => apiRequest(`/api/tasks/${taskId}`),
     createTask: (taskData) => apiRequest("/api/tasks", {
         method: "POST",
@@ -107,13 +134,21 @@ export const api = {
         }
         return await response.json();
     },
+    // Tasks another user posted or is the seeker of; resolves to { items, nextCursor }
+    getUserTasks: (userId, statusFilter = null, cursor = null) => apiPageRequest(
+        `/api/users/${userId}/tasks${queryString({ status_filter: statusFilter, cursor })}`
+    ),
+    getUserTaskStats: (userId) => apiRequest(`/api/users/${userId}/task-stats`),
     getMyTasks: (taskType = null) => {
         const params = taskType ? `?task_type=${taskType}` : "";
         return apiRequest(`/api/users/me/tasks${params}`);
     },
 
     // Message endpoints
-    getTaskMessages: (taskId) => apiRequest(`/api/tasks/${taskId}/messages`),
+    // options: { sinceId, beforeId, limit }; without a cursor, the latest page
+    getTaskMessages: (taskId, { sinceId = null, beforeId = null, limit = null } = {}) => apiRequest(
+        `/api/tasks/${taskId}/messages${queryString({ since_id: sinceId, before_id: beforeId, limit })}`
+    ),
     sendMessage: (taskId, content) => apiRequest("/api/messages", {
         method: "POST",
         body: JSON.stringify({ task_id: taskId, content })
@@ -127,11 +162,22 @@ export const api = {
     getUserFeedback: (userId) => apiRequest(`/api/users/${userId}/feedback`),
 
     // Admin endpoints
-    getAllUsers: () => apiRequest("/api/admin/users"),
-    getAllTasks: (statusFilter = null) => {
-        const params = statusFilter ? `?status_filter=${statusFilter}` : "";
-        return apiRequest(`/api/admin/tasks${params}`);
+    getAdminStats: (days = 30) => apiRequest(`/api/admin/stats?days=${days}`),
+    // filters: { q, isAdmin, createdAfter, createdBefore, cursor, limit }; resolves to { items, nextCursor }
+    getAllUsers: (filters = {}) => {
+        const params = new URLSearchParams();
+        if (filters.q) params.set("q", filters.q);
+        if (filters.isAdmin !== undefined && filters.isAdmin !== null) params.set("is_admin", filters.isAdmin);
+        if (filters.createdAfter) params.set("created_after", filters.createdAfter);
+        if (filters.createdBefore) params.set("created_before", filters.createdBefore);
+        if (filters.cursor) params.set("cursor", filters.cursor);
+        if (filters.limit) params.set("limit", filters.limit);
+        const query = params.toString();
+        return apiPageRequest(`/api/admin/users${query ? `?${query}` : ""}`);
     },
+    getAllTasks: (statusFilter = null, cursor = null) => apiPageRequest(
+        `/api/admin/tasks${queryString({ status_filter: statusFilter, cursor })}`
+    ),
     adminDeleteTask: (taskId) => apiRequest(`/api/admin/tasks/${taskId}`, {
         method: "DELETE"
     }),
@@ -148,7 +194,9 @@ export const api = {
     }),
 
     // Notification endpoints
-    getNotifications: () => apiRequest("/api/notifications"),
+    // Newest first; resolves to { items, nextCursor }
+    getNotifications: (cursor = null) => apiPageRequest(`/api/notifications${queryString({ cursor })}`),
+    getUnreadNotificationCount: () => apiRequest("/api/notifications/unread_count"),
     markNotificationRead: (notificationId) => apiRequest(`/api/notifications/${notificationId}/read`, {
         method: "PUT"
     }),
@@ -157,13 +205,16 @@ export const api = {
     })
 };
 
-// Search tasks by title (server-side substring match) with optional status filter
-api.searchTasks = (query, statusFilter = null) => {
-    const parts = [];
-    if (query) parts.push(`query=${encodeURIComponent(query)}`);
-    if (statusFilter) parts.push(`status_filter=${encodeURIComponent(statusFilter)}`);
-    const params = parts.length ? `?${parts.join("&")}` : "";
-    return apiRequest(`/api/tasks/search${params}`);
+// Search tasks by title and description with optional status filter; resolves to { items, nextCursor }
+api.searchTasks = (query, statusFilter = null, cursor = null) => apiPageRequest(
+    `/api/tasks/search${queryString({ query, status_filter: statusFilter, cursor })}`
+);
+
+// Open the server push stream (task updates, messages, notifications).
+// EventSource cannot send an Authorization header, so the token goes in the query string.
+api.openEventStream = async () => {
+    const token = await getAuthToken();
+    return new EventSource(`${API_URL}/api/events?token=${encodeURIComponent(token)}`);
 };
 
 export { auth };
@@ -29,21 +29,30 @@ onAuthStateChanged(auth, async (user) => {
     loadNotifications();
 });
 
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -64,13 +73,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
@@ -110,36 +124,56 @@ window.handleNotificationDelete = async function (notificationId, event) {
         console.error("Error deleting notification:", error);
     }
 };
-async function loadTasks() {
+// Available tasks fetched so far, the server cursor of the next batch, and the client-side page shown
+let allTasks = [];
+let tasksNextCursor = null;
+let currentPage = 1;
+const perPage = 20; // items per page for client-side pagination
+
+async function loadTasks(append = false) {
     const container = document.getElementById("tasks-container");
     const paginationEl = document.getElementById("browse-pagination");
-    let allTasks = [];
-    let currentPage = 1;
-    const perPage = 20; // items per page for client-side pagination
+    const loadMoreBtn = document.getElementById("tasks-load-more");
     
     try {
-        const tasks = await api.getTasks("available");
+        const page = await api.getTasks("available", append ? tasksNextCursor : null);
+        allTasks = append ? allTasks.concat(page.items) : page.items;
+        tasksNextCursor = page.nextCursor;
+        if (loadMoreBtn) loadMoreBtn.style.display = tasksNextCursor ? "inline-block" : "none";
 
-        if (tasks.length === 0) {
+        if (allTasks.length === 0) {
             container.innerHTML = "<p class='loading'>No available tasks at the moment. Check back later!</p>";
             if (paginationEl) paginationEl.innerHTML = "";
             return;
         }
 
-        allTasks = tasks;
+        if (!append) currentPage = 1;
+        await renderPage(currentPage);
 
-        async function renderPage(page) {
-            const start = (page - 1) * perPage;
-            const pageTasks = allTasks.slice(start, start + perPage);
+        // Only add pagination when many tasks to avoid clutter
+        if (paginationEl) {
+            if (allTasks.length >= 40) renderPagination();
+            else paginationEl.innerHTML = "";
+        }
+    } catch (error) {
+        console.error("Error loading tasks:", error);
+        container.innerHTML = `<div class="error">Error loading tasks: ${error.message}</div>`;
+    }
+}
+
+async function renderPage(page) {
+    const container = document.getElementById("tasks-container");
+    const start = (page - 1) * perPage;
+    const pageTasks = allTasks.slice(start, start + perPage);
 
-            const rendered = await Promise.all(pageTasks.map(async (task) => {
-            let posterName = 'Unknown';
-            try {
-                const u = await api.getUser(task.poster_id);
-                posterName = u.name || u.email || posterName;
-            } catch (e) { /* ignore */ }
+    const rendered = await Promise.all(pageTasks.map(async (task) => {
+        let posterName = 'Unknown';
+        try {
+            const u = task.poster || await api.getUser(task.poster_id);
+            posterName = u.name || u.email || posterName;
+        } catch (e) { /* ignore */ }
 
-            return `
+        return `
             <div class="task-card" onclick="window.location.href='./task-detail.html?id=${task.id}'">
                 <h3>Task: ${task.title}</h3>
                 <div class="task-creator">Created by: ${posterName}</div>
@@ -151,73 +185,62 @@ async function loadTasks() {
                 ${task.location_address ? `<p style="margin-top: 0.5rem; color: var(--text-secondary); font-size: 0.875rem;">📍 ${task.location_address}</p>` : ''}
             </div>
         `;
-        }));
+    }));
 
-            container.innerHTML = rendered.join('');
-        }
+    container.innerHTML = rendered.join('');
+}
 
-        // render first page
-        await renderPage(currentPage);
+function renderPagination() {
+    const paginationEl = document.getElementById("browse-pagination");
+    const totalPages = Math.ceil(allTasks.length / perPage);
+    if (totalPages <= 1) {
+        paginationEl.innerHTML = "";
+        return;
+    }
 
-        // setup pagination controls if many tasks
-        if (paginationEl) {
-            function renderPagination() {
-                const totalPages = Math.ceil(allTasks.length / perPage);
-                if (totalPages <= 1) {
-                    paginationEl.innerHTML = "";
-                    return;
-                }
-
-                let html = '';
-                html += `<button id='prev-page' ${currentPage === 1 ? 'disabled' : ''}>Prev</button>`;
-
-                // show limited page numbers to avoid clutter
-                const startPage = Math.max(1, currentPage - 2);
-                const endPage = Math.min(totalPages, currentPage + 2);
-                for (let p = startPage; p <= endPage; p++) {
-                    html += `<button class='page-btn' data-page='${p}' ${p === currentPage ? 'disabled' : ''}>${p}</button>`;
-                }
-
-                html += `<button id='next-page' ${currentPage === totalPages ? 'disabled' : ''}>Next</button>`;
-                paginationEl.innerHTML = html;
-
-                // attach events
-                const prevBtn = document.getElementById('prev-page');
-                const nextBtn = document.getElementById('next-page');
-                prevBtn && prevBtn.addEventListener('click', async () => {
-                    if (currentPage > 1) currentPage--;
-                    await renderPage(currentPage);
-                    renderPagination();
-                });
-                nextBtn && nextBtn.addEventListener('click', async () => {
-                    const totalPages = Math.ceil(allTasks.length / perPage);
-                    if (currentPage < totalPages) currentPage++;
-                    await renderPage(currentPage);
-                    renderPagination();
-                });
-
-                document.querySelectorAll('.page-btn').forEach(btn => {
-                    btn.addEventListener('click', async (e) => {
-                        const p = Number(e.target.dataset.page);
-                        if (!isNaN(p)) {
-                            currentPage = p;
-                            await renderPage(currentPage);
-                            renderPagination();
-                        }
-                    });
-                });
-            }
+    let html = '';
+    html += `<button id='prev-page' ${currentPage === 1 ? 'disabled' : ''}>Prev</button>`;
 
-            // Only add pagination when many tasks to avoid clutter
-            if (allTasks.length >= 40) renderPagination();
-            else paginationEl.innerHTML = "";
-        }
-    } catch (error) {
-        console.error("Error loading tasks:", error);
-        container.innerHTML = `<div class="error">Error loading tasks: ${error.message}</div>`;
+    // show limited page numbers to avoid clutter
+    const startPage = Math.max(1, currentPage - 2);
+    const endPage = Math.min(totalPages, currentPage + 2);
+    for (let p = startPage; p <= endPage; p++) {
+        html += `<button class='page-btn' data-page='${p}' ${p === currentPage ? 'disabled' : ''}>${p}</button>`;
     }
+
+    html += `<button id='next-page' ${currentPage === totalPages ? 'disabled' : ''}>Next</button>`;
+    paginationEl.innerHTML = html;
+
+    // attach events
+    const prevBtn = document.getElementById('prev-page');
+    const nextBtn = document.getElementById('next-page');
+    prevBtn && prevBtn.addEventListener('click', async () => {
+        if (currentPage > 1) currentPage--;
+        await renderPage(currentPage);
+        renderPagination();
+    });
+    nextBtn && nextBtn.addEventListener('click', async () => {
+        const totalPages = Math.ceil(allTasks.length / perPage);
+        if (currentPage < totalPages) currentPage++;
+        await renderPage(currentPage);
+        renderPagination();
+    });
+    document.querySelectorAll('.page-btn').forEach(btn => {
+        btn.addEventListener('click', async (e) => {
+            const p = Number(e.target.dataset.page);
+            if (!isNaN(p)) {
+                currentPage = p;
+                await renderPage(currentPage);
+                renderPagination();
+            }
+        });
+    });
 }
 
+window.loadMoreTasks = function() {
+    if (tasksNextCursor) loadTasks(true);
+};
+
 // Handle search form submit: navigate to search results page
 const searchForm = document.getElementById('search-form');
 if (searchForm) {
@@ -324,7 +324,7 @@ async function loadMyTasksWithFilter(statusFilter = null) {
             const rendered = await Promise.all(filteredTasks.map(async (task) => {
                 let posterName = 'Unknown';
                 try {
-                    const u = await api.getUser(task.poster_id);
+                    const u = task.poster || await api.getUser(task.poster_id);
                     posterName = u.name || u.email || posterName;
                 } catch (e) { }
 
@@ -332,7 +332,7 @@ async function loadMyTasksWithFilter(statusFilter = null) {
                 let seekerName = null;
                 if (task.seeker_id) {
                     try {
-                        const seeker = await api.getUser(task.seeker_id);
+                        const seeker = task.seeker || await api.getUser(task.seeker_id);
                         seekerName = seeker.name || seeker.email || 'Unknown';
                     } catch (e) { }
                 }
@@ -376,7 +376,11 @@ if (logoutBtn) {
 }
 
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     // Helper: ensure backend naive datetimes are treated as UTC when parsing in the browser
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
@@ -388,14 +392,19 @@ async function loadNotifications() {
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -416,13 +425,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
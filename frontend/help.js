@@ -43,21 +43,30 @@ onAuthStateChanged(auth, async (user) => {
     loadNotifications();
 });
 
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -78,13 +87,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
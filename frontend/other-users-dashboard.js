@@ -41,7 +41,7 @@ onAuthStateChanged(auth, async (user) => {
 
     try {
         await loadTargetUser();
-        await loadUserTasksWithFilter(null);
+        await Promise.all([loadUserTaskStats(), loadUserTasksWithFilter(null)]);
         loadNotifications();
     } catch (e) {
         console.error('Error loading profile:', e);
@@ -84,6 +84,7 @@ function displayUserProfile(user) {
     const emailEl = document.getElementById('profile-email');
     const addressEl = document.getElementById('profile-address');
     const createdAtEl = document.getElementById('profile-created-at');
+    const ratingEl = document.getElementById('profile-rating');
 
     if (nameEl) nameEl.textContent = user.name || user.email || '-';
     if (emailEl) emailEl.textContent = user.email || '-';
@@ -93,60 +94,61 @@ function displayUserProfile(user) {
             new Date(user.created_at).toLocaleDateString() : '-';
         createdAtEl.textContent = formattedDate;
     }
+    if (ratingEl) {
+        // Aggregates come precomputed with the profile; no need to fetch every feedback entry
+        ratingEl.textContent = user.rating_count ?
+            `${user.average_rating.toFixed(1)} / 5 (${user.rating_count} review${user.rating_count === 1 ? '' : 's'})` :
+            'No ratings yet';
+    }
 }
 
-async function loadUserTasksWithFilter(statusFilter = null) {
-    try {
-        let tasks = [];
-        // Prefer admin endpoint to fetch all tasks, fallback otherwise
-        try {
-            tasks = await api.getAllTasks();
-        } catch (e) {
-            // fallback: try to get general tasks listing and filter locally
-            try {
-                tasks = await api.getTasks();
-            } catch (e2) {
-                throw e; // original error
-            }
-        }
+// Tasks of the target user fetched so far, the cursor of the next page and the status filter in use
+let loadedTasks = [];
+let tasksNextCursor = null;
+let userTaskStatusFilter = null;
+
+async function fetchTasks(append) {
+    // The server filters by user and status, so every page holds only matching tasks
+    const page = await api.getUserTasks(targetUserId, userTaskStatusFilter, append ? tasksNextCursor : null);
+    loadedTasks = append ? loadedTasks.concat(page.items) : page.items;
+    tasksNextCursor = page.nextCursor;
+    const loadMoreBtn = document.getElementById('user-tasks-load-more');
+    if (loadMoreBtn) loadMoreBtn.style.display = tasksNextCursor ? 'inline-block' : 'none';
+}
 
-        // Filter tasks that involve the target user (posted or accepted)
-        const filteredByUser = tasks.filter(t => String(t.poster_id) === String(targetUserId) || String(t.seeker_id) === String(targetUserId));
-
-        // Apply status filter if present
-        const visibleTasks = statusFilter ? filteredByUser.filter(t => t.status === statusFilter) : filteredByUser;
-
-        // Update stats
-        const stats = {
-            posted: filteredByUser.filter(t => String(t.poster_id) === String(targetUserId)).length,
-            accepted: filteredByUser.filter(t => String(t.seeker_id) === String(targetUserId)).length,
-            completed: filteredByUser.filter(t => t.status === 'completed' && String(t.seeker_id) === String(targetUserId)).length,
-            active: filteredByUser.filter(t => (t.status === 'ongoing' || t.status === 'pending_confirmation') && (String(t.poster_id) === String(targetUserId) || String(t.seeker_id) === String(targetUserId))).length
-        };
-
-        const statsContainer = document.getElementById('stats');
-        if (statsContainer) {
-            statsContainer.innerHTML = `
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <h3>${stats.posted}</h3>
-                        <p>Tasks Posted</p>
-                    </div>
-                    <div class="stat-card">
-                        <h3>${stats.accepted}</h3>
-                        <p>Tasks Accepted</p>
-                    </div>
-                    <div class="stat-card">
-                        <h3>${stats.completed}</h3>
-                        <p>Tasks Completed</p>
-                    </div>
-                    <div class="stat-card">
-                        <h3>${stats.active}</h3>
-                        <p>Active Tasks</p>
-                    </div>
+// Counts over all of the user's tasks, computed by the server
+async function loadUserTaskStats() {
+    const stats = await api.getUserTaskStats(targetUserId);
+    const statsContainer = document.getElementById('stats');
+    if (statsContainer) {
+        statsContainer.innerHTML = `
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <h3>${stats.posted}</h3>
+                    <p>Tasks Posted</p>
                 </div>
-            `;
-        }
+                <div class="stat-card">
+                    <h3>${stats.accepted}</h3>
+                    <p>Tasks Accepted</p>
+                </div>
+                <div class="stat-card">
+                    <h3>${stats.completed}</h3>
+                    <p>Tasks Completed</p>
+                </div>
+                <div class="stat-card">
+                    <h3>${stats.active}</h3>
+                    <p>Active Tasks</p>
+                </div>
+            </div>
+        `;
+    }
+}
+
+async function loadUserTasksWithFilter(statusFilter = null, append = false) {
+    userTaskStatusFilter = statusFilter;
+    try {
+        await fetchTasks(append);
+        const visibleTasks = loadedTasks;
 
         const tasksContainer = document.getElementById('user-tasks');
         if (!tasksContainer) return;
@@ -158,7 +160,7 @@ async function loadUserTasksWithFilter(statusFilter = null) {
 
         const rendered = await Promise.all(visibleTasks.map(async (task) => {
             let posterName = 'Unknown';
-            try { const u = await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; } catch(e) {}
+            try { const u = task.poster || await api.getUser(task.poster_id); posterName = u.name || u.email || posterName; } catch(e) {}
             return `
                 <div class="task-card" onclick="window.location.href='./task-detail.html?id=${task.id}'">
                     <h3>Task: ${task.title}</h3>
@@ -187,22 +189,35 @@ window.filterUserTasks = function() {
     loadUserTasksWithFilter(filter || null);
 };
 
+window.loadMoreUserTasks = function() {
+    if (tasksNextCursor) loadUserTasksWithFilter(userTaskStatusFilter, true);
+};
+
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -223,13 +238,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
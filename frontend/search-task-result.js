@@ -27,17 +27,27 @@ onAuthStateChanged(auth, async (user) => {
     loadNotifications();
 });
 
-async function performSearch() {
+// Results fetched so far, the cursor of the next server page and the client-side page shown
+let allTasks = [];
+let searchNextCursor = null;
+let currentPage = 1;
+
+async function performSearch(append = false) {
     const q = getQueryParam('q') || '';
     const container = document.getElementById('search-results-container');
     const heading = document.getElementById('results-heading');
     const paginationEl = document.getElementById('search-pagination');
+    const loadMoreBtn = document.getElementById('search-load-more');
 
     document.getElementById('search-input').value = q;
     heading.textContent = q ? `Search Results for "${q}"` : 'Search Results';
 
     try {
-        const results = await api.searchTasks(q);
+        const page = await api.searchTasks(q, null, append ? searchNextCursor : null);
+        allTasks = append ? allTasks.concat(page.items) : page.items;
+        searchNextCursor = page.nextCursor;
+        if (loadMoreBtn) loadMoreBtn.style.display = searchNextCursor ? 'inline-block' : 'none';
+        const results = allTasks;
 
         if (!results || results.length === 0) {
             container.innerHTML = `<p class='loading'>No tasks match your search.</p>`;
@@ -46,8 +56,7 @@ async function performSearch() {
         }
 
         // client-side pagination
-        let allTasks = results;
-        let currentPage = 1;
+        if (!append) currentPage = 1;
         const perPage = 20;
 
         async function renderPage(page) {
@@ -57,7 +66,7 @@ async function performSearch() {
             const rendered = await Promise.all(pageTasks.map(async (task) => {
                 let posterName = 'Unknown';
                 try {
-                    const u = await api.getUser(task.poster_id);
+                    const u = task.poster || await api.getUser(task.poster_id);
                     posterName = u.name || u.email || posterName;
                 } catch (e) {}
 
@@ -134,6 +143,10 @@ async function performSearch() {
     }
 }
 
+window.loadMoreResults = function() {
+    if (searchNextCursor) performSearch(true);
+};
+
 // search form actions on this page
 const searchForm = document.getElementById('search-form');
 if (searchForm) {
@@ -150,21 +163,30 @@ if (searchForm) {
 }
 
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -185,13 +207,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read
@@ -14,6 +14,13 @@ let map = null;
 let seekerFeedbackList = null;
 let userCache = {};
 let taskPollTimer = null;
+let taskEvents = null;
+let lastMessageId = null;
+// Oldest message shown, where "Load older messages" continues from
+let firstMessageId = null;
+let loadingOlderMessages = false;
+// Messages per request; a full page means more may be waiting
+const MESSAGE_PAGE_SIZE = 50;
 
 // Get task ID from URL
 const urlParams = new URLSearchParams(window.location.search);
@@ -57,12 +64,7 @@ async function loadTask() {
     try {
         taskData = await api.getTask(taskId);
         // prime cache with poster and seeker
-        if (taskData.poster_id) {
-            try { userCache[taskData.poster_id] = (await api.getUser(taskData.poster_id)).name || null; } catch(e) { /* ignore */ }
-        }
-        if (taskData.seeker_id) {
-            try { userCache[taskData.seeker_id] = (await api.getUser(taskData.seeker_id)).name || null; } catch(e) { /* ignore */ }
-        }
+        await cacheUserNames([taskData.poster_id, taskData.seeker_id]);
         seekerFeedbackList = null;
         displayTask();
         setupActions();
@@ -78,8 +80,76 @@ async function loadTask() {
     } catch (error) {
         document.getElementById("task-container").innerHTML = `<div class='error'>Error loading task: ${error.message}</div>`;
     }
-    // Ensure polling is started once we have initial task data
-    startTaskPolling();
+    // Subscribe to live updates once we have initial task data
+    startTaskUpdates();
+}
+
+// Re-fetch the task and re-render if its status or seeker changed
+async function refreshTask() {
+    const updated = await api.getTask(taskId);
+    const oldStatus = taskData ? taskData.status : null;
+    const oldSeeker = taskData ? String(taskData.seeker_id) : null;
+    const newSeeker = updated ? String(updated.seeker_id) : null;
+    if (!taskData || updated.status !== oldStatus || newSeeker !== oldSeeker) {
+        taskData = updated;
+        displayTask();
+        setupActions();
+        // refresh feedback and messages visibility if needed
+        displayFeedbackSection();
+        if (taskData.status === "ongoing" || taskData.status === "pending_confirmation") {
+            loadMessages();
+            const chatEl = document.getElementById("chat-container");
+            if (chatEl) chatEl.style.display = "block";
+        } else {
+            const chatEl = document.getElementById("chat-container");
+            if (chatEl) chatEl.style.display = "none";
+        }
+    }
+}
+
+async function startTaskUpdates() {
+    // Fall back to polling where EventSource is not available
+    if (typeof EventSource === "undefined") {
+        startTaskPolling();
+        return;
+    }
+    if (taskEvents) return;
+    try {
+        taskEvents = await api.openEventStream();
+    } catch (e) {
+        console.error("Could not open event stream:", e);
+        startTaskPolling();
+        return;
+    }
+
+    taskEvents.addEventListener("task_updated", (e) => {
+        const event = JSON.parse(e.data);
+        if (String(event.task_id) !== String(taskId)) return;
+        refreshTask().catch((err) => console.error("Task refresh error:", err));
+    });
+    taskEvents.addEventListener("message", (e) => {
+        const event = JSON.parse(e.data);
+        if (String(event.task_id) === String(taskId)) loadMessages();
+    });
+    taskEvents.addEventListener("notification", () => {
+        loadNotifications();
+    });
+    taskEvents.onopen = () => {
+        // Catch up on anything missed while disconnected
+        refreshTask().catch((err) => console.error("Task refresh error:", err));
+    };
+    taskEvents.onerror = () => {
+        // The token in the stream URL may have expired; reconnect with a fresh one
+        stopTaskUpdates();
+        setTimeout(startTaskUpdates, 5000);
+    };
+}
+
+function stopTaskUpdates() {
+    if (taskEvents) {
+        taskEvents.close();
+        taskEvents = null;
+    }
 }
 
 function startTaskPolling() {
@@ -88,26 +158,7 @@ function startTaskPolling() {
     // Poll every 5 seconds
     taskPollTimer = setInterval(async () => {
         try {
-            const updated = await api.getTask(taskId);
-            // If status or seeker changed, update the UI
-            const oldStatus = taskData ? taskData.status : null;
-            const oldSeeker = taskData ? String(taskData.seeker_id) : null;
-            const newSeeker = updated ? String(updated.seeker_id) : null;
-            if (!taskData || updated.status !== oldStatus || newSeeker !== oldSeeker) {
-                taskData = updated;
-                displayTask();
-                setupActions();
-                // refresh feedback and messages visibility if needed
-                displayFeedbackSection();
-                if (taskData.status === "ongoing" || taskData.status === "pending_confirmation") {
-                    loadMessages();
-                    const chatEl = document.getElementById("chat-container");
-                    if (chatEl) chatEl.style.display = "block";
-                } else {
-                    const chatEl = document.getElementById("chat-container");
-                    if (chatEl) chatEl.style.display = "none";
-                }
-            }
+            await refreshTask();
         } catch (e) {
             console.error("Task polling error:", e);
         }
@@ -121,8 +172,9 @@ function stopTaskPolling() {
     }
 }
 
-// Clean up polling when the user leaves the page
+// Clean up the event stream and polling when the user leaves the page
 window.addEventListener('beforeunload', () => {
+    stopTaskUpdates();
     stopTaskPolling();
 });
 
@@ -152,8 +204,11 @@ function displayTask() {
         })()}
         ${taskData.proof_image ? (() => {
             // Ensure proof links use the backend absolute URL so they work when frontend and backend are on different origins
-            const proofUrl = String(taskData.proof_image).startsWith('/') ? `${API_URL}${taskData.proof_image}` : taskData.proof_image;
-            return `<div style="margin-bottom:0.5rem;"><strong>Proof image:</strong> <br/><a href="${proofUrl}" target="_blank" rel="noopener noreferrer"><img src="${proofUrl}" alt="proof" style="max-width:180px; max-height:120px; border-radius:6px; margin-top:6px;"/></a></div>`;
+            const toUrl = (path) => String(path).startsWith('/') ? `${API_URL}${path}` : path;
+            // Link the web-sized copy and show the thumbnail; fall back to the original until they are generated
+            const proofUrl = toUrl(taskData.proof_web_image || taskData.proof_image);
+            const previewUrl = toUrl(taskData.proof_thumbnail || taskData.proof_image);
+            return `<div style="margin-bottom:0.5rem;"><strong>Proof image:</strong> <br/><a href="${proofUrl}" target="_blank" rel="noopener noreferrer"><img src="${previewUrl}" alt="proof" style="max-width:180px; max-height:120px; border-radius:6px; margin-top:6px;"/></a></div>`;
         })() : ''}
         <p><strong>Description:</strong></p>
         <p>${taskData.description}</p>
@@ -413,37 +468,75 @@ async function createFeedback(rating, comment) {
     }
 }
 
+// Look up the names of users not in userCache yet with one bulk request
+async function cacheUserNames(userIds) {
+    const missing = [...new Set(userIds.filter((id) => id && !(id in userCache)))];
+    if (missing.length === 0) return;
+    try {
+        const users = await api.getUsers(missing);
+        missing.forEach((id) => { userCache[id] = null; });
+        users.forEach((u) => { userCache[u.id] = u.name || u.email || null; });
+    } catch (e) { /* ignore */ }
+}
+
+// Render messages with sender name and modern chat alignment
+async function renderMessages(messages) {
+    await cacheUserNames(messages.map((msg) => msg.sender_id));
+    return messages.map((msg) => {
+        const isSent = String(msg.sender_id) === String(userData.id);
+        const time = formatLocalDateTime(msg.created_at, { dateOnly: false });
+        const senderName = userCache[msg.sender_id] || 'User';
+
+        return `
+            <div class="message ${isSent ? 'sent' : 'received'}">
+                ${!isSent ? `<div class="sender-name">${senderName}</div>` : ''}
+                <div>${msg.content}</div>
+                <div class="message-time">${time}</div>
+            </div>
+        `;
+    }).join('');
+}
+
+function showOlderMessagesButton(visible) {
+    const button = document.getElementById("load-older-messages");
+    if (button) button.style.display = visible ? "inline-block" : "none";
+}
+
 async function loadMessages() {
     try {
-        const messages = await api.getTaskMessages(taskId);
-        const messagesContainer = document.getElementById("messages");
-        
-        // Render messages with sender name and modern chat alignment
-        const rendered = await Promise.all(messages.map(async (msg) => {
-            const isSent = String(msg.sender_id) === String(userData.id);
-            const time = formatLocalDateTime(msg.created_at, { dateOnly: false });
-            // get sender name from cache or API
-            let senderName = userCache[msg.sender_id];
-            if (!senderName) {
-                try {
-                    const u = await api.getUser(msg.sender_id);
-                    senderName = u.name || u.email || 'User';
-                    userCache[msg.sender_id] = senderName;
-                } catch (e) {
-                    senderName = 'User';
-                }
+        const sinceId = lastMessageId;
+        let fetched = [];
+        if (!sinceId) {
+            // First load: the latest page
+            fetched = await api.getTaskMessages(taskId, { limit: MESSAGE_PAGE_SIZE });
+        } else {
+            // Afterwards only fetch messages newer than the last one shown, page by page
+            // until a partial page shows nothing more is waiting
+            let cursor = sinceId;
+            while (true) {
+                const page = await api.getTaskMessages(taskId, { sinceId: cursor, limit: MESSAGE_PAGE_SIZE });
+                fetched = fetched.concat(page);
+                if (page.length < MESSAGE_PAGE_SIZE) break;
+                cursor = page[page.length - 1].id;
             }
+        }
+        // Another load may have rendered some of these while this request was in flight
+        const replace = !lastMessageId;
+        const messages = fetched.filter((msg) => !lastMessageId || msg.id > lastMessageId);
+        const messagesContainer = document.getElementById("messages");
+        if (!replace && messages.length === 0) return;
+        if (messages.length) {
+            lastMessageId = messages[messages.length - 1].id;
+        }
 
-            return `
-                <div class="message ${isSent ? 'sent' : 'received'}">
-                    ${!isSent ? `<div class="sender-name">${senderName}</div>` : ''}
-                    <div>${msg.content}</div>
-                    <div class="message-time">${time}</div>
-                </div>
-            `;
-        }));
-
-        messagesContainer.innerHTML = rendered.join('');
+        const rendered = await renderMessages(messages);
+        if (replace) {
+            messagesContainer.innerHTML = rendered;
+            firstMessageId = messages.length ? messages[0].id : null;
+            showOlderMessagesButton(messages.length === MESSAGE_PAGE_SIZE);
+        } else {
+            messagesContainer.insertAdjacentHTML("beforeend", rendered);
+        }
         
         messagesContainer.scrollTop = messagesContainer.scrollHeight;
     } catch (error) {
@@ -451,6 +544,27 @@ async function loadMessages() {
     }
 }
 
+async function loadOlderMessages() {
+    if (!firstMessageId || loadingOlderMessages) return;
+    loadingOlderMessages = true;
+    try {
+        const older = await api.getTaskMessages(taskId, { beforeId: firstMessageId, limit: MESSAGE_PAGE_SIZE });
+        const messagesContainer = document.getElementById("messages");
+        if (older.length) {
+            firstMessageId = older[0].id;
+            // Keep the messages in view where they were while history is added above them
+            const previousHeight = messagesContainer.scrollHeight;
+            messagesContainer.insertAdjacentHTML("afterbegin", await renderMessages(older));
+            messagesContainer.scrollTop += messagesContainer.scrollHeight - previousHeight;
+        }
+        showOlderMessagesButton(older.length === MESSAGE_PAGE_SIZE);
+    } catch (error) {
+        console.error("Error loading older messages:", error);
+    } finally {
+        loadingOlderMessages = false;
+    }
+}
+
 // Send message
 document.getElementById("send-message-btn").addEventListener("click", async () => {
     const input = document.getElementById("message-input");
@@ -504,14 +618,9 @@ async function displayFeedbackSection() {
     if (taskData.feedback) {
         const { rating, comment, created_at } = taskData.feedback;
         // Ensure we have names for poster and seeker
-        let posterName = userCache[taskData.poster_id];
-        if (!posterName && taskData.poster_id) {
-            try { posterName = (await api.getUser(taskData.poster_id)).name || null; userCache[taskData.poster_id] = posterName; } catch(e) { posterName = 'Poster'; }
-        }
-        let seekerName = userCache[taskData.seeker_id];
-        if (!seekerName && taskData.seeker_id) {
-            try { seekerName = (await api.getUser(taskData.seeker_id)).name || null; userCache[taskData.seeker_id] = seekerName; } catch(e) { seekerName = 'Seeker'; }
-        }
+        await cacheUserNames([taskData.poster_id, taskData.seeker_id]);
+        const posterName = userCache[taskData.poster_id];
+        const seekerName = userCache[taskData.seeker_id];
 
         feedbackContent.innerHTML = `
             <div class="task-card" style="margin-bottom: 1rem;">
@@ -621,23 +730,33 @@ window.completeTask = completeTask;
 window.confirmTask = confirmTask;
 window.cancelTask = cancelTask;
 window.showFeedbackForm = showFeedbackForm;
+window.loadOlderMessages = loadOlderMessages;
 
 // Notification Logic
-async function loadNotifications() {
+// Notifications shown in the dropdown so far and the cursor of the next (older) page
+let loadedNotifications = [];
+let notificationsNextCursor = null;
+
+async function loadNotifications(append = false) {
     function formatNotificationDate(dateStr) {
         if (!dateStr) return '';
         if (/[Zz]|[+\-]\d{2}:\d{2}$/.test(dateStr)) return new Date(dateStr).toLocaleString();
         try { return new Date(dateStr + 'Z').toLocaleString(); } catch (e) { return new Date(dateStr).toLocaleString(); }
     }
     try {
-        const notifications = await api.getNotifications();
+        const [page, { unread_count: unreadCount }] = await Promise.all([
+            api.getNotifications(append ? notificationsNextCursor : null),
+            api.getUnreadNotificationCount()
+        ]);
+        loadedNotifications = append ? loadedNotifications.concat(page.items) : page.items;
+        notificationsNextCursor = page.nextCursor;
+        const notifications = loadedNotifications;
         const notificationList = document.getElementById("notification-list");
         const notificationBadge = document.getElementById("notification-badge");
 
         if (!notificationList) return;
 
         // Update badge
-        const unreadCount = notifications.filter(n => !n.seen).length;
         if (notificationBadge) {
             notificationBadge.textContent = unreadCount;
             notificationBadge.style.display = unreadCount > 0 ? "block" : "none";
@@ -658,13 +777,18 @@ async function loadNotifications() {
                     <button class="notification-delete-btn" onclick="handleNotificationDelete(${n.id}, event)">Delete</button>
                 </div>
             </div>
-        `).join('');
+        `).join('') + (notificationsNextCursor ?
+            '<button class="notification-load-more" onclick="event.stopPropagation(); loadMoreNotifications()">Load more</button>' : '');
 
     } catch (error) {
         console.error("Error loading notifications:", error);
     }
 }
 
+window.loadMoreNotifications = function () {
+    if (notificationsNextCursor) loadNotifications(true);
+};
+
 window.handleNotificationView = async function (notificationId, taskId, seen, event) {
     try {
         // Mark as read if not already read